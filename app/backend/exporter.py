@@ -1,24 +1,112 @@
 
 import os
+import sys
 import json
-import pandas as pd
+import site
+import zipfile
 import datetime
-import shutil
 import subprocess
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from chronon_core.io import HASH_BLOCK, write_csv_hashed
+
+
+# Deflate level of export archives: level 1 is several times faster than
+# the default 6 for a few percent larger CSV entries
+ARCHIVE_COMPRESSLEVEL = 1
+
+# pip freeze output per interpreter / environment fingerprint (this process)
+_ENV_SNAPSHOTS = {}
+
+
+def hash_file(path):
+    """(sha256, size) of a file, read in blocks."""
+    h = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            h.update(block)
+            size += len(block)
+    return h.hexdigest(), size
+
+
+def copy_prefix(src_path, dst, size):
+    """Copies the first `size` bytes of src_path into the binary file dst."""
+    with open(src_path, "rb") as src:
+        while size > 0:
+            block = src.read(min(HASH_BLOCK, size))
+            if not block:
+                break
+            dst.write(block)
+            size -= len(block)
+
+
+def environment_fingerprint():
+    """
+    Identifies the interpreter and its installed packages: the executable,
+    the prefix and the modification times of the site-packages directories
+    (installing or removing a package touches them).
+    """
+    dirs = list(site.getsitepackages()) if hasattr(site, "getsitepackages") else []
+    dirs.append(site.getusersitepackages())
+    parts = [sys.executable, sys.prefix, sys.version]
+    for d in dirs:
+        if os.path.isdir(d):
+            parts.append(f"{d}:{os.stat(d).st_mtime_ns}")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class _DirectorySink:
+    """Package written as plain files under `root`."""
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def open(self, name):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return open(path, "wb")
+
+    def close(self):
+        pass
+
+
+class _ArchiveSink:
+    """Package streamed into a single compressed zip file."""
+
+    def __init__(self, path, compresslevel=ARCHIVE_COMPRESSLEVEL):
+        self.zf = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+
+    def open(self, name):
+        # Size unknown up front: always allow zip64 entries
+        return self.zf.open(name, "w", force_zip64=True)
+
+    def close(self):
+        self.zf.close()
+
 
 class ReproducibleExporter:
     """
     Handles the creation of a fully reproducible export package.
+
+    Files are hashed while they are written, the pip freeze snapshot is
+    cached per environment fingerprint, and the ledger is referenced by
+    path, size and hash rather than copied. The package never aliases the
+    live ledger file: when a ledger file is wanted in the package it is a
+    copy of the bytes that were hashed.
     """
     
     def __init__(self, output_base_dir="exports"):
         self.base_dir = output_base_dir
         if not os.path.exists(self.base_dir):
             os.makedirs(self.base_dir)
+        self.env_cache_dir = os.path.join(self.base_dir, ".env_snapshots")
             
-    def export_run(self, data_df, metadata, ledger_path, figures=None):
+    def export_run(self, data_df, metadata, ledger_path, figures=None, figure_formats=("svg", "png"),
+                   embed_ledger=False):
         """
         Creates a timestamped folder with all artifacts.
         
@@ -27,76 +115,144 @@ class ReproducibleExporter:
             metadata (dict): Analysis results, QC verdict, config, RNG seed.
             ledger_path (str): Path to the master ledger file.
             figures (list): List of matplotlib figures to save (optional).
+            figure_formats (tuple): File formats written for each figure.
+            embed_ledger (bool): Also write ledger_snapshot.csv (the hashed bytes).
             
         Returns:
             str: Path to the created export directory.
         """
-        
-        # 1. Create Timestamped Directory
+        export_dir = self._package_path(metadata)
+        self._write_package(_DirectorySink(export_dir), data_df, metadata, ledger_path,
+                            figures, figure_formats, embed_ledger=embed_ledger, parallel=False)
+        logging.info(f"Export successful: {export_dir}")
+        return export_dir
+
+    def export_archive(self, data_df, metadata, ledger_path, figures=None, figure_formats=("png",),
+                       embed_ledger=False, parallel=True):
+        """
+        Same package as export_run, streamed into one .zip file.
+
+        The ledger is referenced (path, size, sha256 in metadata.json)
+        unless embed_ledger is True. With parallel=True the environment
+        snapshot and the ledger hash run alongside the data export.
+
+        Returns:
+            str: Path to the created archive.
+        """
+        path = self._package_path(metadata) + ".zip"
+        self._write_package(_ArchiveSink(path), data_df, metadata, ledger_path,
+                            figures, figure_formats, embed_ledger=embed_ledger, parallel=parallel)
+        logging.info(f"Export successful: {path}")
+        return path
+
+    def _package_path(self, metadata):
+        # Timestamped package name
         ts = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         run_id = metadata.get("run_id", "unknown_run")
-        export_dir = os.path.join(self.base_dir, f"export_{ts}_{run_id}")
-        os.makedirs(export_dir, exist_ok=True)
-        
+        return os.path.join(self.base_dir, f"export_{ts}_{run_id}")
+
+    def _write_package(self, sink, data_df, metadata, ledger_path, figures, figure_formats, embed_ledger, parallel):
+        has_ledger = bool(ledger_path) and os.path.exists(ledger_path)
+        pool = ThreadPoolExecutor(max_workers=2) if parallel else None
         try:
-            # 2. Save Data
-            data_path = os.path.join(export_dir, "data_processed.csv")
-            data_df.to_csv(data_path, index=False)
-            
-            # Compute data hash
-            with open(data_path, "rb") as f:
-                data_hash = hashlib.sha256(f.read()).hexdigest()
-            metadata["export_data_hash"] = data_hash
-            
-            # 3. Save Metadata (Config + QC + Stats)
-            meta_path = os.path.join(export_dir, "metadata.json")
-            with open(meta_path, "w") as f:
-                json.dump(metadata, f, indent=4)
-                
-            # 4. Snapshot Environment (requirements.txt)
-            req_path = os.path.join(export_dir, "requirements.txt")
-            try:
-                # Capture pip freeze
-                subprocess.check_call([pd.sys.executable, "-m", "pip", "freeze"], stdout=open(req_path, "w"))
-            except Exception as e:
-                logging.warning(f"Failed to snapshot pip freeze: {e}")
-                with open(req_path, "w") as f:
-                    f.write(f"Error capturing constraints: {e}")
-
-            # 5. Ledger Copy
-            if ledger_path and os.path.exists(ledger_path):
-                shutil.copy2(ledger_path, os.path.join(export_dir, "ledger_snapshot.csv"))
-                
-                # Also copy related JSON rows if possible? 
-                # For simplicity, we just copy the summary CSV.
-                
-            # 6. Latex Snippet
-            self.generate_latex_snippet(metadata, export_dir)
-
-            # 7. Save Figures
-            if figures:
-                figs_dir = os.path.join(export_dir, "figures")
-                os.makedirs(figs_dir, exist_ok=True)
-                for i, fig in enumerate(figures):
-                    fig.savefig(os.path.join(figs_dir, f"figure_{i}.svg"))
-                    fig.savefig(os.path.join(figs_dir, f"figure_{i}.png"))
-                    
-            logging.info(f"Export successful: {export_dir}")
-            return export_dir
-            
+            # Environment snapshot and ledger hash do not depend on the data
+            if pool is not None:
+                env = pool.submit(self.environment_snapshot)
+                ledger_hash = pool.submit(hash_file, ledger_path) if has_ledger else None
+
+            # 1. Save Data, hashed as it is written
+            with sink.open("data_processed.csv") as raw:
+                metadata["export_data_hash"] = write_csv_hashed(data_df, raw)
+
+            # 2. Snapshot Environment (requirements.txt)
+            requirements = env.result() if pool is not None else self.environment_snapshot()
+            with sink.open("requirements.txt") as f:
+                f.write(requirements.encode("utf-8"))
+
+            # 3. Ledger: referenced with the size / hash it had at export time.
+            # The ledger is append-only: its first `size` bytes are this snapshot.
+            if has_ledger:
+                digest, size = ledger_hash.result() if pool is not None else hash_file(ledger_path)
+                mode = "reference"
+                if embed_ledger:
+                    with sink.open("ledger_snapshot.csv") as f:
+                        copy_prefix(ledger_path, f, size)
+                    mode = "embedded"
+                metadata["ledger_snapshot"] = {"path": os.path.abspath(ledger_path), "size": size,
+                                               "sha256": digest, "mode": mode}
+
+            # 4. Save Metadata (Config + QC + Stats)
+            with sink.open("metadata.json") as f:
+                f.write(json.dumps(metadata, indent=4).encode("utf-8"))
+
+            # 5. Latex Snippet
+            latex = self.latex_snippet(metadata)
+            if latex:
+                with sink.open("result_snippet.tex") as f:
+                    f.write(latex.encode("utf-8"))
+
+            # 6. Save Figures (each format rendered once, straight into the package)
+            for i, fig in enumerate(figures or []):
+                for fmt in figure_formats:
+                    with sink.open(f"figures/figure_{i}.{fmt}") as f:
+                        fig.savefig(f, format=fmt)
+
         except Exception as e:
             logging.error(f"Export failed: {e}")
             raise
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+            sink.close()
+
+    def environment_snapshot(self):
+        """
+        pip freeze of the running interpreter, cached per
+        environment_fingerprint() in memory and under <base_dir>/.env_snapshots.
+        """
+        fp = environment_fingerprint()
+        if fp in _ENV_SNAPSHOTS:
+            return _ENV_SNAPSHOTS[fp]
+        cache_path = os.path.join(self.env_cache_dir, f"{fp}.txt")
+        if os.path.exists(cache_path):
+            with open(cache_path, "r", encoding="utf-8") as f:
+                _ENV_SNAPSHOTS[fp] = f.read()
+            return _ENV_SNAPSHOTS[fp]
+
+        try:
+            # Capture pip freeze
+            text = subprocess.run([sys.executable, "-m", "pip", "freeze"], check=True,
+                                  capture_output=True, text=True).stdout
+        except Exception as e:
+            logging.warning(f"Failed to snapshot pip freeze: {e}")
+            return f"Error capturing constraints: {e}" # not cached: retried next export
+
+        os.makedirs(self.env_cache_dir, exist_ok=True)
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, cache_path)
+        _ENV_SNAPSHOTS[fp] = text
+        return text
 
     def generate_latex_snippet(self, metadata, export_dir):
         """
-        Generates a LaTeX snippet with the key results.
+        Writes latex_snippet() to <export_dir>/result_snippet.tex.
+        """
+        latex = self.latex_snippet(metadata)
+        if latex:
+            with open(os.path.join(export_dir, "result_snippet.tex"), "w") as f:
+                f.write(latex)
+
+    def latex_snippet(self, metadata):
+        r"""
+        LaTeX snippet with the key results (None if there is no regression).
         Equation: \epsilon\Phi = (slope \pm error) \times 10^X \quad (p < pval)
         """
         try:
             reg = metadata.get('regression', {})
             if not reg or 'slope' not in reg:
-                return
+                return None
                 
             slope = reg['slope']
             error = reg['stderr']
@@ -125,10 +281,9 @@ class ReproducibleExporter:
                 rf"  \epsilon\Phi = ({mantissa_s:.2f} \pm {mantissa_e:.2f}) \times 10^{{{exponent}}} \quad ({p_str})" + "\n"
                 r"\end{equation}" + "\n"
             )
-            
-            with open(os.path.join(export_dir, "result_snippet.tex"), "w") as f:
-                f.write(latex_content)
+            return latex_content
                 
         except Exception as e:
             logging.warning(f"Could not generate LaTeX: {e}")
+            return None
 
@@ -0,0 +1,65 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+import threading
+from collections import OrderedDict
+
+def record_hash(prev, record):
+    """
+    One step of the data log rolling hash. O(1) per appended record.
+    """
+    return hash((prev, repr(record)))
+
+def records_fingerprint(records):
+    """
+    (length, rolling hash) of a whole list of records.
+    """
+    h = 0
+    for rec in records:
+        h = record_hash(h, rec)
+    return (len(records), h)
+
+class AnalysisCache:
+    """
+    LRU memo of analysis results shared by the GUI screens.
+
+    Keys are (analysis name, data fingerprint, parameters): a fit, a
+    diagnostics run or a QC verdict is computed once per data state and
+    reused by every screen until the data log changes. Thread-safe, so
+    background computations can read and fill it. Cached values are shared:
+    callers must not mutate them.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Computed outside the lock: a slow fit must not block other lookups
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,236 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+import datetime
+import numpy as np
+import pandas as pd
+
+# Acquisition fields and their storage dtype. Any other field keeps the
+# dtype NumPy infers for it (strings are stored as objects).
+FIELDS = {
+    "id": np.int64,
+    "timestamp": "datetime64[us]",
+    "phi": np.float64,
+    "temperature": np.float64,
+    "status": np.int8,        # code into ColumnLog.status_labels, -1 = missing
+    "Delta_h_m": np.float64,
+    "Delta_lnPhi": np.float64,
+    "sigma_Y": np.float64,
+    "sigma_dh_m": np.float64,
+}
+STATUS_LABELS = ("valid", "invalid")
+
+def now_stamp():
+    """Current local time, as stored in the timestamp column."""
+    return np.datetime64(datetime.datetime.now(), "us")
+
+def _missing(dtype):
+    kind = np.dtype(dtype).kind
+    if kind == "M":
+        return np.datetime64("NaT")
+    if kind == "f":
+        return np.nan
+    if kind == "b":
+        return False
+    if kind in "iu":
+        return -1
+    return None
+
+def _parse_timestamps(values):
+    """ISO strings / datetimes -> datetime64[us] (unparsable -> NaT)."""
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[us]")
+    out = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[us]")
+    for i, v in enumerate(values.tolist()):
+        try:
+            if v not in (None, ""):
+                out[i] = np.datetime64(v, "us")
+        except (ValueError, TypeError):
+            pass
+    return out
+
+def block_hash(prev, columns):
+    """
+    One step of the rolling hash for a whole block of columns.
+    """
+    parts = []
+    for k, v in columns.items():
+        v = np.asarray(v)
+        # Object arrays hold pointers: hash their values instead
+        data = tuple(v.tolist()) if v.dtype.kind in "OUS" else np.ascontiguousarray(v).tobytes()
+        parts.append((k, data))
+    return hash((prev, tuple(parts)))
+
+class ColumnLog:
+    """
+    Growable columnar buffer of acquisition samples: one NumPy array per
+    field (capacity doubled when full), status stored as int8 codes.
+
+    Rows are only ever written past the current length, so the views
+    returned by column() / frame() stay valid snapshots while an
+    acquisition keeps appending.
+    """
+
+    def __init__(self, capacity=1024):
+        self._n = 0
+        self._capacity = capacity
+        self._arrays = {}
+        self.status_labels = list(STATUS_LABELS)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Log holding {field: array} (e.g. HistoryStore.load_columns)."""
+        n = len(next(iter(columns.values()))) if columns else 0
+        log = cls(capacity=max(1024, n))
+        if columns:
+            log.append_block(columns)
+        return log
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def fields(self):
+        return list(self._arrays)
+
+    # --- Storage ---
+
+    def _set_array(self, name, dtype):
+        arr = np.empty(self._capacity, dtype=dtype)
+        old = self._arrays.get(name)
+        if old is None:
+            arr[:self._n] = _missing(dtype)
+        else:
+            arr[:self._n] = old[:self._n] # old views keep the old array alive
+        self._arrays[name] = arr
+
+    def _reserve(self, n):
+        if n <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < n:
+            capacity *= 2
+        for k, arr in self._arrays.items():
+            grown = np.empty(capacity, dtype=arr.dtype)
+            grown[:self._n] = arr[:self._n]
+            self._arrays[k] = grown
+        self._capacity = capacity
+
+    def _status_code(self, label):
+        if label in ("", "None"):
+            return -1
+        if label not in self.status_labels:
+            self.status_labels.append(label)
+        return self.status_labels.index(label)
+
+    def _encode(self, name, values):
+        """
+        One block of values in the storage type of `name`; creates the
+        field, or widens it (int -> float -> object) when the values need it.
+        """
+        values = np.asarray(values)
+        if name == "status":
+            if values.dtype.kind in "iu":
+                values = values.astype(np.int8) # already codes
+            else:
+                labels, inverse = np.unique(values.astype(str), return_inverse=True)
+                lookup = np.array([self._status_code(s) for s in labels.tolist()], dtype=np.int8)
+                values = lookup[inverse.reshape(-1)] if len(labels) else np.empty(0, dtype=np.int8)
+        elif name == "timestamp":
+            values = _parse_timestamps(values)
+        elif values.dtype.kind in "US":
+            values = values.astype(object)
+
+        if name not in self._arrays:
+            self._set_array(name, FIELDS.get(name, values.dtype))
+        current = self._arrays[name].dtype
+        if not np.can_cast(values.dtype, current, casting="same_kind"):
+            numeric = values.dtype.kind in "biuf" and current.kind in "biuf"
+            self._set_array(name, np.float64 if numeric else object)
+        return values
+
+    def append_block(self, columns):
+        """
+        Appends equal-length arrays {field: values}. Fields absent from the
+        block get their missing value (NaN, NaT, -1, None).
+        """
+        count = len(next(iter(columns.values()))) if columns else 0
+        encoded = {k: self._encode(k, v) for k, v in columns.items()}
+        self._reserve(self._n + count)
+        for k, arr in self._arrays.items():
+            arr[self._n:self._n + count] = encoded[k] if k in encoded else _missing(arr.dtype)
+        self._n += count
+
+    def append_row(self, record):
+        """
+        Appends one sample given as a dict (interactive acquisition).
+        """
+        self.append_block({k: [v] for k, v in record.items() if v is not None})
+
+    # --- Views ---
+
+    def column(self, name):
+        """View on the filled part of one field (status as codes)."""
+        return self._arrays[name][:self._n]
+
+    def frame(self, start=0):
+        """
+        DataFrame over rows [start, len). Columns share memory with the log
+        (no copy); status is a Categorical over status_labels.
+        Treat it as read-only.
+        """
+        data = {}
+        for k, arr in self._arrays.items():
+            view = arr[start:self._n]
+            if k == "status":
+                view = pd.Categorical.from_codes(view, categories=list(self.status_labels))
+            data[k] = view
+        return pd.DataFrame(data, copy=False)
+
+    def _status_strings(self, start, stop):
+        labels = np.array(self.status_labels + [None], dtype=object)
+        return labels[self._arrays["status"][start:stop]] # -1 picks the trailing None
+
+    def _timestamp_strings(self, start, stop):
+        stamps = self._arrays["timestamp"][start:stop]
+        iso = np.datetime_as_string(stamps).astype(object)
+        iso[np.isnat(stamps)] = None
+        return iso
+
+    def to_records(self, start=0, stop=None):
+        """
+        Rows [start, stop) in the legacy data_log format (list of dicts).
+        """
+        stop = self._n if stop is None else min(stop, self._n)
+        if start >= stop:
+            return []
+        cols = {}
+        for k, arr in self._arrays.items():
+            if k == "status":
+                cols[k] = self._status_strings(start, stop).tolist()
+            elif k == "timestamp":
+                cols[k] = self._timestamp_strings(start, stop).tolist()
+            else:
+                cols[k] = arr[start:stop].tolist()
+        keys = list(cols)
+        return [dict(zip(keys, row)) for row in zip(*(cols[k] for k in keys))]
+
+    def history_columns(self):
+        """
+        {field: ndarray} for HistoryStore.append_run, in the same layout as
+        records_to_columns (ISO timestamps, status labels, strings).
+        """
+        columns = {}
+        for k, arr in self._arrays.items():
+            values = arr[:self._n]
+            if k == "status":
+                values = np.array(self.status_labels + [""])[values]
+            elif k == "timestamp":
+                values = np.where(np.isnat(values), "", np.datetime_as_string(values))
+            elif values.dtype == object:
+                values = np.array(["" if v is None else str(v) for v in values.tolist()], dtype=str)
+            columns[k] = values
+        return columns
@@ -0,0 +1,101 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+import threading
+from collections import deque
+
+class EventBus:
+    """
+    Delivers ExperimentManager events to the GUI listeners.
+
+    Until attach() is called, publish() calls the listeners synchronously
+    (scripts, tests). Once attached to a Tk widget, publish() only queues
+    the event; a Tk after() loop flushes the queue at most `max_hz` times per
+    second, so listeners always run on the Tk thread and the simulation
+    never waits for the UI.
+
+    Per flush:
+      - COALESCED events (progress) keep only their latest payload,
+      - 'log' lines beyond LOG_BACKLOG are dropped (a summary line says how many),
+      - every other event (start, stop, complete...) is delivered, in order.
+    """
+
+    COALESCED = ("progress",)
+    LOG_BACKLOG = 200
+
+    def __init__(self, max_hz=30):
+        self.max_hz = max_hz
+        self.listeners = []
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._latest = {}       # coalesced event -> (seq, data)
+        self._logs = deque()    # (seq, "log", data)
+        self._dropped_logs = 0
+        self._ordered = []      # (seq, event, data)
+        self._widget = None
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def attach(self, widget, max_hz=None):
+        """
+        Switches to queued delivery on the Tk thread of `widget`.
+        """
+        if max_hz is not None:
+            self.max_hz = max_hz
+        self._widget = widget
+        widget.after(self._interval_ms(), self._pump)
+
+    def _interval_ms(self):
+        return max(1, int(1000 / self.max_hz))
+
+    def publish(self, event_type, data=None):
+        if self._widget is None:
+            self._deliver([(event_type, data)])
+            return
+        with self._lock:
+            self._seq += 1
+            if event_type in self.COALESCED:
+                # Superseded payloads are simply overwritten
+                self._latest[event_type] = (self._seq, data)
+            elif event_type == "log":
+                self._logs.append((self._seq, event_type, data))
+                if len(self._logs) > self.LOG_BACKLOG:
+                    self._logs.popleft()
+                    self._dropped_logs += 1
+            else:
+                self._ordered.append((self._seq, event_type, data))
+
+    def flush(self):
+        """
+        Delivers everything queued so far (Tk thread).
+        """
+        with self._lock:
+            batch = self._ordered + list(self._logs)
+            batch += [(seq, event, data) for event, (seq, data) in self._latest.items()]
+            dropped = self._dropped_logs
+            self._ordered, self._logs, self._latest, self._dropped_logs = [], deque(), {}, 0
+        if not batch:
+            return
+        batch.sort(key=lambda item: item[0])
+        events = [(event, data) for _, event, data in batch]
+        if dropped:
+            events.insert(0, ("log", f"... {dropped} message(s) omis"))
+        self._deliver(events)
+
+    def _pump(self):
+        try:
+            self.flush()
+        finally:
+            self._widget.after(self._interval_ms(), self._pump)
+
+    def _deliver(self, events):
+        for event_type, data in events:
+            for listener in list(self.listeners):
+                try:
+                    listener(event_type, data)
+                except Exception as e:
+                    # One broken screen must not stop the others
+                    print(f"Listener error on '{event_type}': {e}")
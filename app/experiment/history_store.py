@@ -0,0 +1,323 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+import os
+import json
+import time
+import uuid
+import hashlib
+import threading
+import numpy as np
+
+class HistoryStore:
+    """
+    Segmented experiment history.
+
+    Layout:
+        <root>/index.jsonl        append-only run index (one JSON line per add / delete)
+        <root>/runs/<run_id>-<hash>.npz  per-run point data, one array per column
+
+    The index only holds (id, timestamp, params, n_points), so startup never
+    touches point data. Runs are loaded lazily by id. Deletes append a
+    tombstone; a background compaction rewrites the index and removes the
+    point files once tombstones pile up.
+    """
+
+    COMPACT_MIN_TOMBSTONES = 16
+
+    def __init__(self, root="history_store"):
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+        self.runs_dir = os.path.join(root, "runs")
+        os.makedirs(self.runs_dir, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._index = {} # run_id -> index entry (insertion ordered)
+        self._tombstones = 0
+        self._dead_files = set()
+        self._writing = set() # ids whose point file is being written
+        self._compactor = None
+        self._load_index()
+
+    # --- Index ---
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line after a crash: everything before it is intact
+                    continue
+                if rec.get("op") == "del":
+                    dead = self._index.pop(rec["id"], None)
+                    if dead is not None:
+                        self._tombstones += 1
+                        self._dead_files.add(dead["file"])
+                else:
+                    rec.pop("op", None)
+                    self._index[rec["id"]] = rec
+
+    def _append_line(self, rec):
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(rec, sort_keys=True) + "\n")
+
+    def list_runs(self):
+        """
+        Index entries (no point data), in insertion order.
+        """
+        with self._lock:
+            return list(self._index.values())
+
+    def get_entry(self, run_id):
+        with self._lock:
+            return self._index.get(run_id)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, run_id):
+        return run_id in self._index
+
+    # --- Runs ---
+
+    def _run_path(self, run_id):
+        # The sanitized id is only for readability ("a/b" and "a_b" both
+        # give "a_b"): the hash of the raw id keeps file names distinct
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in str(run_id))
+        digest = hashlib.sha256(str(run_id).encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.runs_dir, f"{safe}-{digest}.npz")
+
+    @staticmethod
+    def new_run_id(prefix="RUN"):
+        """
+        Unique run id: millisecond timestamp (keeps ids sortable) plus a
+        random suffix, so runs finishing in the same instant never collide.
+        """
+        return f"{prefix}-{int(time.time() * 1000)}-{uuid.uuid4().hex[:6]}"
+
+    def append_run(self, run_id, timestamp, params, columns):
+        """
+        Stores one run. `columns` maps field name -> 1-D array (all equal length).
+        Cost is proportional to the run size only.
+        Raises ValueError if run_id is already stored (never overwrites a run).
+        """
+        columns = {k: np.asarray(v) for k, v in columns.items()}
+        n_points = len(next(iter(columns.values()))) if columns else 0
+        path = self._run_path(run_id)
+
+        with self._lock:
+            if run_id in self._index or run_id in self._writing:
+                raise ValueError(f"Run {run_id} already exists in the history")
+            self._writing.add(run_id)
+        try:
+            tmp = path + ".tmp.npz"
+            np.savez(tmp, **columns)
+            os.replace(tmp, path)
+        except Exception:
+            with self._lock:
+                self._writing.discard(run_id)
+            raise
+
+        entry = {
+            "id": run_id,
+            "timestamp": timestamp,
+            "params": params,
+            "n_points": n_points,
+            "file": os.path.basename(path),
+        }
+        with self._lock:
+            self._append_line(dict(entry, op="add"))
+            self._index[run_id] = entry
+            self._writing.discard(run_id)
+        return entry
+
+    def load_columns(self, run_id):
+        """
+        Point data of one run as {field: ndarray}.
+        """
+        entry = self.get_entry(run_id)
+        if entry is None:
+            raise KeyError(run_id)
+        with np.load(os.path.join(self.runs_dir, entry["file"]), allow_pickle=False) as npz:
+            return {k: npz[k] for k in npz.files}
+
+    def load_records(self, run_id):
+        """
+        Point data of one run as a list of dicts (legacy data_log format).
+        """
+        columns = self.load_columns(run_id)
+        if not columns:
+            return []
+        keys = list(columns)
+        lists = [columns[k].tolist() for k in keys]
+        return [dict(zip(keys, row)) for row in zip(*lists)]
+
+    def delete_runs(self, run_ids):
+        """
+        Tombstones the given runs. Returns the number actually removed.
+        """
+        removed = 0
+        with self._lock:
+            for run_id in run_ids:
+                dead = self._index.pop(run_id, None)
+                if dead is not None:
+                    self._append_line({"op": "del", "id": run_id})
+                    self._tombstones += 1
+                    self._dead_files.add(dead["file"])
+                    removed += 1
+            if self._tombstones >= max(self.COMPACT_MIN_TOMBSTONES, len(self._index)):
+                self.compact_async()
+        return removed
+
+    # --- Compaction ---
+
+    def compact(self):
+        """
+        Rewrites the index with live entries only and removes the point files
+        of deleted runs.
+        """
+        with self._lock:
+            live = list(self._index.values())
+            tmp = self.index_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                for entry in live:
+                    f.write(json.dumps(dict(entry, op="add"), sort_keys=True) + "\n")
+            os.replace(tmp, self.index_path)
+            self._tombstones = 0
+            # A run re-added under the same id reuses its file name: keep it,
+            # including while it is being written. Removing under the lock
+            # means no append_run can claim a name between check and remove.
+            in_use = {entry["file"] for entry in live}
+            in_use.update(os.path.basename(self._run_path(run_id)) for run_id in self._writing)
+            dead_files = self._dead_files - in_use
+            self._dead_files = set()
+
+            for name in dead_files:
+                try:
+                    os.remove(os.path.join(self.runs_dir, name))
+                except OSError:
+                    pass
+
+    def compact_async(self):
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, daemon=True)
+        self._compactor.start()
+
+    # --- Migration ---
+
+    def import_legacy_json(self, path):
+        """
+        One-shot import of a monolithic history.json (list of runs with 'data').
+        Runs already present in the index are skipped. Runs sharing an id
+        inside the file (legacy ids had one-second resolution) get a suffix.
+        """
+        with open(path, "r") as f:
+            legacy = json.load(f)
+        present = set(self._index)
+        imported = 0
+        for run in legacy:
+            run_id = run.get("id")
+            if run_id is None or run_id in present:
+                continue
+            base, k = run_id, 1
+            while run_id in self:
+                k += 1
+                run_id = f"{base}-{k}"
+            self.append_run(run_id, run.get("timestamp", ""), run.get("params", {}),
+                            records_to_columns(run.get("data", [])))
+            imported += 1
+        # Mark the store as initialised even if the legacy file held no runs
+        open(self.index_path, "a").close()
+        return imported
+
+class RunCatalog:
+    """
+    Sorted / filtered views over the HistoryStore index for paged display.
+
+    A query returns run ids only; the caller formats the visible page with
+    rows(). Lookups by id go straight to the store index (dict, O(1)).
+    Queries never touch point data and are safe to run off the UI thread.
+    """
+
+    COLUMNS = ("timestamp", "run_id", "delta_h", "n_points", "scenario")
+
+    def __init__(self, store):
+        self.store = store
+
+    def get(self, run_id):
+        return self.store.get_entry(run_id)
+
+    @staticmethod
+    def summary_row(entry):
+        """
+        Display values of one index entry, in COLUMNS order.
+        """
+        params = entry.get("params") or {}
+        ts = str(entry.get("timestamp", "")).replace("T", " ")[:19]
+        return (ts, entry.get("id", "Unknown"), params.get("delta_h", "N/A"),
+                entry.get("n_points", 0), params.get("scenario", "N/A"))
+
+    @staticmethod
+    def _sort_key(column):
+        idx = RunCatalog.COLUMNS.index(column)
+        if column in ("delta_h", "n_points"):
+            # Numbers first, then anything non-numeric ('N/A')
+            def key(row):
+                v = row[idx]
+                if isinstance(v, (int, float)) and not isinstance(v, bool):
+                    return (0, v, "")
+                return (1, 0, str(v))
+            return key
+        return lambda row: str(row[idx])
+
+    def query(self, sort_by="timestamp", descending=True, text=""):
+        """
+        Run ids matching `text` (case-insensitive substring of any column),
+        sorted by `sort_by`.
+        """
+        rows = [self.summary_row(e) for e in self.store.list_runs()]
+        text = text.strip().lower()
+        if text:
+            rows = [r for r in rows if any(text in str(v).lower() for v in r)]
+        rows.sort(key=self._sort_key(sort_by), reverse=descending)
+        return [r[1] for r in rows]
+
+    def rows(self, run_ids):
+        """
+        Display rows for a page of ids. Ids deleted since the query are skipped.
+        """
+        out = []
+        for run_id in run_ids:
+            entry = self.get(run_id)
+            if entry is not None:
+                out.append(self.summary_row(entry))
+        return out
+
+def records_to_columns(records):
+    """
+    list of dicts -> {field: ndarray}. Missing fields become NaN / empty string.
+    """
+    keys = []
+    for rec in records:
+        for k in rec:
+            if k not in keys:
+                keys.append(k)
+    columns = {}
+    for k in keys:
+        values = [rec.get(k) for rec in records]
+        if all(isinstance(v, (bool, np.bool_)) for v in values):
+            columns[k] = np.array(values, dtype=bool)
+        elif all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in values if v is not None):
+            columns[k] = np.array([np.nan if v is None else v for v in values])
+        else:
+            columns[k] = np.array(["" if v is None else str(v) for v in values])
+    return columns
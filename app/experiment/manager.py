@@ -7,42 +7,117 @@ import threading
 import time
 import random
 import datetime
-import json
 import os
+import numpy as np
+
+from app.experiment.history_store import HistoryStore, records_to_columns
+from app.experiment.analysis_cache import AnalysisCache, record_hash, records_fingerprint
+from app.experiment.event_bus import EventBus
+from app.experiment.column_log import ColumnLog, block_hash
+from app.experiment import batch_sim
 
 class ExperimentManager:
-    def __init__(self):
+    def __init__(self, history_dir="history_store"):
         self.is_running = False
         self.params = {}
-        self.data_log = []
-        self.history_file = "history.json"
-        self.history = self._load_history()
+        self._log_lock = threading.Lock()
+        self.column_log = ColumnLog() # Columnar data log (one array per field)
+        self._log_fingerprint = (0, 0)
+        self.analysis_cache = AnalysisCache() # Shared by the GUI screens, keyed by data_fingerprint()
+        self.history_file = "history.json" # Legacy monolithic history (imported once)
+        self.history_store = self._load_history(history_dir)
         self.current_run_index = 0
-        self.listeners = [] # Observers for updates
+        self.events = EventBus() # Observers for updates (attach() it to the Tk root for throttled delivery)
 
-    def _load_history(self):
-        if os.path.exists(self.history_file):
+    def _load_history(self, history_dir):
+        # Only the run index is read here; point data loads when a run is opened
+        store = HistoryStore(history_dir)
+        if not os.path.exists(store.index_path) and os.path.exists(self.history_file):
             try:
-                with open(self.history_file, "r") as f:
-                    return json.load(f)
+                n = store.import_legacy_json(self.history_file)
+                print(f"Imported {n} runs from {self.history_file}")
             except Exception as e:
-                print(f"Error loading history: {e}")
-                return []
-        return []
+                print(f"Error importing legacy history: {e}")
+        return store
 
-    def _save_history(self):
-        try:
-            with open(self.history_file, "w") as f:
-                json.dump(self.history, f, indent=4)
-        except Exception as e:
-            print(f"Error saving history: {e}")
+    @property
+    def data_log(self):
+        """Legacy list-of-dicts copy of the log (built on each access)."""
+        with self._log_lock:
+            return self.column_log.to_records()
+
+    @data_log.setter
+    def data_log(self, records):
+        # Whole-log replacement from dicts (scripts, older callers)
+        records = list(records)
+        log = ColumnLog.from_columns(records_to_columns(records))
+        with self._log_lock:
+            self.column_log = log
+            self._log_fingerprint = records_fingerprint(records)
+
+    def load_columns(self, columns):
+        """Replaces the log with {field: array} (a run loaded from history)."""
+        log = ColumnLog.from_columns(columns)
+        with self._log_lock:
+            self.column_log = log
+            self._log_fingerprint = (len(log), block_hash(0, columns))
+
+    def _append_record(self, record):
+        with self._log_lock:
+            self.column_log.append_row(record)
+            n, h = self._log_fingerprint
+            self._log_fingerprint = (n + 1, record_hash(h, record))
+
+    def _append_block(self, columns):
+        with self._log_lock:
+            self.column_log.append_block(columns)
+            n, h = self._log_fingerprint
+            self._log_fingerprint = (n + len(columns["id"]), block_hash(h, columns))
+
+    def data_fingerprint(self):
+        """(length, rolling hash) of the data log; changes whenever the data does."""
+        with self._log_lock:
+            return self._log_fingerprint
+
+    def snapshot(self):
+        """
+        Consistent (DataFrame, fingerprint) pair, safe while acquiring. The
+        frame is a read-only view on the column log, not a copy.
+        """
+        with self._log_lock:
+            return self.column_log.frame(), self._log_fingerprint
+
+    def cached(self, name, fingerprint, params, compute):
+        """Memoized analysis result for one data state (see AnalysisCache)."""
+        return self.analysis_cache.get_or_compute((name, fingerprint, params), compute)
+
+    @property
+    def history(self):
+        """Run index entries (id, timestamp, params, n_points), without point data."""
+        return self.history_store.list_runs()
+
+    def load_history_run(self, run_id):
+        """Point data of a stored run, as a list of dicts."""
+        return self.history_store.load_records(run_id)
+
+    def restore_history_run(self, run_id):
+        """
+        Makes a stored run the current data log, straight from its columns.
+        Returns the number of points.
+        """
+        self.load_columns(self.history_store.load_columns(run_id))
+        return len(self.column_log)
+
+    @property
+    def listeners(self):
+        return self.events.listeners
 
     def add_listener(self, listener):
-        self.listeners.append(listener)
+        self.events.subscribe(listener)
 
     def notify_listeners(self, event_type, data=None):
-        for listener in self.listeners:
-            listener(event_type, data)
+        # Never blocks on the UI: progress is coalesced, delivery happens on the Tk thread
+        self.events.publish(event_type, data)
 
     def start_experiment(self, n_runs, delta_h, duration, link_type, 
                          scenario="Standard", blinded=False, batch_mode=False,
@@ -67,7 +142,9 @@ class ExperimentManager:
         
         self.is_running = True
         self.current_run_index = 0
-        self.data_log = []
+        with self._log_lock:
+            self.column_log = ColumnLog()
+            self._log_fingerprint = (0, 0)
         
         print(f"Starting experiment with {self.params}")
         self.notify_listeners("start", self.params)
@@ -90,6 +167,9 @@ class ExperimentManager:
         beta = self.params.get("beta", 0.5)
         gamma = self.params.get("gamma", 0.0) # Recursion
         batch = self.params.get("batch_mode", False)
+        if batch:
+            self._run_batch(blinded)
+            return
         
         last_phi = 0 # Memory for recursion
         if gamma > 0:
@@ -98,10 +178,7 @@ class ExperimentManager:
         while self.is_running and self.current_run_index < self.params["n_runs"]:
             try:
                 # Simulate a run
-                if not batch:
-                    time.sleep(0.1) # Normal delay
-                else:
-                    pass # Max speed - UI updates throttled below
+                time.sleep(0.1) # Normal delay (batch mode runs in _run_batch)
                 
                 # --- Demo Overrides ---
                 # We override per-step or pre-calc? Pre-calc is better but doing here is safe.
@@ -159,26 +236,22 @@ class ExperimentManager:
                     "sigma_dh_m": 0.1 # Position uncertainty
                 }
                 
-                self.data_log.append(run_data)
+                self._append_record(run_data)
                 self.current_run_index += 1
                 
-                # --- UI Updates (Optimized) ---
-                # In batch mode, update only every 10 runs to save CPU
-                should_update = True
-                if batch and (self.current_run_index % 10 != 0) and (self.current_run_index != self.params["n_runs"]):
-                    should_update = False
-
-                if should_update:
-                    progress = (self.current_run_index / self.params["n_runs"])
-                    self.notify_listeners("progress", {"progress": progress, "run_data": run_data})
-                    
-                    # Log env data (Mask if blinded)
-                    log_msg = f"Run {run_data['id']}: Temp={run_data['temperature']:.2f}C"
-                    if not blinded:
-                        log_msg += f", Phi={run_data['phi']:.4f}"
-                    else:
-                        log_msg += ", Phi=***BLINDED***"
-                    self.notify_listeners("log", log_msg)
+                # --- UI Updates ---
+                # Publishing is cheap: the bus keeps only the latest progress
+                # and delivers at most EventBus.max_hz times per second
+                progress = (self.current_run_index / self.params["n_runs"])
+                self.notify_listeners("progress", {"progress": progress, "run_data": run_data})
+                
+                # Log env data (Mask if blinded)
+                log_msg = f"Run {run_data['id']}: Temp={run_data['temperature']:.2f}C"
+                if not blinded:
+                    log_msg += f", Phi={run_data['phi']:.4f}"
+                else:
+                    log_msg += ", Phi=***BLINDED***"
+                self.notify_listeners("log", log_msg)
 
             except Exception as e:
                 print(f"CRITICAL ERROR in Run {self.current_run_index}: {e}")
@@ -186,19 +259,59 @@ class ExperimentManager:
                 # Decide: Continue or Break? For robustness, we try to continue unless it's fatal
                 pass
 
+        self._finish_run()
+
+    def _run_batch(self, blinded):
+        """
+        Batch mode: whole blocks of runs generated as arrays (batch_sim) and
+        appended to a ColumnLog. One progress / log event per block.
+        """
+        settings = batch_sim.scenario_settings(self.params)
+        n_runs = self.params["n_runs"]
+        rng = np.random.default_rng()
+        last_phi = batch_sim.initial_phi(settings, rng)
+
+        while self.is_running and self.current_run_index < n_runs:
+            try:
+                count = min(batch_sim.BLOCK_SIZE, n_runs - self.current_run_index)
+                columns, last_phi = batch_sim.simulate_block(
+                    settings, self.current_run_index, count, last_phi, rng)
+                self._append_block(columns)
+                self.current_run_index += count
+
+                self.notify_listeners("progress", {"progress": self.current_run_index / n_runs,
+                                                   "run_data": self.column_log.to_records(self.current_run_index - 1)[0]})
+                temps = columns["temperature"]
+                log_msg = f"Runs {columns['id'][0]}-{columns['id'][-1]}: Temp={temps.mean():.2f}C"
+                if not blinded:
+                    log_msg += f", Phi moyen={columns['phi'].mean():.4f}"
+                else:
+                    log_msg += ", Phi=***BLINDED***"
+                self.notify_listeners("log", log_msg)
+            except Exception as e:
+                print(f"CRITICAL ERROR in batch at run {self.current_run_index}: {e}")
+                self.notify_listeners("log", f"ERROR: {str(e)}")
+                break
+
+        self._finish_run()
+
+    def _finish_run(self):
         self.is_running = False
+        with self._log_lock:
+            columns = self.column_log.history_columns()
         
-        # Save to History
-        experiment_record = {
-            "id": f"RUN-{int(time.time())}",
-            "timestamp": datetime.datetime.now().isoformat(),
-            "params": self.params,
-            "data": self.data_log
-        }
-        self.history.append(experiment_record)
-        self._save_history() # Persist to disk
+        # Save to History (one segment per run, cost proportional to this run only)
+        try:
+            self.history_store.append_run(
+                self.history_store.new_run_id(),
+                datetime.datetime.now().isoformat(),
+                self.params,
+                columns,
+            )
+        except Exception as e:
+            print(f"Error saving history: {e}")
         
-        self.notify_listeners("complete", self.data_log)
+        self.notify_listeners("complete", self.get_results())
 
     def _calculate_physics_step(self, scenario, alpha, beta, gamma, last_phi, current_h):
         """
@@ -230,12 +343,8 @@ class ExperimentManager:
         """
         Deletes multiple history items by their IDs.
         """
-        original_count = len(self.history)
-        # Filter out items whose ID is in the run_ids list
-        self.history = [r for r in self.history if r['id'] not in run_ids]
-        
-        if len(self.history) < original_count:
-            self._save_history()
+        # Tombstones; the store compacts itself in the background
+        self.history_store.delete_runs(run_ids)
 
     def delete_history_item(self, run_id):
         # Wrapper for backward compatibility or single deletion
@@ -276,4 +385,5 @@ class ExperimentManager:
         }
 
     def get_results(self):
-        return self.data_log
+        """The data log as a read-only DataFrame view (see snapshot())."""
+        return self.snapshot()[0]
@@ -66,6 +66,8 @@ class App(ctk.CTk):
 
         # Initialize Logic
         self.manager = ExperimentManager()
+        # Manager events reach the frames on this thread, at most 30 times per second
+        self.manager.events.attach(self, max_hz=30)
 
         # Configure grid layout (1x2)
         self.grid_rowconfigure(0, weight=1)
@@ -0,0 +1,135 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+
+class TaskCancelled(Exception):
+    """Raised inside a task by check_cancelled() once cancel() was requested."""
+
+class Task:
+    """
+    Handle on one background computation.
+
+    The worker function receives the Task as its first argument and may call
+    report(fraction, message) and check_cancelled(). Callbacks registered by
+    the submitters always run on the Tk thread.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.future = None
+        self.progress = None # latest (fraction, message), not yet delivered
+        self._cancel = threading.Event()
+        self._done_cbs = []
+        self._error_cbs = []
+        self._progress_cbs = []
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel() # Only effective if not started yet
+
+    def check_cancelled(self):
+        if self._cancel.is_set():
+            raise TaskCancelled(self.key)
+
+    def report(self, fraction, message=None):
+        # Worker side: only the latest value is kept, the UI polls it
+        self.progress = (fraction, message)
+
+    def _attach(self, on_done, on_error, on_progress):
+        if on_done: self._done_cbs.append(on_done)
+        if on_error: self._error_cbs.append(on_error)
+        if on_progress: self._progress_cbs.append(on_progress)
+
+class ComputeExecutor:
+    """
+    Runs heavy analysis off the Tk thread.
+
+    submit() hands a function to a thread pool and returns a Task. The Tk
+    thread polls the pending tasks with after() and dispatches progress,
+    results and errors there, so callbacks may touch widgets freely.
+    Submitting a key that is already in flight attaches the callbacks to the
+    running task instead of starting a second one.
+
+    Threads rather than processes: the analysis objects are stateful and the
+    numpy / scipy kernels release the GIL for the heavy parts.
+    """
+
+    def __init__(self, widget, max_workers=2, poll_ms=50):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chronon-compute")
+        self._tasks = {} # key -> Task (in flight)
+        self._polling = False
+
+    def submit(self, key, fn, *args, on_done=None, on_error=None, on_progress=None, **kwargs):
+        task = self._tasks.get(key)
+        if task is not None and not task.cancelled:
+            task._attach(on_done, on_error, on_progress)
+            return task
+
+        task = Task(key)
+        task._attach(on_done, on_error, on_progress)
+        task.future = self._pool.submit(fn, task, *args, **kwargs)
+        self._tasks[key] = task
+        self._schedule_poll()
+        return task
+
+    def cancel(self, key=None):
+        """
+        Cancels one task (or all of them). Their callbacks will not be called.
+        """
+        tasks = list(self._tasks.values()) if key is None else [self._tasks.get(key)]
+        for task in tasks:
+            if task is not None:
+                task.cancel()
+
+    def busy(self):
+        return bool(self._tasks)
+
+    def shutdown(self):
+        self.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        self._polling = False
+        for key, task in list(self._tasks.items()):
+            progress, task.progress = task.progress, None
+            if progress is not None and not task.cancelled:
+                for cb in task._progress_cbs:
+                    cb(*progress)
+
+            if not task.future.done():
+                continue
+            del self._tasks[key]
+            if task.cancelled:
+                continue
+            try:
+                result = task.future.result()
+            except (TaskCancelled, CancelledError):
+                continue
+            except Exception as e:
+                if not task._error_cbs:
+                    traceback.print_exception(type(e), e, e.__traceback__)
+                for cb in task._error_cbs:
+                    cb(e)
+                continue
+            for cb in task._done_cbs:
+                cb(result)
+
+        if self._tasks:
+            self._schedule_poll()
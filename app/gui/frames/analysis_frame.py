@@ -11,17 +11,20 @@ import tkinter as tk
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import customtkinter as ctk
 
 from app.gui.translations import TRANSLATIONS
 from .base_frame import BaseFrame
-from chronon_core.stats import calculate_slope_epsilon_phi
+from app.gui.lod import LODController, LOD_THRESHOLD, m4_indices
+from app.gui.executor import ComputeExecutor
+from app.gui.shared_analysis import column, results_frame, qc_verdict, regression, residual_diagnostics
 from chronon_core.qc import QualityControl
 from chronon_core.blinding import BlindingManager
 from chronon_core.ledger import Ledger
 from chronon_core.diagnostics import ResidualDiagnostics
-from chronon_core.qubits import QubitAnalysis
+from chronon_core.qubits import QubitAnalysis, COHERENCE_COLUMNS
 from chronon_core.simulator import PowerSimulator
 from app.backend.exporter import ReproducibleExporter
 from chronon_core.interpretation import ScientificInterpreter
@@ -30,6 +33,8 @@ from chronon_core.sensitivity import SensitivityAnalyzer
 from app.gui.widgets.custom_notification import ChrononAlert, ChrononSplash
 
 class AnalysisFrame(BaseFrame):
+    QUBIT_BOOTSTRAP = 10000 # T2 fit resamples (batched, well under a second)
+
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
 
@@ -105,6 +110,19 @@ class AnalysisFrame(BaseFrame):
         self.btn_report = ctk.CTkButton(self, text="Générer Rapport PDF (Rapide)", fg_color="green", hover_color="darkgreen", command=self.generate_report)
         self.btn_report.grid(row=5, column=1, padx=20, pady=20, sticky="e")
 
+        # Background computations (shown only while something runs)
+        self.compute = ComputeExecutor(self)
+        self.busy_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.busy_frame.grid(row=5, column=0, padx=20, pady=20, sticky="w")
+        self.lbl_busy = ctk.CTkLabel(self.busy_frame, text="", font=("Segoe UI", 12))
+        self.lbl_busy.pack(side="left", padx=5)
+        self.progress_busy = ctk.CTkProgressBar(self.busy_frame, width=200)
+        self.progress_busy.pack(side="left", padx=5)
+        self.btn_cancel = ctk.CTkButton(self.busy_frame, text="Annuler", width=80, fg_color="gray",
+                                        command=self.cancel_computations)
+        self.btn_cancel.pack(side="left", padx=5)
+        self.busy_frame.grid_remove()
+
         self.is_blinded = False
         self.current_mapping = None
 
@@ -160,13 +178,14 @@ class AnalysisFrame(BaseFrame):
     def run_qc(self):
         if not self.manager: return
         
-        data = self.manager.get_results()
-        if not data:
+        data, fp = self.manager.snapshot()
+        if data.empty:
             self.lbl_qc_status.configure(text="Status: NO DATA", text_color="gray")
             return
 
-        df = pd.DataFrame(data)
-        qc_status, qc_flags = self.qc.assess_run(df)
+        # Frame, QC, fit and diagnostics are shared with the other screens until the data changes
+        df = results_frame(self.manager, data, fp)
+        qc_status, qc_flags = qc_verdict(self.manager, self.qc, df, fp)
 
         status_colors = {"PASS": "#10B981", "WARN": "#F59E0B", "FAIL": "#EF4444"}
         color = status_colors.get(qc_status, "gray")
@@ -181,11 +200,8 @@ class AnalysisFrame(BaseFrame):
 
         if 'Delta_h_m' in df.columns and len(df) > 2:
             try:
-                x = pd.to_numeric(df['Delta_h_m'], errors='coerce')
-                y = pd.to_numeric(df['phi'], errors='coerce')
-                sy = pd.to_numeric(df.get('sigma_Y', [0.1]*len(df)), errors='coerce')
-
-                reg = calculate_slope_epsilon_phi(x, y, sy)
+                x = column(df, 'Delta_h_m')
+                reg = regression(self.manager, df, fp)
                 slope_val = reg['slope']
                 valid_reg = True
                 residuals = reg.get('residuals')
@@ -203,7 +219,7 @@ class AnalysisFrame(BaseFrame):
         }
         
         if residuals is not None and valid_reg and x is not None:
-             stats['diagnostics'] = self.diagnostics.run_diagnostics(residuals, x)
+             stats['diagnostics'] = residual_diagnostics(self.manager, self.diagnostics, residuals, x, fp, ("phi", None))
         else:
              stats['diagnostics'] = {}
 
@@ -234,6 +250,49 @@ class AnalysisFrame(BaseFrame):
             self.stats_area.delete("0.0", "end")
             self.stats_area.insert("0.0", full_text)
 
+    def _run_async(self, key, fn, on_done, label, *args, on_error=None):
+        """
+        Runs fn(task, *args) on the compute executor; on_done(result) runs on
+        the Tk thread. Identical keys in flight share one computation.
+        """
+        self.lbl_busy.configure(text=f"{label}...")
+        self.progress_busy.set(0)
+        self.busy_frame.grid()
+
+        def done(result):
+            self._update_busy()
+            on_done(result)
+
+        def error(e):
+            self._update_busy()
+            if on_error:
+                on_error(e)
+            else:
+                ChrononAlert.show_error("Erreur", f"{label}: {e}")
+
+        return self.compute.submit(key, fn, *args, on_done=done, on_error=error, on_progress=self._on_progress)
+
+    @staticmethod
+    def _task_progress(task):
+        """progress(fraction, message) callback for chronon_core loops: reports and honours cancel."""
+        def progress(fraction, message=None):
+            task.report(fraction, message)
+            task.check_cancelled()
+        return progress
+
+    def _on_progress(self, fraction, message=None):
+        self.progress_busy.set(max(0.0, min(1.0, fraction)))
+        if message:
+            self.lbl_busy.configure(text=message)
+
+    def _update_busy(self):
+        if not self.compute.busy():
+            self.busy_frame.grid_remove()
+
+    def cancel_computations(self):
+        self.compute.cancel()
+        self.busy_frame.grid_remove()
+
     def toggle_blinding(self):
         if not self.is_blinded:
              self.is_blinded = True
@@ -255,31 +314,45 @@ class AnalysisFrame(BaseFrame):
 
     def show_diagnostics(self):
         if not self.manager: return
-        data = self.manager.get_results()
-        if not data: return
+        data, fp = self.manager.snapshot()
+        if data.empty: return
         
-        df = pd.DataFrame(data)
-        if 'phi' not in df.columns: return
+        self._run_async(("diagnostics", fp), self._compute_diagnostics, self._render_diagnostics,
+                        "Diagnostics", data, fp)
+
+    def _compute_diagnostics(self, task, data, fp):
+        # Worker thread: statistics only, no widgets
+        df = results_frame(self.manager, data, fp)
+        if 'phi' not in df.columns: return None
         
+        key = ("phi", None, "centered")
         if 'Delta_h_m' in df.columns and len(df)>2:
-             x = pd.to_numeric(df['Delta_h_m'], errors='coerce')
-             y = pd.to_numeric(df['phi'], errors='coerce')
-             sy = pd.to_numeric(df.get('sigma_Y', [0.1]*len(df)), errors='coerce')
+             x = column(df, 'Delta_h_m')
+             y = column(df, 'phi')
              
              try:
-                 reg = calculate_slope_epsilon_phi(x, y, sy)
+                 reg = regression(self.manager, df, fp)
                  slope = reg['slope']
                  y_pred = y.mean() + slope * (x - x.mean()) 
                  residuals = y - y_pred
              except:
                  residuals = df['phi'] - df['phi'].mean()
                  x = None
+                 key = ("phi", "demeaned")
         else:
              residuals = df['phi'] - df['phi'].mean()
              x = None
+             key = ("phi", "demeaned")
              
-        results = self.diagnostics.run_diagnostics(residuals, x)
+        task.check_cancelled()
+        task.report(0.5, "Tests résiduels...")
+        results = residual_diagnostics(self.manager, self.diagnostics, residuals, x, fp, key)
         plot_data = self.diagnostics.get_plots_data(residuals)
+        return residuals, results, plot_data
+
+    def _render_diagnostics(self, computed):
+        if computed is None: return
+        residuals, results, plot_data = computed
         
         top = ctk.CTkToplevel(self)
         top.title("Diagnostics Résiduels")
@@ -333,21 +406,16 @@ class AnalysisFrame(BaseFrame):
     
     def show_qubit_analysis(self):
         if not self.manager: return
-        data = self.manager.get_results()
-        if not data: return
-        
-        df = pd.DataFrame(data)
+        df = self.manager.get_results()
+        if df.empty: return
         
         if 'delta_ln_phi' in df.columns and 't2_time' in df.columns:
             x = df['delta_ln_phi']
             y = df['t2_time']
             y_err = df.get('t2_error', None)
         else:
-            if len(data) > 0:
-                tk.messagebox.showinfo("Demo Qubits", "Colonnes T2 manquantes. Utilisation données simulées.")
-                x, y, y_err = self.qubit_analyzer.generate_mock_data(n=20)
-            else:
-                return
+            tk.messagebox.showinfo("Demo Qubits", "Colonnes T2 manquantes. Utilisation données simulées.")
+            x, y, y_err = self.qubit_analyzer.generate_mock_data(n=20)
 
         top = ctk.CTkToplevel(self)
         top.title("Analyse Qubit T2 (Multi-Modèle)")
@@ -371,8 +439,14 @@ class AnalysisFrame(BaseFrame):
         canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
         
         def run_fit(model_name):
-            res = self.qubit_analyzer.analyze_t2_vs_phi(x, y, y_err, model_type=model_name)
-            
+            # Fit + batched bootstrap run in the background; render() comes back on the Tk thread
+            self._run_async(("qubits", model_name, len(x), id(top)),
+                            lambda task: self.qubit_analyzer.analyze_t2_vs_phi(x, y, y_err, model_type=model_name,
+                                                                               n_boot=self.QUBIT_BOOTSTRAP),
+                            lambda res: render(model_name, res), "Fit T2")
+
+        def render(model_name, res):
+            if not top.winfo_exists(): return
             if not res['valid']:
                  lbl_res.configure(text=f"Fit Failed: {res.get('msg')}")
                  return
@@ -383,7 +457,7 @@ class AnalysisFrame(BaseFrame):
             txt = (f"Modèle: {model_name.upper()}\n"
                    f"Equation: {res['equation']}\n"
                    f"Param Beta: {res['slope_beta']:.4f}  (StdErr: {res['std_error']:.4f})\n"
-                   f"IC 95%: [{ci_low:.4f}, {ci_high:.4f}]\n"
+                   f"IC 95% ({res['n_boot']} bootstrap): [{ci_low:.4f}, {ci_high:.4f}]\n"
                    f"Intercept T0: {res['intercept_t2_0']:.2f}")
             lbl_res.configure(text=txt)
             
@@ -408,6 +482,28 @@ class AnalysisFrame(BaseFrame):
         combo_model.configure(command=run_fit)
         run_fit("linear")
 
+        # Campaign frames (site_id, qubit, T2_s/T1_s/Tphi_s): every group in one batched pass
+        group_cols = [c for c in ("site_id", "qubit") if c in df.columns]
+        if group_cols and 'Delta_lnPhi' in df.columns and any(c in df.columns for c in COHERENCE_COLUMNS):
+            def run_groups():
+                model_name = combo_model.get()
+                self._run_async(("qubit_groups", model_name, len(df), id(top)),
+                                lambda task: self.qubit_analyzer.analyze_groups(df, group_cols=group_cols, model_type=model_name,
+                                                                                n_boot=self.QUBIT_BOOTSTRAP // 10),
+                                show_groups, "Fit T2 (groupes)")
+
+            def show_groups(table):
+                if not top.winfo_exists(): return
+                win = ctk.CTkToplevel(top)
+                win.title("Coherence par site / qubit")
+                win.geometry("900x500")
+                box = ctk.CTkTextbox(win, font=("Consolas", 12))
+                box.pack(fill="both", expand=True, padx=10, pady=10)
+                box.insert("end", table.to_string(index=False, float_format=lambda v: f"{v:.4g}"))
+                box.configure(state="disabled")
+
+            ctk.CTkButton(ctrl, text="Par site / qubit", command=run_groups).pack(side="left", padx=10)
+
     def show_simulation(self):
         top = ctk.CTkToplevel(self)
         top.title("Simulateur Power / Injection")
@@ -429,55 +525,81 @@ class AnalysisFrame(BaseFrame):
         ctk.CTkLabel(p_frame, text="N Simulations:").grid(row=2, column=0, padx=5, pady=5)
         entry_n = ctk.CTkEntry(p_frame)
         entry_n.grid(row=2, column=1, padx=5, pady=5)
-        entry_n.insert(0, "200")
+        entry_n.insert(0, "10000")
         
         res_label = ctk.CTkLabel(top, text="Résultats: ...", font=("Consolas", 14), justify="left")
         res_label.pack(padx=20, pady=20)
         
+        def show_error(e):
+            if top.winfo_exists():
+                res_label.configure(text=f"Erreur: {e}")
+
         def run_sim():
             try:
                 s = float(entry_slope.get())
                 sig = float(entry_sigma.get())
                 n = int(entry_n.get())
+            except Exception as e:
+                show_error(e)
+                return
                 
-                res = self.simulator.run_simulation(n_sims=n, true_slope=s, sigma_y=sig)
-                
+            def render(res):
+                if not top.winfo_exists(): return
                 txt = (f"--- RÉSULTATS (N={n}) ---\n"
-                       f"Power (Detection Rate): {res['power']:.2%}\n"
+                       f"Power (Detection Rate): {res['power']:.2%} ± {res['power_mc_error']:.2%}\n"
+                       f"Power analytique (OLS): {res['analytic_power']:.2%}\n"
                        f"Mean Slope Est: {res['mean_slope']:.2e}\n"
-                       f"Bias: {res['bias']:.2e}\n")
+                       f"Bias: {res['bias']:.2e}\n"
+                       f"Couverture IC 95%: {res['coverage']:.1%}\n"
+                       f"Fallback bootstrap: {res['fallback_rate']:.1%}\n")
                 res_label.configure(text=txt)
                 
-            except Exception as e:
-                res_label.configure(text=f"Erreur: {e}")
+            res_label.configure(text="Simulation en cours...")
+            self._run_async(("simulation", n, s, sig),
+                            lambda task: self.simulator.run_simulation(n_sims=n, true_slope=s, sigma_y=sig,
+                                                                       progress=self._task_progress(task)),
+                            render, "Simulation", on_error=show_error)
         
         btn_run = ctk.CTkButton(p_frame, text="Lancer Simulation", command=run_sim, fg_color="#DB2777")
         btn_run.grid(row=3, column=0, columnspan=2, pady=15)
         
         def run_scan():
-             report = self.simulator.scan_scenarios()
-             txt = "--- SCAN SCENARIOS ---\n"
-             for name, r in report.items():
-                 txt += f"{name}: Power={r['power']:.1%} Bias={r['bias']:.1e}\n"
-             res_label.configure(text=txt)
+             def render(report):
+                 if not top.winfo_exists(): return
+                 txt = "--- SCAN SCENARIOS ---\n"
+                 for name, r in report.items():
+                     txt += f"{name}: Power={r['power']:.1%} Bias={r['bias']:.1e}\n"
+                 res_label.configure(text=txt)
+
+             res_label.configure(text="Scan en cours...")
+             self._run_async(("scan_scenarios",),
+                             lambda task: self.simulator.scan_scenarios(progress=self._task_progress(task)),
+                             render, "Scan S1-S3", on_error=show_error)
              
         btn_scan = ctk.CTkButton(top, text="Scan Scenarios S1-S3", command=run_scan, fg_color="#4B5563")
         btn_scan.pack(pady=5)
 
     def show_correlations(self):
         if not self.manager: return
-        data = self.manager.get_results()
-        if not data: return
+        data, fp = self.manager.snapshot()
+        if data.empty: return
         
-        df = pd.DataFrame(data)
+        self._run_async(("correlations", fp), self._compute_correlations, self._render_correlations,
+                        "Corrélations", data, fp)
+
+    def _compute_correlations(self, task, data, fp):
+        df = results_frame(self.manager, data, fp)
         df_num = df.select_dtypes(include=[np.number])
         df_num = df_num.loc[:, (df_num != df_num.iloc[0]).any()]
         
         if df_num.empty or df_num.shape[1] < 2:
+            return None
+        return df_num.corr()
+
+    def _render_correlations(self, corr_matrix):
+        if corr_matrix is None:
             tk.messagebox.showinfo("Info", "Pas assez de colonnes numériques pour corrélation.")
             return
-            
-        corr_matrix = df_num.corr()
         
         top = ctk.CTkToplevel(self)
         top.title("Matrice de Corrélation")
@@ -509,9 +631,8 @@ class AnalysisFrame(BaseFrame):
 
     def export_reproducible(self):
         if not self.manager: return
-        data = self.manager.get_results()
-        if not data: return
-        df = pd.DataFrame(data)
+        df = self.manager.get_results()
+        if df.empty: return
         
         meta = {
             'run_id': "interactive_export",
@@ -527,8 +648,8 @@ class AnalysisFrame(BaseFrame):
 
     def generate_report(self):
         if not self.manager: return
-        data = self.manager.get_results()
-        if not data:
+        data, fp = self.manager.snapshot()
+        if data.empty:
             tk.messagebox.showwarning("Rapport", "Aucune donnée disponible.")
             return
 
@@ -539,129 +660,129 @@ class AnalysisFrame(BaseFrame):
         filename = f"Chronon_Data-{timestamp_str}.pdf"
         file_path = os.path.join(export_dir, filename)
 
-        try:
-            df = pd.DataFrame(data)
-            qc_status, qc_flags = self.qc.assess_run(df)
-            
-            stats_results = {
-                'qc_status': qc_status,
-                'qc_flags': qc_flags,
-                'run_id': f"Run-{timestamp_str}"
-            }
-            
-            residuals = None
-            if 'Delta_h_m' in df.columns and len(df) > 2:
-                x = pd.to_numeric(df['Delta_h_m'], errors='coerce')
-                y = pd.to_numeric(df['phi'], errors='coerce')
-                sy = pd.to_numeric(df.get('sigma_Y', [0.1]*len(df)), errors='coerce')
-                sx = pd.to_numeric(df.get('sigma_dh_m', [0.0]*len(df)), errors='coerce')
-                
-                reg = calculate_slope_epsilon_phi(x, y, sy, sx)
-                stats_results.update(reg)
-                
-                residuals = reg.get('residuals')
-                if residuals is not None:
-                    diag_res = self.diagnostics.run_diagnostics(residuals, x)
-                    stats_results['diagnostics'] = diag_res
-            else:
-                stats_results.update({
-                    'slope': 0.0, 'stderr': 0.0, 'pval': 1.0, 
-                    'model_summary': "Data Insufficient",
-                    'diagnostics': {}
-                })
-            
-            if residuals is None:
-                 tk.messagebox.showerror("Erreur", "Pas de résidus (Régression impossible)")
-                 return
-
-            fig_report = plt.figure(figsize=(10, 6))
-            gs = fig_report.add_gridspec(2, 1)
-            
-            ax1 = fig_report.add_subplot(gs[0])
-            if 'phi' in df.columns:
-                ax1.plot(df['phi'], color='#1F6AA5', label='Phi Signal')
-                ax1.set_title("Série Temporelle (Phi)")
-                ax1.legend()
-                ax1.grid(True, alpha=0.3)
-                
-            ax2 = fig_report.add_subplot(gs[1])
-            if 'Delta_h_m' in df.columns and len(df) > 2:
-                x = pd.to_numeric(df['Delta_h_m'], errors='coerce')
-                y = pd.to_numeric(df['phi'], errors='coerce')
-                sy = pd.to_numeric(df.get('sigma_Y', [0.1]*len(df)), errors='coerce')
-                
-                ax2.errorbar(x, y, yerr=sy, fmt='o', color='black', alpha=0.5, label='Mesures')
-                
-                slope = stats_results.get('slope', 0)
-                line_x = np.linspace(min(x), max(x), 100)
-                line_y = y.mean() + slope * (line_x - x.mean())
-                ax2.plot(line_x, line_y, 'r-', linewidth=2, label=f'Fit (εΦ={slope:.2e})')
-                
-                ax2.set_xlabel("Delta h (m)")
-                ax2.set_ylabel("Phi")
-                ax2.set_title("Régression Gravitationnelle")
-                ax2.legend()
-                ax2.grid(True, alpha=0.3)
-
-            fig_report.tight_layout()
+        lang = getattr(self.master, "language", "fr")
+        self._run_async(("report", fp), self._build_report,
+                        lambda path: ChrononSplash.show("Succès", f"Rapport PDF généré!"), "Rapport PDF",
+                        data, fp, file_path, export_dir, timestamp_str, lang,
+                        on_error=lambda e: ChrononAlert.show_error("Erreur", f"Echec génération rapport: {e}"))
 
-            from chronon_core.reporting import ReportGenerator
+    def _build_report(self, task, data, fp, file_path, export_dir, timestamp_str, lang):
+        # Worker thread: statistics, figure and PDF
+        df = results_frame(self.manager, data, fp)
+        qc_status, qc_flags = qc_verdict(self.manager, self.qc, df, fp)
+        
+        stats_results = {
+            'qc_status': qc_status,
+            'qc_flags': qc_flags,
+            'run_id': f"Run-{timestamp_str}"
+        }
+        
+        residuals = None
+        if 'Delta_h_m' in df.columns and len(df) > 2:
+            x = column(df, 'Delta_h_m')
             
-            meta = {
-                'Operator': 'LabUser',
-                'Software': 'CHRONON V1.0',
-                'Export Path': export_dir
-            }
+            reg = regression(self.manager, df, fp, sx_col='sigma_dh_m')
+            stats_results.update(reg)
             
-            # Automated Description
-            cci_score = 0.0
-            if 'pval' in stats_results:
-                 boot_ci = (stats_results.get('ci_low',0), stats_results.get('ci_high',0))
-                 cci_score, _ = self.cci_calc.calculate_cci(residuals, stats_results['pval'], boot_ci, len(df))
+            residuals = reg.get('residuals')
+            if residuals is not None:
+                diag_res = residual_diagnostics(self.manager, self.diagnostics, residuals, x, fp, ("phi", "sigma_dh_m"))
+                stats_results['diagnostics'] = diag_res
+        else:
+            stats_results.update({
+                'slope': 0.0, 'stderr': 0.0, 'pval': 1.0, 
+                'model_summary': "Data Insufficient",
+                'diagnostics': {}
+            })
+        
+        if residuals is None:
+             raise ValueError("Pas de résidus (Régression impossible)")
+        task.check_cancelled()
+        task.report(0.4, "Figures...")
+
+        # Figure (not pyplot): rendered off the Tk thread
+        fig_report = Figure(figsize=(10, 6))
+        gs = fig_report.add_gridspec(2, 1)
+        
+        ax1 = fig_report.add_subplot(gs[0])
+        if 'phi' in df.columns:
+            ax1.plot(df['phi'], color='#1F6AA5', label='Phi Signal')
+            ax1.set_title("Série Temporelle (Phi)")
+            ax1.legend()
+            ax1.grid(True, alpha=0.3)
             
-            lang = getattr(self.master, "language", "fr")
-            res_interp = self.interpreter.interpret(stats_results, qc_status, lang=lang)
+        ax2 = fig_report.add_subplot(gs[1])
+        if 'Delta_h_m' in df.columns and len(df) > 2:
+            x = pd.to_numeric(df['Delta_h_m'], errors='coerce')
+            y = pd.to_numeric(df['phi'], errors='coerce')
+            sy = pd.to_numeric(df.get('sigma_Y', [0.1]*len(df)), errors='coerce')
             
-            t_interp = TRANSLATIONS[lang]["INTERPRETATION"]
-            desc_text = (f"{t_interp['CONCLUSION_LABEL']}: {res_interp['conclusion_short']}\n"
-                         f"CCI Score: {cci_score:.2f}/1.0\n\n"
-                         f"{t_interp['EVALUATION_LABEL']}:\n{res_interp['evaluation']}\n\n"
-                         f"{t_interp['PUBLICATION_LABEL']}:\n{res_interp['publication_text']}")
-
-            ReportGenerator.generate_pdf_report(file_path, fig_report, stats_results, metadata=meta, description_text=desc_text, lang=lang)
-            plt.close(fig_report)
+            ax2.errorbar(x, y, yerr=sy, fmt='o', color='black', alpha=0.5, label='Mesures')
             
-            ChrononSplash.show("Succès", f"Rapport PDF généré!")
+            slope = stats_results.get('slope', 0)
+            line_x = np.linspace(min(x), max(x), 100)
+            line_y = y.mean() + slope * (line_x - x.mean())
+            ax2.plot(line_x, line_y, 'r-', linewidth=2, label=f'Fit (εΦ={slope:.2e})')
             
-        except Exception as e:
-            ChrononAlert.show_error("Erreur", f"Echec génération rapport: {e}")
+            ax2.set_xlabel("Delta h (m)")
+            ax2.set_ylabel("Phi")
+            ax2.set_title("Régression Gravitationnelle")
+            ax2.legend()
+            ax2.grid(True, alpha=0.3)
+
+        fig_report.tight_layout()
+
+        from chronon_core.reporting import ReportGenerator
+        
+        meta = {
+            'Operator': 'LabUser',
+            'Software': 'CHRONON V1.0',
+            'Export Path': export_dir
+        }
+        
+        # Automated Description
+        cci_score = 0.0
+        if 'pval' in stats_results:
+             boot_ci = (stats_results.get('ci_low',0), stats_results.get('ci_high',0))
+             cci_score, _ = self.cci_calc.calculate_cci(residuals, stats_results['pval'], boot_ci, len(df))
+        
+        res_interp = self.interpreter.interpret(stats_results, qc_status, lang=lang)
+        
+        t_interp = TRANSLATIONS[lang]["INTERPRETATION"]
+        desc_text = (f"{t_interp['CONCLUSION_LABEL']}: {res_interp['conclusion_short']}\n"
+                     f"CCI Score: {cci_score:.2f}/1.0\n\n"
+                     f"{t_interp['EVALUATION_LABEL']}:\n{res_interp['evaluation']}\n\n"
+                     f"{t_interp['PUBLICATION_LABEL']}:\n{res_interp['publication_text']}")
+
+        task.check_cancelled()
+        task.report(0.7, "Écriture PDF...")
+        ReportGenerator.generate_pdf_report(file_path, fig_report, stats_results, metadata=meta, description_text=desc_text, lang=lang)
+        return file_path
 
     def show_interpretation(self):
         if not self.manager: return
-        data = self.manager.get_results()
-        if not data: return
-        df = pd.DataFrame(data)
+        data, fp = self.manager.snapshot()
+        if data.empty: return
+        df = results_frame(self.manager, data, fp)
         
-        qc_status, qc_flags = self.qc.assess_run(df)
+        qc_status, qc_flags = qc_verdict(self.manager, self.qc, df, fp)
         
         stats = {'slope': 0.0, 'pval': 1.0, 'n': len(df)}
         cci_score = 0.0
         cci_details = {}
         
         if 'Delta_h_m' in df.columns and len(df)>2:
-             x = pd.to_numeric(df['Delta_h_m'], errors='coerce')
-             y = pd.to_numeric(df['phi'], errors='coerce')
-             sy = pd.to_numeric(df.get('sigma_Y', [0.1]*len(df)), errors='coerce')
-             reg = calculate_slope_epsilon_phi(x, y, sy)
+             x = column(df, 'Delta_h_m')
+             reg = regression(self.manager, df, fp)
              stats.update(reg)
              
              residuals = reg.get('residuals')
              if residuals is not None:
-                 stats['diagnostics'] = self.diagnostics.run_diagnostics(residuals, x)
+                 stats['diagnostics'] = residual_diagnostics(self.manager, self.diagnostics, residuals, x, fp, ("phi", None))
                  boot_ci = (reg.get('ci_low',0), reg.get('ci_high',0))
-                 cci_score, cci_details = self.cci_calc.calculate_cci(
+                 cci_score, cci_details = self.manager.cached("cci", fp, ("phi", None), lambda: self.cci_calc.calculate_cci(
                      residuals, reg['pval'], boot_ci, len(df)
-                 )
+                 ))
 
         lang = getattr(self.master, "language", "fr")
         res_interp = self.interpreter.interpret(stats, qc_status, lang=lang)
@@ -710,9 +831,9 @@ class AnalysisFrame(BaseFrame):
 
     def show_detection_limit(self):
         if not self.manager: return
-        data = self.manager.get_results()
-        if not data: return
-        df = pd.DataFrame(data)
+        data, fp = self.manager.snapshot()
+        if data.empty: return
+        df = results_frame(self.manager, data, fp)
         
         n = len(df)
         if 'Delta_h_m' in df.columns:
@@ -763,11 +884,48 @@ class AnalysisFrame(BaseFrame):
         chart_frame = ctk.CTkFrame(top)
         chart_frame.pack(side="top", fill="both", expand=True, padx=10, pady=10)
         
-        fig, ax = plt.subplots(figsize=(5, 4))
+        fig, (ax, ax_map) = plt.subplots(1, 2, figsize=(9, 4))
         canvas = FigureCanvasTkAgg(fig, master=chart_frame)
         canvas.get_tk_widget().pack(fill="both", expand=True)
 
-        def update_plot(val=None):
+        # Dense (N x slope) grid over the slider ranges, one surface per noise level
+        x_std = 100.0
+        ns = np.linspace(10, 1000, 200)
+        slopes = np.linspace(0, 5e-4, 200)
+        surfaces = {}
+
+        def surface_for(sig):
+            if sig not in surfaces:
+                surfaces[sig] = self.sensitivity.power_surface(slopes, ns, sig, x_std)
+            return surfaces[sig]
+
+        # Persistent artists, updated in place on every slider move
+        curve, = ax.plot([], [], 'b-', linewidth=2, label='Power Curve')
+        vline = ax.axvline(100, color='r', linestyle='--', label='Current N')
+        point, = ax.plot([], [], 'ro', markersize=8)
+        ax.set_xlim(ns[0], ns[-1])
+        ax.set_ylim(-0.05, 1.05)
+        ax.set_xlabel("Nombre d'échantillons (N)")
+        ax.set_ylabel("Puissance Statistique (1-β)")
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='lower right')
+
+        image = ax_map.imshow(np.zeros((len(ns), len(slopes))), origin='lower', aspect='auto',
+                              extent=(slopes[0], slopes[-1], ns[0], ns[-1]), vmin=0, vmax=1, cmap='viridis')
+        fig.colorbar(image, ax=ax_map, label="Puissance")
+        iso_lines = {level: ax_map.plot([], [], '-', color=color, linewidth=1.5, label=f"{level:.0%}")[0]
+                     for level, color in ((0.5, 'white'), (0.8, 'orange'), (0.95, 'red'))}
+        marker, = ax_map.plot([], [], 'k+', markersize=12, markeredgewidth=2)
+        ax_map.set_xlabel("Pente Réelle")
+        ax_map.set_ylabel("N")
+        ax_map.set_title("Iso-puissance")
+        ax_map.legend(loc='upper right', fontsize=8)
+        fig.tight_layout()
+
+        pending = {"id": None}
+
+        def update_plot():
+            pending["id"] = None
             n = int(slider_n.get())
             sig = float(slider_sig.get())
             slope_true = float(slider_slope.get())
@@ -776,28 +934,28 @@ class AnalysisFrame(BaseFrame):
             lbl_sig.configure(text=f"{sig:.2f}")
             lbl_slope.configure(text=f"{slope_true:.2e}")
             
-            x_std = 100.0
-            ns = np.linspace(10, 1000, 50)
-            powers = [self.sensitivity.get_power_for_slope(slope_true, sig, ni, x_std) for ni in ns]
-            
-            ax.clear()
-            ax.plot(ns, powers, 'b-', linewidth=2, label='Power Curve')
-            ax.axvline(n, color='r', linestyle='--', label=f'Current N={n}')
-            
-            curr_poul = self.sensitivity.get_power_for_slope(slope_true, sig, n, x_std)
-            ax.plot(n, curr_poul, 'fo', markersize=8)
-            
-            ax.set_ylim(-0.05, 1.05)
-            ax.set_xlabel("Nombre d'échantillons (N)")
-            ax.set_ylabel("Puissance Statistique (1-β)")
-            ax.set_title(f"Simulation: Power = {curr_poul:.1%}")
-            ax.grid(True, alpha=0.3)
-            ax.legend()
-            canvas.draw()
+            # One broadcast call per curve / surface instead of one per point
+            curve.set_data(ns, self.sensitivity.power_grid(slope_true, sig, ns, x_std))
+            curr_power = self.sensitivity.get_power_for_slope(slope_true, sig, n, x_std)
+            vline.set_xdata([n, n])
+            point.set_data([n], [curr_power])
+            ax.set_title(f"Simulation: Power = {curr_power:.1%}")
+
+            surface = surface_for(sig)
+            image.set_data(surface)
+            for level, line in iso_lines.items():
+                line.set_data(self.sensitivity.iso_power(slopes, surface, (level,))[level], ns)
+            marker.set_data([slope_true], [n])
+            canvas.draw_idle()
+
+        def schedule_update(val=None):
+            # Coalesce slider events: one redraw per Tk idle cycle
+            if pending["id"] is None:
+                pending["id"] = top.after_idle(update_plot)
             
-        slider_n.configure(command=update_plot)
-        slider_sig.configure(command=update_plot)
-        slider_slope.configure(command=update_plot)
+        slider_n.configure(command=schedule_update)
+        slider_sig.configure(command=schedule_update)
+        slider_slope.configure(command=schedule_update)
         
         update_plot()
 
@@ -810,23 +968,37 @@ class AnalysisFrame(BaseFrame):
         top.title("Analyse Dynamique des Résidus")
         top.geometry("800x600")
         
-        window = max(5, int(len(residuals)/10))
-        roll_mean = pd.Series(residuals).rolling(window=window).mean()
-        roll_std = pd.Series(residuals).rolling(window=window).std()
+        residuals = np.asarray(residuals, dtype=float)
+        n = len(residuals)
+        x_indices = np.arange(n)
+        window = max(5, int(n/10))
+        roll_mean = pd.Series(residuals).rolling(window=window).mean().to_numpy()
+        roll_std = pd.Series(residuals).rolling(window=window).std().to_numpy()
         
         fig = plt.figure(figsize=(8, 6))
         gs = fig.add_gridspec(2, 2)
         
+        # Large series are drawn through level-of-detail controllers (re-decimated on zoom / pan)
+        top.lod = []
         ax1 = fig.add_subplot(gs[0, :])
-        ax1.plot(residuals, 'o', color='gray', alpha=0.3, label='Résidus bruts')
-        ax1.plot(roll_mean, 'r-', linewidth=2, label=f'Moyenne Mobile (w={window})')
-        ax1.fill_between(range(len(residuals)), roll_mean - 2*roll_std, roll_mean + 2*roll_std, color='orange', alpha=0.2, label='±2σ')
+        if n <= LOD_THRESHOLD:
+            ax1.plot(residuals, 'o', color='gray', alpha=0.3, label='Résidus bruts')
+            ax1.plot(roll_mean, 'r-', linewidth=2, label=f'Moyenne Mobile (w={window})')
+            band = x_indices
+        else:
+            raw_line, = ax1.plot([], [], 'o', color='gray', alpha=0.3, label='Résidus bruts')
+            mean_line, = ax1.plot([], [], 'r-', linewidth=2, label=f'Moyenne Mobile (w={window})')
+            top.lod += [LODController(ax1, raw_line, x_indices, residuals),
+                        LODController(ax1, mean_line, x_indices, roll_mean)]
+            # The band is static: envelope of the M4 points of both bounds at full width
+            band = np.union1d(m4_indices(x_indices, roll_mean - 2*roll_std, 0, n, 2000),
+                              m4_indices(x_indices, roll_mean + 2*roll_std, 0, n, 2000))
+        ax1.fill_between(band, (roll_mean - 2*roll_std)[band], (roll_mean + 2*roll_std)[band], color='orange', alpha=0.2, label='±2σ')
         ax1.axhline(0, color='black', linestyle='--')
         ax1.set_title("Stabilité Temporelle (Drift)")
         ax1.legend()
         
         ax2 = fig.add_subplot(gs[1, 0])
-        x_indices = np.arange(len(residuals))
         h, xedges, yedges = np.histogram2d(x_indices, residuals, bins=[min(20, len(residuals)//2), 20])
         ax2.imshow(h.T, origin='lower', aspect='auto', cmap='inferno', interpolation='nearest',
                    extent=[xedges[0], xedges[-1], yedges[0], yedges[-1]])
@@ -837,7 +1009,10 @@ class AnalysisFrame(BaseFrame):
         fit_coef = np.polyfit(np.arange(len(residuals)), abs_res, 1)
         fit_line = np.polyval(fit_coef, np.arange(len(residuals)))
         
-        ax3.scatter(np.arange(len(residuals)), abs_res, alpha=0.5, s=10)
+        if n <= LOD_THRESHOLD:
+            ax3.scatter(x_indices, abs_res, alpha=0.5, s=10)
+        else:
+            top.lod.append(LODController(ax3, ax3.scatter(np.empty(0), np.empty(0), alpha=0.5, s=10), x_indices, abs_res))
         ax3.plot(fit_line, 'g-', linewidth=2)
         drift_slope = fit_coef[0]
         status = "STABLE" if abs(drift_slope) < 1e-5 else "DRIFTING"
@@ -6,16 +6,16 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk
-import json
-import os
-import csv
-import pandas as pd
-from .base_frame import BaseFrame
+import threading
 from .base_frame import BaseFrame
+from app.experiment.history_store import RunCatalog
 from app.gui.widgets.custom_notification import ChrononAlert, ChrononConfirm, ChrononSplash
 from app.gui.translations import TRANSLATIONS
 
 class HistoryFrame(BaseFrame):
+    PAGE_SIZE = 200     # Rows inserted per page
+    PREFETCH_AT = 0.9   # Scroll fraction that triggers the next page
+
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         if hasattr(self, "update_language"):
@@ -47,7 +47,7 @@ class HistoryFrame(BaseFrame):
         # header in ledger.py: ["timestamp", "run_id", "verdict", "hash_config", "hash_code", "json_row_path", "row_hash", "operator", "blinding_event"]
         # We display useful summary
         # Updated Columns to match ExperimentManager history.json
-        columns = ("timestamp", "run_id", "delta_h", "n_points", "scenario")
+        columns = RunCatalog.COLUMNS
         
         self.tree = ttk.Treeview(self.tree_frame, columns=columns, show="headings", height=15, selectmode="extended")
         
@@ -66,9 +66,19 @@ class HistoryFrame(BaseFrame):
         self.tree.grid(row=0, column=0, sticky="nsew")
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
-        scrollbar.grid(row=0, column=1, sticky="ns")
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        # Rows are paged in as the view approaches the end of what is loaded
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
+
+        # Sort on heading click
+        for col in columns:
+            self.tree.heading(col, command=lambda c=col: self._on_heading(c))
+
+        # Filter (substring on any column)
+        self.entry_filter = ctk.CTkEntry(self, placeholder_text="Filtrer (ID, date, scénario...)", width=260)
+        self.entry_filter.grid(row=0, column=0, padx=20, pady=20, sticky="e")
+        self.entry_filter.bind("<KeyRelease>", self._on_filter_changed)
         
         # Actions
         self.btn_load = ctk.CTkButton(self, text="Charger la sélection", command=self.load_selection,
@@ -84,100 +94,136 @@ class HistoryFrame(BaseFrame):
                                         fg_color="#EF4444", hover_color="#DC2626")
         self.btn_delete.grid(row=2, column=0, padx=20, pady=20)
 
+        # View state: the catalog query result, of which only the first
+        # _n_loaded ids are in the Treeview
+        store = getattr(self.manager, "history_store", None) if self.manager else None
+        self.catalog = RunCatalog(store) if store is not None else None
+        self._view_ids = []
+        self._n_loaded = 0
+        self._iid_to_id = {}
+        self._query_token = 0
+        self._page_pending = False
+        self._filter_job = None
+        self._sort_by = "timestamp"
+        self._sort_desc = True
+
         # Initial Load
         self.refresh_history()
 
     def refresh_history(self):
-        # Clear
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-            
-        # Read from history.json (ExperimentManager standard)
-        hist_path = "history.json"
-        
-        # If manager exists, use its path or memory
-        history_data = []
-        if self.manager and hasattr(self.manager, 'history'):
-            history_data = self.manager.history
-        elif os.path.exists(hist_path):
-             try:
-                 with open(hist_path, 'r') as f:
-                     history_data = json.load(f)
-             except:
-                 pass
-
-        if not history_data:
+        """
+        Re-queries the run catalog in a worker thread. The Treeview is only
+        touched once the result is back on the Tk thread.
+        """
+        if self.catalog is None:
             return
+        self._query_token += 1
+        token = self._query_token
+        sort_by, descending = self._sort_by, self._sort_desc
+        text = self.entry_filter.get()
+
+        def worker():
+            try:
+                ids = self.catalog.query(sort_by, descending, text)
+            except Exception as e:
+                print(f"History query failed: {e}")
+                return
+            self.after(0, lambda: self._apply_view(token, ids))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _apply_view(self, token, run_ids):
+        # A newer query was issued meanwhile: drop this one
+        if token != self._query_token:
+            return
+        self.tree.delete(*self.tree.get_children())
+        self._iid_to_id = {}
+        self._view_ids = run_ids
+        self._n_loaded = 0
+        self._load_next_page()
+
+    def _load_next_page(self):
+        self._page_pending = False
+        page = self._view_ids[self._n_loaded:self._n_loaded + self.PAGE_SIZE]
+        if not page:
+            return
+        self._n_loaded += len(page)
+        for row in self.catalog.rows(page):
+            iid = str(row[1])
+            if self.tree.exists(iid):
+                continue
+            self._iid_to_id[iid] = row[1]
+            self.tree.insert("", "end", iid=iid, values=row)
+
+    def _on_tree_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        # Fetch the next page when the view gets close to the last loaded row
+        if float(last) >= self.PREFETCH_AT and self._n_loaded < len(self._view_ids) and not self._page_pending:
+            self._page_pending = True
+            self.after_idle(self._load_next_page)
+
+    def _on_heading(self, column):
+        if column == self._sort_by:
+            self._sort_desc = not self._sort_desc
+        else:
+            self._sort_by, self._sort_desc = column, column == "timestamp"
+        self.refresh_history()
 
-        # Sort by timestamp desc
-        try:
-            history_data.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        except:
-            pass
-
-        for run in history_data:
-            ts = run.get("timestamp", "").replace("T", " ")[:19]
-            rid = run.get("id", "Unknown")
-            params = run.get("params", {})
-            data_points = run.get("data", [])
-            
-            delta_h = params.get("delta_h", "N/A")
-            scenario = params.get("scenario", "N/A")
-            n_pts = len(data_points)
-            
-            # Insert
-            self.tree.insert("", "end", values=(ts, rid, delta_h, n_pts, scenario))
-            
-        # Store for loading
-        self.history_cache = history_data
+    def _on_filter_changed(self, event=None):
+        # Debounce typing
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(250, self._apply_filter)
+
+    def _apply_filter(self):
+        self._filter_job = None
+        self.refresh_history()
+
+    def _selected_run_ids(self):
+        return [self._iid_to_id[iid] for iid in self.tree.selection() if iid in self._iid_to_id]
 
     def load_selection(self):
-        selected = self.tree.selection()
+        selected = self._selected_run_ids()
         if not selected: return
-        
-        # Get Run ID from tree
-        item_vals = self.tree.item(selected[0])['values']
-        run_id = item_vals[1] # ID is at index 1
-        if hasattr(self, 'history_cache'):
-            target_run = next((r for r in self.history_cache if str(r.get('id', '')) == str(run_id)), None)
-            
-            if target_run and self.manager:
-                # Restore to Manager
-                
-                # Check data
-                raw_data = target_run.get('data', [])
-                if not raw_data:
-                    ChrononAlert.show_info("Attention", "Ce run ne contient aucune donnée.")
-                    return
-                    
-                # Push to Manager
-                self.manager.data_log = raw_data
-                self.manager.params = target_run.get('params', {})
-                self.manager.current_run_index = len(raw_data) # Set index to end
-                
-                # Notify App
-                # We trigger a 'complete' event to force Visualization update
-                self.manager.notify_listeners("complete", raw_data)
-                
-                ChrononSplash.show("Run Chargé", f"Run {run_id}\n({len(raw_data)} points)")
-            else:
-                 ChrononAlert.show_error("Erreur", "Données non trouvées ou Manager déconnecté.")
+
+        run_id = selected[0]
+        target_run = self.catalog.get(run_id) if self.catalog else None
+
+        if target_run and self.manager:
+            # Restore to Manager
+
+            # Push to Manager (point data is loaded lazily, straight into the column log)
+            n_points = self.manager.restore_history_run(run_id)
+            if not n_points:
+                ChrononAlert.show_info("Attention", "Ce run ne contient aucune donnée.")
+                return
+
+            self.manager.params = target_run.get('params', {})
+            self.manager.current_run_index = n_points # Set index to end
+
+            # Notify App
+            # We trigger a 'complete' event to force Visualization update
+            self.manager.notify_listeners("complete", self.manager.get_results())
+
+            ChrononSplash.show("Run Chargé", f"Run {run_id}\n({n_points} points)")
+        else:
+             ChrononAlert.show_error("Erreur", "Données non trouvées ou Manager déconnecté.")
 
     def delete_selection(self):
-        selected = self.tree.selection()
-        if not selected: return
-        
-        if not ChrononConfirm.ask_yes_no("Confirmation", f"Voulez-vous vraiment supprimer {len(selected)} élément(s) de l'historique ?"):
+        run_ids_to_delete = self._selected_run_ids()
+        if not run_ids_to_delete: return
+
+        if not ChrononConfirm.ask_yes_no("Confirmation", f"Voulez-vous vraiment supprimer {len(run_ids_to_delete)} élément(s) de l'historique ?"):
             return
-            
-        run_ids_to_delete = []
-        for item_id in selected:
-            vals = self.tree.item(item_id)['values']
-            run_ids_to_delete.append(str(vals[1])) # ID is index 1
-            
+
         if self.manager and hasattr(self.manager, 'delete_history_items'):
             self.manager.delete_history_items(run_ids_to_delete)
-            self.refresh_history()
+            # Drop the rows in place; the catalog skips them on the next query anyway
+            for run_id in run_ids_to_delete:
+                iid = str(run_id)
+                if self.tree.exists(iid):
+                    self.tree.delete(iid)
+                self._iid_to_id.pop(iid, None)
             ChrononAlert.show_success("Succès", "Éléments supprimés.")
         else:
             # Fallback direct file edit if manager not available (less robust)
@@ -193,6 +239,7 @@ class HistoryFrame(BaseFrame):
         self.label.configure(text=t["TITLE"])
         self.btn_load.configure(text=t["BTN_LOAD"])
         self.btn_delete.configure(text=t["BTN_DELETE"])
+        self.entry_filter.configure(placeholder_text=t["FILTER_PLACEHOLDER"])
         
         # Translate Tree Headings
         # Note: Treeview headings are configured via methods
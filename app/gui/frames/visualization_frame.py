@@ -9,14 +9,19 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolb
 import matplotlib.pyplot as plt
 from matplotlib.widgets import RectangleSelector
 import numpy as np
-import pandas as pd
-from chronon_core.stats import calculate_slope_epsilon_phi
+from matplotlib.colors import to_rgba
+from chronon_core.stats import WLSAccumulator
 
 from .base_frame import BaseFrame
+from app.gui.lod import LODController, LOD_THRESHOLD
+from app.gui.selection import PointIndex
+from app.gui.shared_analysis import column, results_frame, regression
 from app.gui.widgets.custom_notification import ChrononAlert, ChrononConfirm, ChrononSplash
 from app.gui.translations import TRANSLATIONS
 
 class VisualizationFrame(BaseFrame):
+    STREAM_MAX_FPS = 10 # Cap on live redraws while an acquisition is running
+
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         
@@ -62,6 +67,11 @@ class VisualizationFrame(BaseFrame):
         self.check_errorbars = ctk.CTkCheckBox(self.controls_frame, text="Barres d'erreur", command=self.update_plot)
         self.check_errorbars.pack(pady=10, padx=10, anchor="w")
 
+        # Live mode: append new points to persistent artists instead of redrawing
+        self.check_streaming = ctk.CTkCheckBox(self.controls_frame, text="Mode streaming", command=self.update_plot)
+        self.check_streaming.select()
+        self.check_streaming.pack(pady=10, padx=10, anchor="w")
+
         # Filters
         self.filter_frame = ctk.CTkFrame(self.controls_frame)
         self.filter_frame.pack(pady=10, padx=10, fill="x")
@@ -91,6 +101,10 @@ class VisualizationFrame(BaseFrame):
         self.colorbar = None
         self.selector = None
         self.selected_indices = []
+        self.current_data = None
+        self.point_index = None # Spatial index of the selectable points
+        self._stream = None # Persistent artists + fit accumulator of the live plot
+        self._lod = [] # Level-of-detail controllers of the current plot
 
         # Plot Area (Initialize ONCE)
         self.plot_frame = ctk.CTkFrame(self)
@@ -143,6 +157,7 @@ class VisualizationFrame(BaseFrame):
         
         self.check_overlay.configure(text=t["CHK_OVERLAY"])
         self.check_errorbars.configure(text=t["CHK_ERRORBARS"])
+        self.check_streaming.configure(text=t["CHK_STREAMING"])
         
         # Banners (Static part, dynamic part handled in update_plot usually, but we set defaults)
         # self.lbl_qc.configure(text=t["LBL_QC"]) # Logic overwrites this often
@@ -180,19 +195,132 @@ class VisualizationFrame(BaseFrame):
 
     def on_experiment_update(self, event_type, data):
         # Throttle updates to avoid freezing the GUI
-        if event_type in ["progress", "complete"]:
+        if event_type == "complete":
+            # Final redraw with the full estimator (HAC / Deming, residual plots...)
+            self.after(0, self._perform_update)
+        elif event_type == "progress":
             if not self.update_pending:
                 self.update_pending = True
-                # Update max 5 times per second (200ms)
-                self.after(200, self._perform_update)
-                
+                if self._stream_active():
+                    self.after(int(1000 / self.STREAM_MAX_FPS), self._perform_stream_update)
+                else:
+                    # Update max 5 times per second (200ms)
+                    self.after(200, self._perform_update)
+
     def _perform_update(self):
         self.update_plot()
         self.update_pending = False
 
+    def _stream_active(self):
+        """
+        Live appends only apply to the central regression without run filters.
+        """
+        if not self.check_streaming.get():
+            return False
+        if self.plot_type_var.get() not in ["Régression Centrale (εΦ)", "Central Regression (εΦ)"]:
+            return False
+        return not (self.entry_min.get() or self.entry_max.get())
+
+    def _init_stream(self):
+        if self.colorbar:
+            try:
+                self.colorbar.remove()
+            except Exception:
+                pass
+            self.colorbar = None
+        self._clear_lod()
+        self.ax.clear()
+        self.ax.set_facecolor('#FFFFFF')
+        self.toggle_selector(False)
+        self.selected_indices = []
+        self.current_data = None
+        self.point_index = None
+        self.btn_export_sel.configure(state="disabled", text="Export Sélection")
+
+        scatter = self.ax.scatter(np.empty(0), np.empty(0), alpha=0.7, edgecolors='k', zorder=3)
+        line, = self.ax.plot([], [], 'r--', label="Fit εΦ (live)")
+        band = self.ax.fill_between([], [], [], color='red', alpha=0.1, label="95% CI")
+        self.ax.set_xlabel("Delta h (m)")
+        self.ax.set_ylabel("Delta ln(Phi)")
+        self.ax.legend()
+        self.ax.grid(True, linestyle="--", alpha=0.3)
+        self.lbl_fallback.configure(text="Fallback: None (live)", text_color="green")
+
+        self._stream = {
+            "n": 0,
+            "xy": np.empty((1024, 2)),
+            "colors": np.empty((1024, 4)),
+            "acc": WLSAccumulator(),
+            "scatter": scatter,
+            "line": line,
+            "band": band,
+        }
+
+    def _perform_stream_update(self):
+        self.update_pending = False
+        if not self.manager:
+            return
+        if not self._stream_active():
+            self.update_plot()
+            return
+
+        raw_data = self.manager.get_results() # view on the column log, no copy
+        s = self._stream
+        if s is None or len(raw_data) < s["n"]:
+            # First live frame, or a new acquisition restarted the log
+            self._init_stream()
+            s = self._stream
+        new = raw_data.iloc[s["n"]:]
+        if new.empty:
+            return
+
+        k = len(new)
+        x = column(new, 'Delta_h_m').to_numpy(float)
+        y = column(new, 'Delta_lnPhi').to_numpy(float)
+        sigma_y = column(new, 'sigma_Y', 0.1).to_numpy(float)
+        fail, ok, plain = to_rgba('red'), to_rgba('green'), to_rgba('blue')
+        if 'status' in new.columns:
+            colors = np.where((new['status'] == 'FAIL').to_numpy()[:, None], fail, ok)
+        else:
+            colors = np.tile(plain, (k, 1))
+
+        # Grow the point buffers geometrically; artists get views, never copies
+        n0, n1 = s["n"], s["n"] + k
+        if n1 > len(s["xy"]):
+            cap = max(n1, 2 * len(s["xy"]))
+            for key in ("xy", "colors"):
+                buf = np.empty((cap, s[key].shape[1]))
+                buf[:n0] = s[key][:n0]
+                s[key] = buf
+        s["xy"][n0:n1, 0] = x
+        s["xy"][n0:n1, 1] = y
+        s["colors"][n0:n1] = colors
+        s["n"] = n1
+
+        s["scatter"].set_offsets(s["xy"][:n1])
+        s["scatter"].set_facecolors(s["colors"][:n1])
+        self.plotted_x = s["xy"][:n1, 0]
+        self.plotted_y = s["xy"][:n1, 1]
+        self.ax.update_datalim(s["xy"][n0:n1])
+
+        reg_res = s["acc"].add(x, y, sigma_y).result()
+        if reg_res is not None:
+            self.last_stats = reg_res
+            x_range = np.linspace(self.plotted_x.min(), self.plotted_x.max(), 100)
+            alpha_est = reg_res['alpha']
+            s["line"].set_data(x_range, alpha_est + reg_res['slope'] * x_range)
+            y_upper = alpha_est + reg_res['ci_high'] * x_range
+            y_lower = alpha_est + reg_res['ci_low'] * x_range
+            s["band"].set_verts([np.column_stack([np.r_[x_range, x_range[::-1]], np.r_[y_lower, y_upper[::-1]]])])
+            self.ax.set_title(f"Régression Centrale (live): εΦ={reg_res['slope']:.2e}, p={reg_res['pval']:.3g}")
+
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
+
     def on_select(self, eclick, erelease):
         """Callback for RectangleSelector."""
-        if not self.current_data: return
+        if self.current_data is None or self.point_index is None: return
+        if eclick.xdata is None or erelease.xdata is None: return
         
         x1, y1 = eclick.xdata, eclick.ydata
         x2, y2 = erelease.xdata, erelease.ydata
@@ -201,23 +329,11 @@ class VisualizationFrame(BaseFrame):
         xmin, xmax = min(x1, x2), max(x1, x2)
         ymin, ymax = min(y1, y2), max(y1, y2)
         
-        # Find points inside rect
-        selected = []
-        df = self.current_data
-        
-        # Assuming df has 'x' and 'y' columns mapped from plotting
-        # We need to map back to original data indices
-        # Simplified: Check against plotted arrays
-        
-        # We store plotted data in self.plotted_x and self.plotted_y for this
-        if hasattr(self, 'plotted_x') and hasattr(self, 'plotted_y'):
-             for i, (px, py) in enumerate(zip(self.plotted_x, self.plotted_y)):
-                 if xmin <= px <= xmax and ymin <= py <= ymax:
-                     selected.append(i)
-        
+        # Positional indices into current_data (index built once per plot)
+        selected = self.point_index.query(xmin, xmax, ymin, ymax)
         self.selected_indices = selected
         
-        if selected:
+        if len(selected):
             self.btn_export_sel.configure(state="normal", text=f"Export ({len(selected)})")
         else:
             self.btn_export_sel.configure(state="disabled", text="Export Sélection")
@@ -226,7 +342,38 @@ class VisualizationFrame(BaseFrame):
         if hasattr(self, 'selector') and self.selector:
             self.selector.set_active(state)
 
+    def _clear_lod(self):
+        for lod in self._lod:
+            lod.disconnect()
+        self._lod = []
+
+    def _lod_scatter(self, x, y, c=None, **kwargs):
+        """
+        ax.scatter, decimated to the view resolution above LOD_THRESHOLD points.
+        """
+        if len(x) <= LOD_THRESHOLD:
+            return self.ax.scatter(x, y, c=c, **kwargs)
+        if isinstance(c, str):
+            kwargs["color"], c = c, None
+        sc = self.ax.scatter(np.empty(0), np.empty(0), **kwargs)
+        self._lod.append(LODController(self.ax, sc, x, y, colors=c))
+        return sc
+
+    def _lod_plot(self, x, y, *args, **kwargs):
+        """
+        ax.plot, M4-decimated to the view resolution above LOD_THRESHOLD points.
+        """
+        if len(x) <= LOD_THRESHOLD:
+            return self.ax.plot(x, y, *args, **kwargs)[0]
+        line, = self.ax.plot([], [], *args, **kwargs)
+        self._lod.append(LODController(self.ax, line, x, y))
+        return line
+
     def update_plot(self):
+        # Full redraw: live artists (if any) are gone after ax.clear()
+        self._stream = None
+        self._clear_lod()
+
         # Clear Colorbar if exists (Safety First)
         if self.colorbar:
             try:
@@ -238,29 +385,33 @@ class VisualizationFrame(BaseFrame):
         self.ax.clear()
         self.ax.set_facecolor('#FFFFFF')
         self.selected_indices = []
+        self.point_index = None
         self.btn_export_sel.configure(state="disabled", text="Export Sélection")
         
         if not self.manager:
             return
             
         # Get Data
-        raw_data = self.manager.get_results()
-        if not raw_data:
+        raw_data, fp = self.manager.snapshot()
+        if raw_data.empty:
             self.ax.text(0.5, 0.5, "Pas de données disponibles", color="#0B2240", ha="center", fontsize=12)
             self.canvas.draw()
             return
             
-        # Convert to DataFrame for easier handling
-        df = pd.DataFrame(raw_data)
+        # Convert to DataFrame for easier handling (shared with the Analysis tab, do not modify in place)
+        df = results_frame(self.manager, raw_data, fp)
         
         # Filtering
+        id_range = (None, None) # Part of the fit cache key
         try:
             if self.entry_min.get():
                 min_val = int(self.entry_min.get())
                 df = df[df['id'] >= min_val]
+                id_range = (min_val, id_range[1])
             if self.entry_max.get():
                 max_val = int(self.entry_max.get())
                 df = df[df['id'] <= max_val]
+                id_range = (id_range[0], max_val)
         except Exception:
             pass # Ignore filter errors
             
@@ -298,12 +449,12 @@ class VisualizationFrame(BaseFrame):
                 colors = ['blue'] * len(df)
             
             # Scatter
-            self.ax.scatter(x_data, y_data, c=colors, alpha=0.7, edgecolors='k', zorder=3)
+            self._lod_scatter(x_data, y_data, c=colors, alpha=0.7, edgecolors='k', zorder=3)
             if self.check_errorbars.get():
                 self.ax.errorbar(x_data, y_data, yerr=sigma_y, fmt='none', ecolor='gray', alpha=0.3, zorder=1)
                 
-            # Perform Regression on fly for visualization
-            reg_res = calculate_slope_epsilon_phi(x_data, y_data, sigma_y, sigma_x)
+            # Regression (memoized per data state; the residual plot reuses it)
+            reg_res = regression(self.manager, df, fp, y_col='Delta_lnPhi', sx_col='sigma_dh_m', subset=id_range)
             self.last_stats = reg_res # Cache for report
             
             # Plot Fit Line
@@ -355,6 +506,7 @@ class VisualizationFrame(BaseFrame):
             
             self.plotted_x = x_data.values
             self.plotted_y = y_data.values
+            self.point_index = PointIndex(self.plotted_x, self.plotted_y)
             
             # Activate Selector
             if not self.selector:
@@ -367,7 +519,7 @@ class VisualizationFrame(BaseFrame):
             self.toggle_selector(False)
             ids = get_col('id')
             phis = get_col('phi') # or Delta_lnPhi
-            self.ax.plot(ids, phis, color="#1F6AA5", marker='o', linestyle='-')
+            self._lod_plot(ids, phis, color="#1F6AA5", marker='o', linestyle='-')
             self.ax.set_xlabel("Run ID")
             self.ax.set_ylabel("Amplitude")
             if self.check_errorbars.get():
@@ -381,10 +533,10 @@ class VisualizationFrame(BaseFrame):
             sigma_x = get_col('sigma_dh_m', 0.0)
             
             # Must run regression to get residuals
-            reg_res = calculate_slope_epsilon_phi(x_data, y_data, sigma_y, sigma_x)
+            reg_res = regression(self.manager, df, fp, y_col='Delta_lnPhi', sx_col='sigma_dh_m', subset=id_range)
             residuals = reg_res.get('residuals', y_data - (reg_res.get('alpha', 0) + reg_res['slope'] * x_data))
             
-            self.ax.scatter(x_data, residuals, c='purple', alpha=0.7)
+            self._lod_scatter(x_data, residuals, c='purple', alpha=0.7)
             self.ax.axhline(0, color='black', linestyle='--')
             self.ax.set_xlabel("Delta h (m)")
             self.ax.set_ylabel("Résidus (O - C)")
@@ -394,7 +546,7 @@ class VisualizationFrame(BaseFrame):
             self.toggle_selector(False)
             x_temp = get_col('temperature')
             y_phi = get_col('Delta_lnPhi')
-            self.ax.scatter(x_temp, y_phi, c='orange', alpha=0.7)
+            self._lod_scatter(x_temp, y_phi, c='orange', alpha=0.7)
             self.ax.set_xlabel("Température (°C)")
             self.ax.set_ylabel("Delta ln(Phi)")
             self.ax.set_title("Corrélation Environnementale")
@@ -415,7 +567,7 @@ class VisualizationFrame(BaseFrame):
             y_data = get_col('Delta_lnPhi')
             sigma_y = get_col('sigma_Y', 0.1)
             # Run regression to get residuals distribution
-            reg_res = calculate_slope_epsilon_phi(x_data, y_data, sigma_y)
+            reg_res = regression(self.manager, df, fp, y_col='Delta_lnPhi', subset=id_range)
             residuals = reg_res.get('residuals', y_data - (reg_res.get('alpha', 0) + reg_res['slope'] * x_data))
             
             self.ax.hist(residuals, bins=20, color='skyblue', edgecolor='black')
@@ -428,15 +580,14 @@ class VisualizationFrame(BaseFrame):
         self.canvas.draw()
 
     def export_selection(self):
-        if not self.selected_indices or self.current_data is None:
+        if not len(self.selected_indices) or self.current_data is None:
             return
             
-        subset = self.current_data.iloc[self.selected_indices]
+        # Only the selected rows are gathered; the plotted frame is not copied
+        subset = self.current_data.take(self.selected_indices)
         
         from tkinter import filedialog
         filename = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV", "*.csv")])
-        if filename:
-            subset.to_csv(filename, index=False)
         if filename:
             subset.to_csv(filename, index=False)
             ChrononSplash.show("Export", f"Sélection exportée:\n{len(subset)} lignes")
@@ -0,0 +1,173 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+import numpy as np
+from matplotlib.colors import to_rgba_array
+
+# Below this many points an artist simply gets the raw data
+LOD_THRESHOLD = 5000
+
+
+def m4_indices(x, y, x_min, x_max, n_bins):
+    """
+    M4 decimation of a series sorted by x.
+
+    Keeps, for each of `n_bins` equal-width columns of [x_min, x_max], the
+    first, last, min-y and max-y points. Drawn as a line at n_bins pixels
+    width, the result is visually identical to the raw series.
+    Returns sorted indices into x / y.
+    """
+    lo = np.searchsorted(x, x_min, side="left")
+    hi = np.searchsorted(x, x_max, side="right")
+    # One point either side so lines run to the edge of the view
+    lo, hi = max(lo - 1, 0), min(hi + 1, len(x))
+    if hi - lo <= 4 * n_bins:
+        return np.arange(lo, hi)
+
+    xs, ys = x[lo:hi], y[lo:hi]
+    span = (x_max - x_min) or 1.0
+    bins = np.clip(((xs - x_min) / span * n_bins).astype(np.int64), -1, n_bins)
+    # x is sorted, so every bin is a contiguous run
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    ends = np.r_[starts[1:], len(xs)] - 1
+    counts = ends - starts + 1
+    bin_of = np.repeat(np.arange(len(starts)), counts)
+
+    # First occurrence of each run's min / max value
+    pos = np.arange(len(xs))
+    at_min = ys == np.repeat(np.minimum.reduceat(ys, starts), counts)
+    at_max = ys == np.repeat(np.maximum.reduceat(ys, starts), counts)
+    i_min = np.full(len(starts), -1)
+    i_max = np.full(len(starts), -1)
+    i_min[bin_of[at_min][::-1]] = pos[at_min][::-1]
+    i_max[bin_of[at_max][::-1]] = pos[at_max][::-1]
+
+    keep = np.concatenate([starts, ends, i_min[i_min >= 0], i_max[i_max >= 0]])
+    return lo + np.unique(keep)
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets decimation of a series sorted by x.
+    Keeps n_out points (first and last included). Returns sorted indices.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        b0, b1 = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point)
+        n0, n1 = b1, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[n0:n1].mean(), y[n0:n1].mean()
+        area = np.abs((x[a] - cx) * (y[b0:b1] - y[a]) - (x[a] - x[b0:b1]) * (cy - y[a]))
+        a = b0 + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def pixel_grid_indices(x, y, xlim, ylim, width_px, height_px):
+    """
+    Scatter decimation: one representative point per occupied pixel of the
+    current view. Points outside the view are dropped. Returns sorted indices.
+    """
+    (x0, x1), (y0, y1) = sorted(xlim), sorted(ylim)
+    inside = np.flatnonzero((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
+    if len(inside) <= width_px * height_px // 4:
+        return inside
+
+    ix = ((x[inside] - x0) / ((x1 - x0) or 1.0) * (width_px - 1)).astype(np.int64)
+    iy = ((y[inside] - y0) / ((y1 - y0) or 1.0) * (height_px - 1)).astype(np.int64)
+    cell = ix * height_px + iy
+    first = np.full(width_px * height_px, -1)
+    # Reversed assignment: the first point of each pixel wins
+    first[cell[::-1]] = inside[::-1]
+    return np.sort(first[first >= 0])
+
+
+class LODController:
+    """
+    Keeps a decimated copy of (x, y) in a Matplotlib artist, recomputed for the
+    current axis range and pixel size whenever the view is zoomed or panned.
+
+    - Line2D: M4 (default) or LTTB over x.
+    - PathCollection (scatter): pixel grid, with per-point colors sliced along.
+
+    The raw arrays are never modified, so selection and export keep working on
+    exact data. Call disconnect() before the axes are cleared.
+    """
+
+    def __init__(self, ax, artist, x, y, method=None, colors=None, threshold=LOD_THRESHOLD):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        order = finite[np.argsort(x[finite], kind="stable")]
+        self.index = order # original indices, in x order
+        self.x = x[order]
+        self.y = y[order]
+        self.colors = None if colors is None else to_rgba_array(colors)[order]
+
+        self.ax = ax
+        self.artist = artist
+        self.is_scatter = hasattr(artist, "set_offsets")
+        self.method = method or ("grid" if self.is_scatter else "m4")
+        self.threshold = threshold
+        self.visible = np.arange(len(self.x))
+
+        # Axes limits must cover the raw data, not just what is drawn
+        if len(self.x):
+            ax.update_datalim([[self.x[0], np.min(self.y)], [self.x[-1], np.max(self.y)]])
+            ax.autoscale_view()
+
+        self._cids = [ax.callbacks.connect("xlim_changed", self._on_lim_changed)]
+        if self.is_scatter:
+            self._cids.append(ax.callbacks.connect("ylim_changed", self._on_lim_changed))
+        self.refresh()
+
+    def _on_lim_changed(self, ax):
+        self.refresh()
+        ax.figure.canvas.draw_idle()
+
+    def _pixels(self):
+        bbox = self.ax.bbox
+        return max(int(bbox.width), 100), max(int(bbox.height), 100)
+
+    def refresh(self):
+        n = len(self.x)
+        if n <= self.threshold:
+            idx = np.arange(n)
+        elif self.method == "grid":
+            idx = pixel_grid_indices(self.x, self.y, self.ax.get_xlim(), self.ax.get_ylim(), *self._pixels())
+        elif self.method == "lttb":
+            x0, x1 = sorted(self.ax.get_xlim())
+            lo = max(np.searchsorted(self.x, x0) - 1, 0)
+            hi = min(np.searchsorted(self.x, x1, side="right") + 1, n)
+            idx = lo + lttb_indices(self.x[lo:hi], self.y[lo:hi], 2 * self._pixels()[0])
+        else:
+            x0, x1 = sorted(self.ax.get_xlim())
+            idx = m4_indices(self.x, self.y, x0, x1, self._pixels()[0])
+        self.visible = idx
+
+        if self.is_scatter:
+            self.artist.set_offsets(np.column_stack([self.x[idx], self.y[idx]]))
+            if self.colors is not None:
+                self.artist.set_facecolors(self.colors[idx])
+        else:
+            self.artist.set_data(self.x[idx], self.y[idx])
+
+    def drawn_indices(self):
+        """
+        Original indices of the points currently drawn.
+        """
+        return self.index[self.visible]
+
+    def disconnect(self):
+        for cid in self._cids:
+            self.ax.callbacks.disconnect(cid)
+        self._cids = []
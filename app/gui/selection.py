@@ -0,0 +1,35 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+import numpy as np
+
+class PointIndex:
+    """
+    Sorted-x index over the points of one plot, for rectangle selection.
+
+    Built once per plot (O(n log n)). A query binary-searches the x range and
+    filters y inside that slab only, then returns positional indices into the
+    original arrays (ascending), ready for DataFrame.iloc / take.
+    Non-finite points are never selected.
+    """
+
+    def __init__(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        order = finite[np.argsort(x[finite], kind="stable")]
+        self.order = order
+        self.xs = x[order]
+        self.ys = y[order]
+
+    def __len__(self):
+        return len(self.order)
+
+    def query(self, xmin, xmax, ymin, ymax):
+        lo = np.searchsorted(self.xs, xmin, side="left")
+        hi = np.searchsorted(self.xs, xmax, side="right")
+        ys = self.ys[lo:hi]
+        hits = self.order[lo:hi][(ys >= ymin) & (ys <= ymax)]
+        return np.sort(hits)
@@ -0,0 +1,53 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+"""
+Analyses shared between the GUI screens, memoized in the manager's
+AnalysisCache. Every helper takes the data fingerprint that came with the
+snapshot (manager.snapshot()), so the key always matches the data used.
+Returned objects are shared: do not modify them.
+"""
+import numpy as np
+import pandas as pd
+from chronon_core.stats import calculate_slope_epsilon_phi
+
+def column(df, name, default=0.0):
+    """Numeric column, or a constant one if the log has no such field."""
+    if name in df.columns:
+        return pd.to_numeric(df[name], errors='coerce')
+    return pd.Series(np.full(len(df), default, dtype=float), index=df.index)
+
+def results_frame(manager, data, fingerprint):
+    """
+    DataFrame of a snapshot. manager.snapshot() already returns one (a view
+    on the column log); lists of records are converted once per data state.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+    return manager.cached("frame", fingerprint, (), lambda: pd.DataFrame(data))
+
+def qc_verdict(manager, qc, df, fingerprint):
+    params = tuple(sorted(qc.config.items()))
+    return manager.cached("qc", fingerprint, params, lambda: qc.assess_run(df))
+
+def regression(manager, df, fingerprint, y_col="phi", sx_col=None, subset=None):
+    """
+    calculate_slope_epsilon_phi on Delta_h_m vs y_col (sigma_Y, optional
+    sigma X column). `subset` identifies a filtered view of the log (e.g. a
+    run id range) and is part of the key.
+    """
+    def compute():
+        x = column(df, 'Delta_h_m')
+        sx = column(df, sx_col) if sx_col else None
+        return calculate_slope_epsilon_phi(x, column(df, y_col), column(df, 'sigma_Y', 0.1), sx)
+    return manager.cached("fit", fingerprint, (y_col, sx_col, subset), compute)
+
+def residual_diagnostics(manager, diagnostics, residuals, x, fingerprint, params):
+    """
+    ResidualDiagnostics.run_diagnostics for residuals identified by `params`
+    (the fit they come from).
+    """
+    return manager.cached("diagnostics", fingerprint, params,
+                          lambda: diagnostics.run_diagnostics(residuals, x))
@@ -4,6 +4,8 @@
 # Dev     : Brécheteau.B
 # ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
 
+from chronon_core.messages import catalog
+
 TRANSLATIONS = {
     "fr": {
         "SIDEBAR": {
@@ -63,6 +65,7 @@ TRANSLATIONS = {
             "BTN_APPLY": "Appliquer",
             "CHK_OVERLAY": "Overlay Multi-runs",
             "CHK_ERRORBARS": "Barres d'erreur",
+            "CHK_STREAMING": "Mode streaming",
             "LBL_FILTER": "Filtre (Run ID)",
             "PLOT_TYPES": ["Régression Centrale (εΦ)", "Série Temporelle", "Résidus Δy", "Corrélation T2/Φ", "Heatmap", "Histogramme"]
         },
@@ -95,7 +98,8 @@ TRANSLATIONS = {
             "BTN_DELETE": "Supprimer",
             "BTN_REFRESH": "Actualiser",
             "COL_DATE": "Date/Heure",
-            "COL_SAMPLES": "N Points"
+            "COL_SAMPLES": "N Points",
+            "FILTER_PLACEHOLDER": "Filtrer (ID, date, scénario...)"
         },
         "HELP": {
             "TITLE": "Documentation & Théorie",
@@ -130,63 +134,6 @@ Masquage des résultats pour intégrité.
 QC: Valide | Diag: Fiabilise | T2: Qubits | Power: Sensibilité | Blind: Intégrité.
 """
         },
-        "INTERPRETATION": {
-            "STRONG": "DÉTECTION FORTE",
-            "WEAK": "DÉTECTION VALIDÉE",
-            "TRACE": "AMBIGU / TRACE",
-            "NULL": "NON-DÉTECTION",
-            "EVAL_STRONG": "Signal hautement significatif (p < 0.001).",
-            "EVAL_WEAK": "Signal significatif (p < 0.05).",
-            "EVAL_TRACE": "Indice de signal non-concluant (0.05 < p < 0.10).",
-            "EVAL_NULL": "Dominance du bruit. Aucune corrélation significative.",
-            "NOTE_QC_FAIL": " NOTE: Données potentiellement corrompues (voir QC).",
-            "DIAG_OK": "Diagnostics OK.",
-            "DIAG_WARN": "ATTENTION: ",
-            "QC_STATUS": "Statut QC",
-            "SLOPE_OBS": "Pente observée",
-            "INTENSITY": "Intensité",
-            "MODEL_RELIABILITY": "Fiabilité Modèle",
-            "RECOMMENDATION": "Recommandation",
-            "REC_PUBLISH": "Publier",
-            "REC_CHECK": "Augmenter N ou vérifier Setup",
-            "PUB_TEMPLATE": (
-                "Analyse de régression pondérée (N={n}). "
-                "Contrôle qualité: {qc_res} (Statut: {qc_status}). "
-                "Résultat: corrélation {sig_word} (pente εΦ = {slope:.2e} ± {stderr:.2e}, p = {pval:.4g}). "
-                "Diagnostics: {diag_res}."
-            ),
-            "PUB_TERMS": {
-                "passed": "validés",
-                "failed": "échoués",
-                "significant": "significative",
-                "non-significant": "non-significative",
-                "confirmed": "confirmé",
-                "issues": "problèmes potentiels"
-            },
-            "CONCLUSION_LABEL": "CONCLUSION",
-            "EVALUATION_LABEL": "EVALUATION",
-            "PUBLICATION_LABEL": "PUBLICATION"
-        },
-        "REPORT": {
-            "TITLE": "RAPPORT D'ANALYSE SCIENTIFIQUE",
-            "GENERATED_ON": "Généré le",
-            "MAIN_RESULT": "RÉSULTAT PRINCIPAL (εΦ)",
-            "DETAILED_STATS": "STATISTIQUES DÉTAILLÉES",
-            "METADATA": "MÉTADONNÉES",
-            "AUTO_DESC_TITLE": "RAPPORT AUTOMATISÉ DÉTAILLÉ",
-            "DISCLAIMER": "Généré automatiquement par CHRONON System V1.0 - Certification interne.",
-            "Visualisation": "VISUALISATION",
-            "DIAGNOSTICS": "DIAGNOSTICS & QUALITÉ",
-            "RESIDUALS_TESTS": "Tests Statistiques sur Résidus",
-            "HIST_TITLE": "Distribution des Résidus",
-            "QQ_HINT": "Distribution normale centrée sur 0 = Modèle sain.",
-            "TABLE_METRIC": "Métrique",
-            "TABLE_VALUE": "Valeur",
-            "TABLE_DESC": "Description",
-            "TABLE_TEST": "Test",
-            "TABLE_STAT": "Statistique",
-            "TABLE_RESULT": "Résultat"
-        },
         "COMMON": {
             "ERROR": "Erreur",
             "SUCCESS": "Succès",
@@ -251,6 +198,7 @@ QC: Valide | Diag: Fiabilise | T2: Qubits | Power: Sensibilité | Blind: Intégr
             "BTN_APPLY": "Apply",
             "CHK_OVERLAY": "Multi-run Overlay",
             "CHK_ERRORBARS": "Error Bars",
+            "CHK_STREAMING": "Live streaming",
             "LBL_FILTER": "Filter (Run ID)",
             "PLOT_TYPES": ["Central Regression (εΦ)", "Time Series", "Residuals Δy", "Correlation T2/Φ", "Heatmap", "Histogram"]
         },
@@ -283,7 +231,8 @@ QC: Valide | Diag: Fiabilise | T2: Qubits | Power: Sensibilité | Blind: Intégr
             "BTN_DELETE": "Delete",
             "BTN_REFRESH": "Refresh",
             "COL_DATE": "Date/Time",
-            "COL_SAMPLES": "N Points"
+            "COL_SAMPLES": "N Points",
+            "FILTER_PLACEHOLDER": "Filter (ID, date, scenario...)"
         },
         "HELP": {
             "TITLE": "Documentation & Theory",
@@ -318,63 +267,6 @@ Integrity protection.
 QC: Validate | Diag: Secure | T2: Analyze | Power: Justify | Blind: Integrity.
 """
         },
-        "INTERPRETATION": {
-            "STRONG": "STRONG DETECTION",
-            "WEAK": "VALIDATED DETECTION",
-            "TRACE": "AMBIGUOUS / TRACE",
-            "NULL": "NON-DETECTION",
-            "EVAL_STRONG": "Highly significant signal (p < 0.001).",
-            "EVAL_WEAK": "Significant signal (p < 0.05).",
-            "EVAL_TRACE": "Inconclusive (0.05 < p < 0.10).",
-            "EVAL_NULL": "Noise dominance. No correlation.",
-            "NOTE_QC_FAIL": " NOTE: Potentially corrupted (see QC).",
-            "DIAG_OK": "Diagnostics OK.",
-            "DIAG_WARN": "WARNING: ",
-            "QC_STATUS": "QC Status",
-            "SLOPE_OBS": "Observed Slope",
-            "INTENSITY": "Intensity",
-            "MODEL_RELIABILITY": "Model Reliability",
-            "RECOMMENDATION": "Recommendation",
-            "REC_PUBLISH": "Publish",
-            "REC_CHECK": "Increase N or check Setup",
-            "PUB_TEMPLATE": (
-                "Weighted regression (N={n}). "
-                "QC: {qc_res} (Status: {qc_status}). "
-                "Result: {sig_word} correlation (εΦ = {slope:.2e} ± {stderr:.2e}, p = {pval:.4g}). "
-                "Diagnostics: {diag_res}."
-            ),
-            "PUB_TERMS": {
-                "passed": "passed",
-                "failed": "failed",
-                "significant": "significant",
-                "non-significant": "non-significant",
-                "confirmed": "confirmed",
-                "issues": "potential issues"
-            },
-            "CONCLUSION_LABEL": "CONCLUSION",
-            "EVALUATION_LABEL": "EVALUATION",
-            "PUBLICATION_LABEL": "PUBLICATION"
-        },
-        "REPORT": {
-            "TITLE": "SCIENTIFIC ANALYSIS REPORT",
-            "GENERATED_ON": "Generated on",
-            "MAIN_RESULT": "MAIN RESULT (εΦ)",
-            "DETAILED_STATS": "DETAILED STATISTICS",
-            "METADATA": "METADATA",
-            "AUTO_DESC_TITLE": "DETAILED AUTOMATED REPORT",
-            "DISCLAIMER": "Generated by CHRONON System V1.0 - Internal Certification.",
-            "Visualisation": "VISUALIZATION",
-            "DIAGNOSTICS": "DIAGNOSTICS & QUALITY",
-            "RESIDUALS_TESTS": "Residual Statistical Tests",
-            "HIST_TITLE": "Residuals Distribution",
-            "QQ_HINT": "Normal dist centered on 0 = Healthy model.",
-            "TABLE_METRIC": "Metric",
-            "TABLE_VALUE": "Value",
-            "TABLE_DESC": "Description",
-            "TABLE_TEST": "Test",
-            "TABLE_STAT": "Statistic",
-            "TABLE_RESULT": "Result"
-        },
         "COMMON": {
             "ERROR": "Error",
             "SUCCESS": "Success",
@@ -383,6 +275,10 @@ QC: Validate | Diag: Secure | T2: Analyze | Power: Justify | Blind: Integrity.
     }
 }
 
+# Scientific texts (interpretation, PDF report) come from the core catalog
+for _lang, _sections in TRANSLATIONS.items():
+    _sections.update(catalog(_lang))
+
 # (~ ~ ~ Φ(x) ~ ~ ~
 #  Benjamin Brécheteau | Chronon Field 2025
 #  ~ ~ ~ ~ ~)
@@ -0,0 +1,65 @@
+"""
+Usage:
+    python -m benchmarks run [--max-size 100000] [--only NAME ...] [--label L]
+    python -m benchmarks compare [--baseline LABEL_OR_COMMIT] [--threshold 0.2]
+"""
+import argparse
+import sys
+import warnings
+
+from benchmarks.harness import DEFAULT_HISTORY, run_suite, append_history, load_history, select_entries, compare
+from benchmarks.suite import BENCHMARKS, SIZES
+
+
+def main():
+    p = argparse.ArgumentParser(prog="python -m benchmarks", description="chronon_core benchmark suite")
+    p.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run", help="Run the suite and append the results to the history")
+    r.add_argument("--max-size", type=int, default=10**5, help="Largest input size (up to 10^7)")
+    r.add_argument("--only", nargs="*", choices=sorted(BENCHMARKS), help="Subset of benchmarks")
+    r.add_argument("--label", default=None, help="Tag for this entry (e.g. 'v1.0.0')")
+    r.add_argument("--min-time", type=float, default=0.2)
+    r.add_argument("--repeat", type=int, default=5)
+
+    c = sub.add_parser("compare", help="Compare the latest entry against a baseline")
+    c.add_argument("--baseline", default=None, help="Label or git commit prefix (default: previous entry)")
+    c.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown flagged as a regression")
+
+    sub.add_parser("list", help="List benchmarks and their size caps")
+
+    args = p.parse_args()
+
+    if args.cmd == "list":
+        for name, spec in sorted(BENCHMARKS.items()):
+            print(f"{name:<24} max_size={spec['max_size']:.0e}")
+
+    elif args.cmd == "run":
+        # Deprecation chatter from pandas would drown the timing lines
+        warnings.simplefilter("ignore", FutureWarning)
+        sizes = [n for n in SIZES if n <= args.max_size]
+        results = run_suite(BENCHMARKS, sizes, names=args.only, min_time=args.min_time, repeat=args.repeat)
+        append_history(args.history, results, label=args.label)
+        print(f"Appended {len(results)} results to {args.history}")
+
+    elif args.cmd == "compare":
+        try:
+            baseline, current = select_entries(load_history(args.history), args.baseline)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(2)
+        rows = compare(baseline, current, threshold=args.threshold)
+        print(f"baseline: {baseline['git_commit'][:10]} ({baseline['timestamp']})")
+        print(f"current:  {current['git_commit'][:10]} ({current['timestamp']})")
+        for key, base, cur, ratio, status in rows:
+            print(f"{key:<36} {base:>12.6f}s {cur:>12.6f}s  x{ratio:5.2f}  {status}")
+        n_reg = sum(1 for row in rows if row[4] == "REGRESSION")
+        if n_reg:
+            print(f"{n_reg} regression(s) beyond {args.threshold:.0%}")
+            sys.exit(1)
+        print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Timing loop, JSON history and regression comparison for the benchmark suite.
+"""
+import gc
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(__file__), "history.json")
+
+
+def machine_fingerprint():
+    """
+    Timings are only comparable on the same machine and interpreter.
+    """
+    return {
+        "machine": platform.node(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def git_rev():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return "unknown"
+
+
+def time_callable(fn, min_time=0.2, repeat=5):
+    """
+    asv-style timing: calibrate a loop count so one sample lasts at least
+    `min_time`, then take `repeat` samples. Returns per-call seconds.
+    """
+    gc.collect()
+    t0 = time.perf_counter()
+    fn()
+    single = time.perf_counter() - t0
+    number = max(1, int(min_time / single)) if single > 0 else 1000
+
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    # A single call over ~min_time is already a stable sample
+    return {
+        "min_s": min(samples),
+        "median_s": float(np.median(samples)),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def time_benchmark(spec, n, min_time=0.2, repeat=5):
+    """
+    Sets up and times one benchmark at size n. Setups that write files get
+    a temporary directory, removed after timing.
+    """
+    if not spec.get("tmpdir"):
+        return time_callable(spec["setup"](n), min_time=min_time, repeat=repeat)
+    with tempfile.TemporaryDirectory(prefix="chronon_bench_") as tmp:
+        return time_callable(spec["setup"](n, tmp), min_time=min_time, repeat=repeat)
+
+
+def run_suite(benchmarks, sizes, names=None, min_time=0.2, repeat=5, log=print):
+    results = {}
+    for name, spec in benchmarks.items():
+        if names and name not in names:
+            continue
+        for n in sizes:
+            if n > spec["max_size"]:
+                continue
+            r = time_benchmark(spec, n, min_time=min_time, repeat=repeat)
+            results[f"{name}[{n}]"] = r
+            log(f"{name:<24} n={n:<9} min={r['min_s']:.6f}s median={r['median_s']:.6f}s")
+    return results
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def append_history(path, results, label=None):
+    history = load_history(path)
+    history.append({
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_rev(),
+        "label": label,
+        "fingerprint": machine_fingerprint(),
+        "results": results,
+    })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+    return history
+
+
+def compare(baseline, current, threshold=0.2):
+    """
+    Compares min per-call times of two history entries.
+    Returns rows (key, base_s, cur_s, ratio, status) where status is
+    REGRESSION above 1 + threshold and IMPROVED below 1 / (1 + threshold).
+    """
+    rows = []
+    for key in sorted(set(baseline["results"]) & set(current["results"])):
+        base = baseline["results"][key]["min_s"]
+        cur = current["results"][key]["min_s"]
+        ratio = cur / base if base > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+        elif ratio < 1 / (1 + threshold):
+            status = "IMPROVED"
+        else:
+            status = "ok"
+        rows.append((key, base, cur, ratio, status))
+    return rows
+
+
+def select_entries(history, baseline=None):
+    """
+    Latest entry vs. the baseline: an entry whose label or git commit starts
+    with `baseline`, else the previous entry from the same machine.
+    """
+    if not history:
+        raise ValueError("Benchmark history is empty. Run the suite first.")
+    current = history[-1]
+    candidates = [h for h in history[:-1] if h["fingerprint"] == current["fingerprint"]]
+    if baseline is not None:
+        candidates = [h for h in candidates
+                      if h.get("label") == baseline or h.get("git_commit", "").startswith(baseline)]
+    if not candidates:
+        raise ValueError("No comparable baseline entry (same machine fingerprint) in history.")
+    return candidates[-1], current
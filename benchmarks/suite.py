@@ -0,0 +1,139 @@
+"""
+Benchmark definitions for chronon_core hot paths.
+
+Each benchmark is a setup function taking the input size n and returning a
+zero-argument callable that runs the code under test. Inputs are generated
+from a fixed-seed numpy Generator, so every machine times the same data.
+Setups registered with tmpdir=True also receive a scratch directory, owned
+by the harness and removed once the benchmark has been timed.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from chronon_core import stats, windowing, ablations, io, toy
+from chronon_core.diagnostics import ResidualDiagnostics
+from chronon_core.ledger import Ledger
+
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6, 10**7]
+SEED = 20250101
+
+BENCHMARKS = {}
+
+
+def benchmark(max_size=10**7, tmpdir=False):
+    """
+    Registers a setup function. `max_size` caps the sizes where a single
+    call would take minutes (bootstraps, optimizers, CSV parsing); with
+    `tmpdir` the setup is called as setup(n, tmpdir) for its files.
+    """
+    def register(setup):
+        BENCHMARKS[setup.__name__] = {"setup": setup, "max_size": max_size, "tmpdir": tmpdir}
+        return setup
+    return register
+
+
+def _linear_data(n):
+    rng = np.random.default_rng(SEED)
+    X = np.linspace(-1.0, 1.0, n)
+    sigma_Y = np.full(n, 0.1)
+    Y = 0.5 * X + rng.normal(0, 0.1, n)
+    return X, Y, sigma_Y
+
+
+@benchmark()
+def fit_free_intercept_wls(n):
+    X, Y, sigma_Y = _linear_data(n)
+    return lambda: stats.fit_free_intercept_wls(X, Y, sigma_Y)
+
+
+@benchmark()
+def newey_west_se(n):
+    X, Y, sigma_Y = _linear_data(n)
+    X_mat = np.column_stack([np.ones(n), X])
+    residuals = Y - 0.5 * X
+    L = stats.compute_andrews_bandwidth(residuals)
+    return lambda: stats.newey_west_se(X_mat, residuals, L)
+
+
+@benchmark(max_size=10**5)
+def wild_bootstrap(n):
+    X, Y, sigma_Y = _linear_data(n)
+
+    def run():
+        np.random.seed(SEED)
+        stats.wild_bootstrap(X, Y, sigma_Y, n_boot=200)
+    return run
+
+
+@benchmark(max_size=10**4)
+def deming_branch(n):
+    X, Y, sigma_Y = _linear_data(n)
+    X = X + 2.0  # keep |X| away from 0 so the relative-uncertainty switch fires
+    sigma_X = np.full(n, 0.5)
+
+    def run():
+        np.random.seed(SEED)
+        stats.calculate_slope_epsilon_phi(X, Y, sigma_Y, sigma_X=sigma_X)
+    return run
+
+
+@benchmark()
+def compute_windows(n):
+    rng = np.random.default_rng(SEED)
+    df = pd.DataFrame({
+        'timestamp_UTC': pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(n), unit='s'),
+        'X_GR': rng.normal(0, 1, n),
+        'Y_res': rng.normal(0, 1, n),
+        'sigma_X': np.full(n, 0.1),
+        'sigma_Y': np.full(n, 0.1),
+        'site_pair': "A-B",
+    })
+    return lambda: windowing.compute_windows(df, window_sec=120)
+
+
+@benchmark()
+def calc_allan_stats(n):
+    rng = np.random.default_rng(SEED)
+    df = pd.DataFrame({'Y_res': rng.normal(0, 1e-15, n)})
+    return lambda: windowing.calc_allan_stats(df)
+
+
+@benchmark(max_size=10**5)
+def run_permutation_test(n):
+    X, Y, sigma_Y = _linear_data(n)
+
+    def run():
+        np.random.seed(SEED)
+        ablations.run_permutation_test(X, Y, sigma_Y, n_perms=200)
+    return run
+
+
+@benchmark(max_size=10**6)
+def run_diagnostics(n):
+    X, Y, _ = _linear_data(n)
+    residuals = Y - 0.5 * X
+    return lambda: ResidualDiagnostics.run_diagnostics(residuals, X)
+
+
+@benchmark(max_size=10**6, tmpdir=True)
+def load_raw_csv(n, tmp):
+    path = os.path.join(tmp, "raw.csv")
+    toy.write_toy_csv(toy.generate_toy_frame(n_samples=n, seed=SEED), path)
+    return lambda: io.load_raw_csv(path)
+
+
+@benchmark(max_size=10**5, tmpdir=True)
+def ledger_append_run(n, tmp):
+    """n = number of rows already in the ledger."""
+    ledger_path = os.path.join(tmp, "ledger.csv")
+    ledger = Ledger(ledger_path)
+    with open(ledger_path, "a", newline='') as f:
+        row = "2025-01-01T00:00:00,RUN,NULL,cfg,code,ledger_row.json,hash,bench,\n"
+        f.write(row * n)
+    counter = iter(range(10**9))
+    return lambda: ledger.append_run(
+        run_id=f"BENCH_{next(counter)}", verdict="NULL", config_hash="cfg", code_hash="code",
+        row_data={'slope': 0.0, 'stderr': 1.0}, operator="bench",
+    )
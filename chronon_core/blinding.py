@@ -1,60 +1,219 @@
-import hashlib
+import os
 import json
 import uuid
+import hmac
+import hashlib
+import datetime
+
+import numpy as np
+import pandas as pd
+
+# Shortest blind label; lengthened only if two labels of a column collide
+BLIND_LABEL_LEN = 8
+
+
+class MappingStore:
+    """
+    Keyed on-disk store of blinding mappings: one JSON file per mapping id,
+    <root>/<mapping_id>.json, so a campaign blinded in one session can be
+    re-blinded identically or unblinded in another.
+
+    Each column is stored as two parallel lists (blind labels, original
+    labels) in category order. The original labels are in clear text: the
+    directory is created 0700 and the files 0600, so the mappings are only
+    as private as the account that owns them. Keep root out of shared or
+    synced folders.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, mapping_id):
+        # mapping ids are used as file names: no path separators
+        if not mapping_id or os.path.basename(mapping_id) != mapping_id:
+            raise ValueError(f"Invalid mapping ID: {mapping_id!r}")
+        return os.path.join(self.root, f"{mapping_id}.json")
+
+    def load(self, mapping_id):
+        """
+        Stored record for mapping_id, or None if unknown or unreadable.
+        """
+        path = self._path(mapping_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def store(self, mapping_id, record):
+        path = self._path(mapping_id)
+        os.makedirs(self.root, mode=0o700, exist_ok=True)
+        # Write then rename so an interrupted save never leaves a half mapping
+        tmp = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(record, f, sort_keys=True, default=str)
+        os.replace(tmp, path)
+
+    def list_ids(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.root) if name.endswith(".json"))
+
 
 class BlindingManager:
-    def __init__(self, key_salt):
+    """
+    Salted label blinding on categorical codes.
+
+    Only the categories of each blinded column are hashed and renamed; the
+    row codes are shared with the input (categorical columns) or computed
+    once by pd.factorize (other columns). Other columns of the frame are
+    never copied. Mappings are kept per session only, unless the caller
+    passes a store_dir: they are then persisted in a MappingStore there,
+    with the original labels readable by anyone who can read that
+    directory. Stored records carry an HMAC keyed on the salt, so a
+    modified mapping is refused instead of unblinding to wrong labels.
+    """
+
+    COLUMNS = ('site_pair_label', 'link_type')
+
+    def __init__(self, key_salt, store_dir=None):
         self.salt = key_salt
-        self._mapping = {} # Internal storage for active session
-        
-    def blind_labels(self, df):
+        self._mapping = {} # Session cache: mapping_id -> {col: {blind: original}}
+        self.store = MappingStore(store_dir) if store_dir is not None else None
+
+    @property
+    def key_id(self):
+        """Identifies the salt in stored mappings without revealing it."""
+        return self._hash_val("")[:16]
+
+    # --- Mapping storage ---
+
+    def _get_mapping(self, mapping_id):
+        if mapping_id in self._mapping:
+            return self._mapping[mapping_id]
+        record = self.store.load(mapping_id) if self.store is not None else None
+        if record is None:
+            return None
+        if record.get("key_id") != self.key_id:
+            raise ValueError(f"Mapping {mapping_id} was created with a different key")
+        if not hmac.compare_digest(str(record.get("mac", "")), self._mac(mapping_id, record["columns"])):
+            raise ValueError(f"Mapping {mapping_id} failed its integrity check")
+        mapping = {col: dict(zip(c["blind"], c["original"])) for col, c in record["columns"].items()}
+        self._mapping[mapping_id] = mapping
+        return mapping
+
+    def _save_mapping(self, mapping_id, mapping):
+        self._mapping[mapping_id] = mapping
+        if self.store is None:
+            return
+        columns = {col: {"blind": list(m), "original": list(m.values())} for col, m in mapping.items()}
+        # Sign what will be read back: labels as they come out of the JSON file
+        columns = json.loads(json.dumps(columns, default=str))
+        self.store.store(mapping_id, {
+            "id": mapping_id,
+            "key_id": self.key_id,
+            "updated": datetime.datetime.now().isoformat(),
+            "columns": columns,
+            "mac": self._mac(mapping_id, columns),
+        })
+
+    def _mac(self, mapping_id, columns):
+        """HMAC-SHA256 of a stored mapping, keyed on the salt."""
+        payload = json.dumps([mapping_id, columns], sort_keys=True, default=str)
+        return hmac.new(str(self.salt).encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+    # --- Categorical helpers ---
+
+    @staticmethod
+    def _codes(series):
+        """(codes, categories) of a column; no row work for categoricals."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.array.codes, series.cat.categories
+        codes, categories = pd.factorize(series, use_na_sentinel=True)
+        return codes, categories
+
+    @staticmethod
+    def _with_categories(codes, categories, index, name):
+        cat = pd.Categorical.from_codes(codes, categories=categories, validate=False)
+        return pd.Series(cat, index=index, name=name, copy=False)
+
+    def _blind_categories(self, values, col_map):
+        """
+        Blind label of each category, reusing col_map (blind -> original)
+        and adding the categories it does not know yet.
+        """
+        known = {orig: blind for blind, orig in col_map.items()}
+        new = [v for v in values if v not in known]
+        if new:
+            digests = [self._hash_val(v) for v in new]
+            size = BLIND_LABEL_LEN
+            while True:
+                labels = [d[:size] for d in digests]
+                if len(set(labels)) == len(labels) and not set(labels) & col_map.keys():
+                    break
+                size += 4
+            for v, label in zip(new, labels):
+                col_map[label] = v
+                known[v] = label
+        return [known[v] for v in values]
+
+    # --- Public API ---
+
+    def blind_labels(self, df, mapping_id=None, columns=None, inplace=False):
         """
         Blinds Delta_h labels and link types.
         Returns: blinded_df, mapping_id
+
+        Passing an existing mapping_id reuses its labels (same original ->
+        same blind label across runs) and extends it with new values.
+        With inplace=True the blinded columns replace those of df.
         """
-        blinded = df.copy()
-        
-        # New mapping for this session
-        mapping_id = str(uuid.uuid4())
-        current_map = {}
-        
-        cols_to_blind = ['site_pair_label', 'link_type']
-        
-        for col in cols_to_blind:
-            if col in blinded.columns:
-                # Create unique map for each unique value
-                unique_vals = blinded[col].unique()
-                col_map = {}
-                for val in unique_vals:
-                    # Deterministic hash but salted
-                    blind_val = self._hash_val(val)[:8] # Short hash
-                    col_map[blind_val] = val
-                    
-                # Apply map (invert it for apply)
-                # We need val -> blind_val
-                val_to_blind = {v: k for k, v in col_map.items()}
-                blinded[col] = blinded[col].map(val_to_blind)
-                
-                current_map[col] = col_map
-                
-        self._mapping[mapping_id] = current_map
+        columns = self.COLUMNS if columns is None else columns
+        mapping = None
+        if mapping_id is not None:
+            mapping = self._get_mapping(mapping_id)
+        if mapping is None:
+            mapping_id = mapping_id or str(uuid.uuid4())
+            mapping = {}
+
+        # Shallow copy: data columns are shared, only blinded ones are replaced
+        blinded = df if inplace else df.copy(deep=False)
+        for col in columns:
+            if col not in blinded.columns:
+                continue
+            codes, categories = self._codes(blinded[col])
+            col_map = mapping.setdefault(col, {})
+            labels = self._blind_categories(categories.tolist(), col_map)
+            blinded[col] = self._with_categories(codes, labels, blinded.index, col)
+
+        self._save_mapping(mapping_id, mapping)
         return blinded, mapping_id
 
-    def unblind_labels(self, blinded_df, mapping_id):
+    def unblind_labels(self, blinded_df, mapping_id, inplace=False):
         """
         Restores original labels using the mapping_id.
         """
-        if mapping_id not in self._mapping:
+        mapping = self._get_mapping(mapping_id)
+        if mapping is None:
             raise ValueError("Invalid or expired mapping ID")
-            
-        unblinded = blinded_df.copy()
-        mapping = self._mapping[mapping_id]
-        
+
+        unblinded = blinded_df if inplace else blinded_df.copy(deep=False)
         for col, col_map in mapping.items():
-            if col in unblinded.columns:
-                # col_map is blind -> original
-                unblinded[col] = unblinded[col].map(col_map)
-                
+            if col not in unblinded.columns:
+                continue
+            codes, categories = self._codes(unblinded[col])
+            known = [label in col_map for label in categories]
+            originals = [col_map[label] for label, k in zip(categories, known) if k]
+            if not all(known):
+                # Unknown blind labels come back as missing, as with Series.map
+                remap = np.cumsum(known) - 1
+                remap[~np.asarray(known, dtype=bool)] = -1
+                codes = np.where(codes >= 0, remap[codes.clip(0)], -1)
+            unblinded[col] = self._with_categories(codes, originals, unblinded.index, col)
+
         return unblinded
 
     def _hash_val(self, val):
@@ -67,4 +226,3 @@ class BlindingManager:
         """
         s = json.dumps(config_dict, sort_keys=True)
         return hashlib.sha256(s.encode()).hexdigest()
-
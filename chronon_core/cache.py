@@ -0,0 +1,83 @@
+import os
+import json
+import pickle
+import hashlib
+import inspect
+
+# Pipeline stages in execution order. A stage key chains the key of the
+# stage before it, so invalidating one stage invalidates everything after it.
+STAGES = ("load", "preprocess", "windowing", "fit")
+
+DEFAULT_CACHE_DIR = ".chronon_cache"
+
+
+def hash_config(subtree) -> str:
+    """
+    Stable SHA-256 of a config sub-tree (dict/list/scalar).
+    """
+    s = json.dumps(subtree, sort_keys=True, default=str)
+    return hashlib.sha256(s.encode('utf-8')).hexdigest()
+
+
+def hash_code(*objects) -> str:
+    """
+    SHA-256 over the source files of the given modules/functions.
+    Accepts module objects or plain file paths.
+    """
+    h = hashlib.sha256()
+    for obj in objects:
+        path = obj if isinstance(obj, str) else inspect.getsourcefile(obj)
+        if path is None or not os.path.exists(path):
+            h.update(b"<missing>")
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+class StageCache:
+    """
+    Content-addressed store for pipeline stage outputs.
+
+    Each entry lives at <root>/<stage>/<key>.pkl where
+    key = sha256(input_hash, config_hash, code_hash).
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, enabled=True):
+        self.root = root
+        self.enabled = enabled
+
+    @staticmethod
+    def make_key(stage, input_hash, config_subtree, code_hash) -> str:
+        parts = [stage, input_hash, hash_config(config_subtree), code_hash]
+        return hashlib.sha256("|".join(parts).encode('utf-8')).hexdigest()
+
+    def _path(self, stage, key):
+        return os.path.join(self.root, stage, f"{key}.pkl")
+
+    def load(self, stage, key):
+        """
+        Returns (hit, value). A corrupt or unreadable entry counts as a miss.
+        """
+        if not self.enabled:
+            return False, None
+        path = self._path(stage, key)
+        if not os.path.exists(path):
+            return False, None
+        try:
+            with open(path, "rb") as f:
+                return True, pickle.load(f)
+        except Exception:
+            return False, None
+
+    def store(self, stage, key, value):
+        if not self.enabled:
+            return
+        path = self._path(stage, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so an interrupted run never leaves a half entry
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
@@ -1,6 +1,8 @@
 import argparse
 import sys
 from chronon_core.reproduce import run_reproduce
+from chronon_core.cache import STAGES
+from chronon_core.sweep import run_sweep
 
 def main():
     p = argparse.ArgumentParser(prog="chronon1", description="CHRONON-1 Scientific Pipeline")
@@ -9,6 +11,20 @@ def main():
     # reproduce command
     r = sub.add_parser("reproduce", help="Run reproducible pipeline end-to-end")
     r.add_argument("--config", required=True, help="Path to YAML config")
+    r.add_argument("--force", action="store_true", help="Ignore the stage cache and recompute every stage")
+    r.add_argument("--from-stage", choices=STAGES, default=None,
+                   help="Recompute this stage and all later ones, reusing cached earlier stages")
+    r.add_argument("--profile", action="store_true",
+                   help="Capture cProfile and tracemalloc data (profile.pstats, profile_top.txt)")
+
+    # sweep command
+    s = sub.add_parser("sweep", help="Run the reproducible pipeline over a grid of config overrides")
+    s.add_argument("--config", required=True, help="Path to the base YAML config")
+    s.add_argument("--axis", action="append", required=True, metavar="KEY=V1,V2,...",
+                   help="Parameter axis, dotted keys for nested values (e.g. analysis.n_boot=500,1000). Repeatable.")
+    s.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    s.add_argument("--out-dir", default=None, help="Output directory (default: <out_dir>/sweep)")
+    s.add_argument("--force", action="store_true", help="Ignore the stage cache and recompute every stage")
 
     # validate command (placeholder as requested)
     v = sub.add_parser("validate", help="Validate a dataset against the protocol schemas")
@@ -18,11 +34,18 @@ def main():
     
     if args.cmd == "reproduce":
         try:
-            run_reproduce(args.config)
+            run_reproduce(args.config, force=args.force, from_stage=args.from_stage, profile=args.profile)
         except Exception as e:
             print(f"Error during reproduction: {e}")
             sys.exit(1)
             
+    elif args.cmd == "sweep":
+        try:
+            run_sweep(args.config, args.axis, out_dir=args.out_dir, workers=args.workers, force=args.force)
+        except Exception as e:
+            print(f"Error during sweep: {e}")
+            sys.exit(1)
+
     elif args.cmd == "validate":
         print(f"Validation not yet implemented for {args.path}")
 
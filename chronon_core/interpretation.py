@@ -4,7 +4,7 @@
 # Dev     : Brécheteau.B
 # ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
 
-from app.gui.translations import TRANSLATIONS
+from chronon_core.messages import messages
 
 class ScientificInterpreter:
     """
@@ -16,7 +16,7 @@ class ScientificInterpreter:
         """
         Main entry point for interpretation.
         """
-        t = TRANSLATIONS[lang]["INTERPRETATION"]
+        t = messages(lang, "INTERPRETATION")
         
         result = {
             'conclusion_short': "",
@@ -1,6 +1,12 @@
-import pandas as pd
+import io
+import hashlib
 import logging
 
+import pandas as pd
+
+# Block size for buffered hashing writes and reads
+HASH_BLOCK = 1 << 20
+
 REQUIRED_HEADERS = [
     "timestamp_UTC", "site_id", "site_pair", "site_pair_label", "pair_orientation",
     "operator_id", "run_id", "height_m", "Delta_h_m", "y_frac",
@@ -16,6 +22,40 @@ DERIVED_HEADERS = [
     "X_GR", "Delta_lnPhi", "Y_res", "sigma_X", "sigma_Y", "band_id"
 ]
 
+class HashingWriter(io.RawIOBase):
+    """
+    Binary sink that SHA-256 hashes every byte on its way to `raw`, so a
+    file is hashed while it is written instead of being read back.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.hasher.update(data)
+        self.raw.write(data)
+        self.size += len(data)
+        return len(data)
+
+    def hexdigest(self):
+        return self.hasher.hexdigest()
+
+
+def write_csv_hashed(df, raw):
+    """
+    Streams `df` as UTF-8 CSV (no index) into the binary file `raw`.
+    Returns the SHA-256 of the bytes written.
+    """
+    hashed = HashingWriter(raw)
+    with io.TextIOWrapper(io.BufferedWriter(hashed, HASH_BLOCK), encoding="utf-8", newline="") as f:
+        df.to_csv(f, index=False)
+    return hashed.hexdigest()
+
 def load_raw_csv(filepath):
     """
     Loads a raw measurement CSV and validates its schema strictly.
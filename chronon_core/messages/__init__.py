@@ -0,0 +1,32 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+"""
+Message catalog of the scientific core (interpretation, PDF report).
+
+One module per language (chronon_core/messages/<lang>.py, compiled to
+bytecode by the import system), imported on first use and kept for the
+life of the process. The GUI merges these sections into its own
+TRANSLATIONS table; the core never imports app.gui.
+"""
+import importlib
+from functools import lru_cache
+
+LANGUAGES = ("fr", "en")
+DEFAULT_LANG = "fr"
+
+@lru_cache(maxsize=None)
+def catalog(lang=DEFAULT_LANG):
+    """
+    {section: {key: text}} for one language. Raises KeyError for an
+    unknown language, as TRANSLATIONS[lang] did.
+    """
+    if lang not in LANGUAGES:
+        raise KeyError(lang)
+    return importlib.import_module(f"{__name__}.{lang}").MESSAGES
+
+def messages(lang, section):
+    """One section of the catalog, e.g. messages("en", "REPORT")."""
+    return catalog(lang)[section]
@@ -0,0 +1,68 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+"""
+Core message catalog, English: texts used by the interpretation and the PDF report.
+"""
+
+MESSAGES = {
+    "INTERPRETATION": {
+        "STRONG": "STRONG DETECTION",
+        "WEAK": "VALIDATED DETECTION",
+        "TRACE": "AMBIGUOUS / TRACE",
+        "NULL": "NON-DETECTION",
+        "EVAL_STRONG": "Highly significant signal (p < 0.001).",
+        "EVAL_WEAK": "Significant signal (p < 0.05).",
+        "EVAL_TRACE": "Inconclusive (0.05 < p < 0.10).",
+        "EVAL_NULL": "Noise dominance. No correlation.",
+        "NOTE_QC_FAIL": " NOTE: Potentially corrupted (see QC).",
+        "DIAG_OK": "Diagnostics OK.",
+        "DIAG_WARN": "WARNING: ",
+        "QC_STATUS": "QC Status",
+        "SLOPE_OBS": "Observed Slope",
+        "INTENSITY": "Intensity",
+        "MODEL_RELIABILITY": "Model Reliability",
+        "RECOMMENDATION": "Recommendation",
+        "REC_PUBLISH": "Publish",
+        "REC_CHECK": "Increase N or check Setup",
+        "PUB_TEMPLATE": (
+            "Weighted regression (N={n}). "
+            "QC: {qc_res} (Status: {qc_status}). "
+            "Result: {sig_word} correlation (εΦ = {slope:.2e} ± {stderr:.2e}, p = {pval:.4g}). "
+            "Diagnostics: {diag_res}."
+        ),
+        "PUB_TERMS": {
+            "passed": "passed",
+            "failed": "failed",
+            "significant": "significant",
+            "non-significant": "non-significant",
+            "confirmed": "confirmed",
+            "issues": "potential issues"
+        },
+        "CONCLUSION_LABEL": "CONCLUSION",
+        "EVALUATION_LABEL": "EVALUATION",
+        "PUBLICATION_LABEL": "PUBLICATION"
+    },
+    "REPORT": {
+        "TITLE": "SCIENTIFIC ANALYSIS REPORT",
+        "GENERATED_ON": "Generated on",
+        "MAIN_RESULT": "MAIN RESULT (εΦ)",
+        "DETAILED_STATS": "DETAILED STATISTICS",
+        "METADATA": "METADATA",
+        "AUTO_DESC_TITLE": "DETAILED AUTOMATED REPORT",
+        "DISCLAIMER": "Generated by CHRONON System V1.0 - Internal Certification.",
+        "Visualisation": "VISUALIZATION",
+        "DIAGNOSTICS": "DIAGNOSTICS & QUALITY",
+        "RESIDUALS_TESTS": "Residual Statistical Tests",
+        "HIST_TITLE": "Residuals Distribution",
+        "QQ_HINT": "Normal dist centered on 0 = Healthy model.",
+        "TABLE_METRIC": "Metric",
+        "TABLE_VALUE": "Value",
+        "TABLE_DESC": "Description",
+        "TABLE_TEST": "Test",
+        "TABLE_STAT": "Statistic",
+        "TABLE_RESULT": "Result"
+    }
+}
@@ -0,0 +1,68 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+"""
+Core message catalog, French: texts used by the interpretation and the PDF report.
+"""
+
+MESSAGES = {
+    "INTERPRETATION": {
+        "STRONG": "DÉTECTION FORTE",
+        "WEAK": "DÉTECTION VALIDÉE",
+        "TRACE": "AMBIGU / TRACE",
+        "NULL": "NON-DÉTECTION",
+        "EVAL_STRONG": "Signal hautement significatif (p < 0.001).",
+        "EVAL_WEAK": "Signal significatif (p < 0.05).",
+        "EVAL_TRACE": "Indice de signal non-concluant (0.05 < p < 0.10).",
+        "EVAL_NULL": "Dominance du bruit. Aucune corrélation significative.",
+        "NOTE_QC_FAIL": " NOTE: Données potentiellement corrompues (voir QC).",
+        "DIAG_OK": "Diagnostics OK.",
+        "DIAG_WARN": "ATTENTION: ",
+        "QC_STATUS": "Statut QC",
+        "SLOPE_OBS": "Pente observée",
+        "INTENSITY": "Intensité",
+        "MODEL_RELIABILITY": "Fiabilité Modèle",
+        "RECOMMENDATION": "Recommandation",
+        "REC_PUBLISH": "Publier",
+        "REC_CHECK": "Augmenter N ou vérifier Setup",
+        "PUB_TEMPLATE": (
+            "Analyse de régression pondérée (N={n}). "
+            "Contrôle qualité: {qc_res} (Statut: {qc_status}). "
+            "Résultat: corrélation {sig_word} (pente εΦ = {slope:.2e} ± {stderr:.2e}, p = {pval:.4g}). "
+            "Diagnostics: {diag_res}."
+        ),
+        "PUB_TERMS": {
+            "passed": "validés",
+            "failed": "échoués",
+            "significant": "significative",
+            "non-significant": "non-significative",
+            "confirmed": "confirmé",
+            "issues": "problèmes potentiels"
+        },
+        "CONCLUSION_LABEL": "CONCLUSION",
+        "EVALUATION_LABEL": "EVALUATION",
+        "PUBLICATION_LABEL": "PUBLICATION"
+    },
+    "REPORT": {
+        "TITLE": "RAPPORT D'ANALYSE SCIENTIFIQUE",
+        "GENERATED_ON": "Généré le",
+        "MAIN_RESULT": "RÉSULTAT PRINCIPAL (εΦ)",
+        "DETAILED_STATS": "STATISTIQUES DÉTAILLÉES",
+        "METADATA": "MÉTADONNÉES",
+        "AUTO_DESC_TITLE": "RAPPORT AUTOMATISÉ DÉTAILLÉ",
+        "DISCLAIMER": "Généré automatiquement par CHRONON System V1.0 - Certification interne.",
+        "Visualisation": "VISUALISATION",
+        "DIAGNOSTICS": "DIAGNOSTICS & QUALITÉ",
+        "RESIDUALS_TESTS": "Tests Statistiques sur Résidus",
+        "HIST_TITLE": "Distribution des Résidus",
+        "QQ_HINT": "Distribution normale centrée sur 0 = Modèle sain.",
+        "TABLE_METRIC": "Métrique",
+        "TABLE_VALUE": "Valeur",
+        "TABLE_DESC": "Description",
+        "TABLE_TEST": "Test",
+        "TABLE_STAT": "Statistique",
+        "TABLE_RESULT": "Résultat"
+    }
+}
@@ -0,0 +1,190 @@
+import os
+import csv
+import json
+
+import numpy as np
+from scipy import stats
+
+from chronon_core.comparison import RunComparator
+
+# Rows of the leave-one-out random-effects weights computed at once
+LOO_BLOCK = 1024
+
+
+def load_ledger_runs(ledger_path, verdicts=None):
+    """
+    Run results of a Ledger as arrays: run_id, verdict, slope, stderr,
+    ci_low, ci_high (NaN / +-inf where a row does not record them).
+
+    The regression is read from each JSON row the way RunComparator does
+    ('regression' sub-dict, or 'slope' / 'stderr' at the top level).
+    """
+    base = os.path.dirname(ledger_path)
+    extract = RunComparator()._extract_reg
+    cols = {k: [] for k in ("run_id", "verdict", "slope", "stderr", "ci_low", "ci_high")}
+    with open(ledger_path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            if verdicts is not None and row["verdict"] not in verdicts:
+                continue
+            try:
+                with open(os.path.join(base, row["json_row_path"]), "r", encoding="utf-8") as jf:
+                    reg = extract(json.load(jf))
+            except (OSError, ValueError):
+                reg = {}
+            cols["run_id"].append(row["run_id"])
+            cols["verdict"].append(row["verdict"])
+            cols["slope"].append(reg.get("slope", np.nan))
+            cols["stderr"].append(reg.get("stderr", np.nan))
+            cols["ci_low"].append(reg.get("ci_low", -np.inf))
+            cols["ci_high"].append(reg.get("ci_high", np.inf))
+
+    runs = {k: np.array(v, dtype=object) for k, v in cols.items() if k in ("run_id", "verdict")}
+    for k in ("slope", "stderr", "ci_low", "ci_high"):
+        runs[k] = np.array([np.nan if v is None else v for v in cols[k]], dtype=float)
+    return runs
+
+
+class MetaAnalyzer:
+    """
+    Pooled analysis of many independent runs, each summarised by a slope
+    and its standard error (inverse-variance weights).
+
+    All methods take 1-D arrays and work on the whole set at once; runs
+    without a finite slope and a positive standard error are left out of
+    the pooled estimates.
+    """
+
+    @staticmethod
+    def _usable(slopes, stderrs):
+        slopes = np.asarray(slopes, dtype=float)
+        stderrs = np.asarray(stderrs, dtype=float)
+        ok = np.isfinite(slopes) & np.isfinite(stderrs) & (stderrs > 0)
+        return slopes, stderrs, ok
+
+    @staticmethod
+    def _dl_tau2(q, k, s0, s0_sq):
+        # DerSimonian-Laird between-run variance (arrays for leave-one-out)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c = s0 - s0_sq / s0
+            return np.where(c > 0, np.maximum(0.0, (q - (k - 1)) / c), 0.0)
+
+    @staticmethod
+    def _estimate(est, se):
+        z = est / se
+        return {"estimate": float(est), "stderr": float(se), "z": float(z),
+                "pval": float(2 * stats.norm.sf(abs(z))),
+                "ci_low": float(est - 1.96 * se), "ci_high": float(est + 1.96 * se)}
+
+    def pool(self, slopes, stderrs):
+        """
+        Fixed-effect (inverse-variance) and random-effects (DerSimonian-
+        Laird) pooled slope, with Cochran's Q and I^2.
+        """
+        b, se, ok = self._usable(slopes, stderrs)
+        b, se = b[ok], se[ok]
+        k = len(b)
+        res = {"k": k, "n_excluded": int((~ok).sum())}
+        if k == 0:
+            return res
+
+        w = 1.0 / se ** 2
+        s0 = w.sum()
+        fe = (w * b).sum() / s0
+        q = float((w * (b - fe) ** 2).sum())
+        tau2 = float(self._dl_tau2(q, k, s0, (w ** 2).sum()))
+
+        w_re = 1.0 / (se ** 2 + tau2)
+        re = (w_re * b).sum() / w_re.sum()
+
+        res["fixed"] = self._estimate(fe, np.sqrt(1.0 / s0))
+        res["random"] = self._estimate(re, np.sqrt(1.0 / w_re.sum()))
+        res["Q"] = q
+        res["Q_df"] = k - 1
+        res["Q_pval"] = float(stats.chi2.sf(q, k - 1)) if k > 1 else np.nan
+        res["I2"] = max(0.0, (q - (k - 1)) / q) if q > 0 else 0.0
+        res["tau2"] = tau2
+        return res
+
+    def pairwise(self, slopes, stderrs, ci_low=None, ci_high=None, alpha=0.05):
+        """
+        RunComparator.compare_runs for every pair (i, j) in one broadcast.
+        Returns (N, N) matrices with the same keys; entry [i, j] compares
+        run_a = i with run_b = j (delta_slope = slope_j - slope_i).
+        """
+        b = np.asarray(slopes, dtype=float)
+        se = np.asarray(stderrs, dtype=float)
+        delta = b[None, :] - b[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = delta / np.sqrt(se[:, None] ** 2 + se[None, :] ** 2)
+        pval = 2 * stats.norm.sf(np.abs(z))
+
+        lo = np.full(b.shape, -np.inf) if ci_low is None else np.asarray(ci_low, dtype=float)
+        hi = np.full(b.shape, np.inf) if ci_high is None else np.asarray(ci_high, dtype=float)
+        overlap = np.minimum(hi[:, None], hi[None, :]) - np.maximum(lo[:, None], lo[None, :])
+
+        return {
+            "delta_slope": delta,
+            "z_score_diff": z,
+            "pval_diff": pval,
+            "significant_diff": pval < alpha,
+            "ci_overlap": overlap > 0,
+        }
+
+    def leave_one_out(self, slopes, stderrs):
+        """
+        Influence of each run: pooled estimates with that run removed.
+        Arrays aligned with the input (NaN for runs that are not usable).
+        """
+        b, se, ok = self._usable(slopes, stderrs)
+        n = len(b)
+        out = {k: np.full(n, np.nan) for k in ("fixed", "random", "random_stderr", "tau2", "I2", "delta_random")}
+        idx = np.flatnonzero(ok)
+        k = len(idx)
+        if k < 2:
+            return out
+        b, se = b[idx], se[idx]
+        w = 1.0 / se ** 2
+
+        # Totals minus each run's own term
+        s0 = w.sum() - w
+        s1 = (w * b).sum() - w * b
+        s2 = (w * b ** 2).sum() - w * b ** 2
+        s0_sq = (w ** 2).sum() - w ** 2
+        fe = s1 / s0
+        q = np.maximum(0.0, s2 - s1 ** 2 / s0)
+        tau2 = self._dl_tau2(q, k - 1, s0, s0_sq)
+
+        # Random-effects weights depend on tau2_i: (block, k) at a time, own run masked
+        re = np.empty(k)
+        re_se = np.empty(k)
+        var = se ** 2
+        for start in range(0, k, LOO_BLOCK):
+            rows = np.arange(start, min(start + LOO_BLOCK, k))
+            w_re = 1.0 / (var[None, :] + tau2[rows, None])
+            w_re[np.arange(len(rows)), rows] = 0.0
+            total = w_re.sum(axis=1)
+            re[rows] = (w_re @ b) / total
+            re_se[rows] = np.sqrt(1.0 / total)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            i2 = np.where(q > 0, np.maximum(0.0, (q - (k - 2)) / q), 0.0)
+        pooled = self.pool(b, se)["random"]["estimate"]
+
+        out["fixed"][idx] = fe
+        out["random"][idx] = re
+        out["random_stderr"][idx] = re_se
+        out["tau2"][idx] = tau2
+        out["I2"][idx] = i2
+        out["delta_random"][idx] = re - pooled
+        return out
+
+    def analyze(self, runs):
+        """
+        Full meta-analysis of load_ledger_runs() output (or any dict with
+        'slope' and 'stderr' arrays): pooled, pairwise and leave_one_out.
+        """
+        res = self.pool(runs["slope"], runs["stderr"])
+        res["pairwise"] = self.pairwise(runs["slope"], runs["stderr"], runs.get("ci_low"), runs.get("ci_high"))
+        res["leave_one_out"] = self.leave_one_out(runs["slope"], runs["stderr"])
+        res["run_id"] = runs.get("run_id")
+        return res
@@ -1,7 +1,26 @@
 
 
+from fractions import Fraction
+
+import numpy as np
+import pandas as pd
+
 C_LIGHT = 299792458.0
 
+# 1/c^2 as an unevaluated sum hi + lo (c^2 itself needs 57 bits)
+_INV_C2 = Fraction(1, int(C_LIGHT) ** 2)
+INV_C2_HI = float(_INV_C2)
+INV_C2_LO = float(_INV_C2 - Fraction(INV_C2_HI))
+
+# Rows per kernel block: inputs, outputs and scratch stay cache resident
+KERNEL_BLOCK = 1 << 15
+
+# Dekker splitter for 53-bit doubles
+_SPLIT = 134217729.0
+
+KERNEL_OUTPUTS = ("Delta_h_corr", "X_GR", "Y_res", "sigma_X")
+PRECISIONS = ("double", "compensated", "longdouble")
+
 def check_discipline(df, drift_threshold_ns=100.0):
     """
     Checks PTP/UTC locks and clock drift. 
@@ -58,58 +77,163 @@ def apply_geodesy_corrections(df):
     # For now, we trust sigma_dh_m from input if nonzero.
     return df
 
-def compute_variables(df):
+def _two_sum(a, b):
+    # a + b = s + err exactly (Knuth)
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+def _two_prod(a, b):
+    # a * b = p + err exactly (Dekker, no FMA)
+    p = a * b
+    t = _SPLIT * a
+    a_hi = t - (t - a)
+    a_lo = a - a_hi
+    t = _SPLIT * b
+    b_hi = t - (t - b)
+    b_lo = b - b_hi
+    return p, ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+def _kernel_block(dh, load, g, y, sagnac, sigma_dh, out, precision):
+    """
+    One block of gr_kernel: writes out[...] (float64 views of the block).
+    """
+    h, x, y_res, sig_x = out
+    if precision == "double":
+        # Same operations (and roundings) as the column-wise version
+        if load is None:
+            h[:] = dh
+        else:
+            np.add(dh, load, out=h)
+        np.multiply(g, h, out=x)
+        np.divide(x, C_LIGHT**2, out=x)
+        if sagnac is None:
+            np.subtract(y, x, out=y_res)
+        else:
+            np.subtract(y, sagnac, out=y_res)
+            np.subtract(y_res, x, out=y_res)
+        np.divide(g, C_LIGHT**2, out=sig_x)
+        np.multiply(sig_x, sigma_dh, out=sig_x)
+        return
+
+    if precision == "longdouble":
+        ld = np.longdouble
+        h_ld = dh.astype(ld) if load is None else dh.astype(ld) + load
+        x_ld = g.astype(ld) * h_ld / (ld(int(C_LIGHT)) ** 2)
+        y_ld = y.astype(ld) if sagnac is None else y.astype(ld) - sagnac
+        h[:] = h_ld
+        x[:] = x_ld
+        y_res[:] = y_ld - x_ld
+        sig_x[:] = g.astype(ld) / (ld(int(C_LIGHT)) ** 2) * sigma_dh
+        return
+
+    # Compensated: every term of Y_res carried as a double-double (hi + lo),
+    # rounded once at the end
+    if load is None:
+        h[:] = dh
+        h_lo = 0.0
+    else:
+        hs, h_lo = _two_sum(dh, load)
+        h[:] = hs
+    p, p_lo = _two_prod(g, h)
+    p_lo += g * h_lo
+    xs, x_lo = _two_prod(p, INV_C2_HI)
+    x_lo += p_lo * INV_C2_HI + p * INV_C2_LO
+    xs, x_lo = _two_sum(xs, x_lo)
+    x[:] = xs
+
+    if sagnac is None:
+        a, a_lo = y, 0.0
+    else:
+        a, a_lo = _two_sum(y, -sagnac)
+    b, b_lo = _two_sum(a, -xs)
+    np.add(b, (b_lo + a_lo) - x_lo, out=y_res)
+
+    s, s_lo = _two_prod(g, INV_C2_HI)
+    s_lo += g * INV_C2_LO
+    sig_x[:] = s * sigma_dh + s_lo * sigma_dh
+
+def gr_kernel(dh, g, y, sigma_dh, load=None, sagnac=None, out=None, precision="double"):
+    """
+    Fused preprocessing kernel over float64 arrays:
+        Delta_h_corr = dh + load
+        X_GR         = g * Delta_h_corr / c^2
+        Y_res        = (y - sagnac) - X_GR
+        sigma_X      = g / c^2 * sigma_dh
+    `load` / `sagnac` may be None (no correction). `out` is an optional
+    dict of preallocated float64 arrays keyed by KERNEL_OUTPUTS (e.g.
+    memmaps); missing ones are allocated. The work runs in blocks of
+    KERNEL_BLOCK rows so each block is read once and stays in cache.
+
+    precision:
+        "double"      plain float64,
+        "compensated" double-double (error-free sums / products), so Y_res
+                      is correctly rounded even though y and X_GR cancel to
+                      ~1e-16 relative; portable, ~5x the double cost,
+        "longdouble"  np.longdouble intermediates (80-bit on x86 Linux,
+                      plain double on platforms without it).
+    Returns the dict of output arrays.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision: {precision}")
+    arrays = [None if a is None else np.ascontiguousarray(a, dtype=np.float64)
+              for a in (dh, g, y, sigma_dh, load, sagnac)]
+    dh, g, y, sigma_dh, load, sagnac = arrays
+    n = len(dh)
+    out = dict(out or {})
+    for name in KERNEL_OUTPUTS:
+        if name not in out:
+            out[name] = np.empty(n, dtype=np.float64)
+    for start in range(0, n, KERNEL_BLOCK):
+        sl = slice(start, min(start + KERNEL_BLOCK, n))
+        block = lambda a: None if a is None else a[sl]
+        _kernel_block(dh[sl], block(load), g[sl], y[sl], block(sagnac), sigma_dh[sl],
+                      tuple(out[k][sl] for k in KERNEL_OUTPUTS), precision)
+    return out
+
+def compute_variables(df, precision="double", out=None):
     """
     Computes X (GR shift) and Y (Residuals).
     X = g * Delta_h / c^2
     Y_res = y_meas - X
+
+    Runs gr_kernel on the float64 columns and returns a new frame: the
+    input columns are a copy of df's (df is not modified, and editing the
+    result never writes back into it) and the derived ones are the
+    kernel's output arrays. precision / out: see gr_kernel.
     """
-    # Ensure corrections
-    if 'Delta_h_corr' not in df.columns:
-        df = apply_geodesy_corrections(df)
+    # Ensure corrections (an existing Delta_h_corr is used as is)
+    if 'Delta_h_corr' in df.columns:
+        dh, load = df['Delta_h_corr'].to_numpy(), None
+    else:
+        dh, load = df['Delta_h_m'].to_numpy(), df['pressure_load_corr'].to_numpy()
 
-    g = df['g_local_mps2']
-    dh = df['Delta_h_corr']
-    
-    # Compute X_GR (dimensionless frequency shift)
-    df['X_GR'] = (g * dh) / (C_LIGHT**2)
-    
+    # Sagnac correction: y_meas_corrected = y_frac - sagnac_value, Y_res = y_meas_corrected - X_GR
+    # If applied is true, y_frac is already corrected; only the other rows are.
+    applied = df['sagnac_applied'].to_numpy()
+    not_applied = ~applied.astype(bool)
+    sagnac = None
+    if not_applied.any():
+        sagnac = np.where(not_applied, df['sagnac_value'].to_numpy(dtype=np.float64), 0.0)
+
+    res = gr_kernel(dh, df['g_local_mps2'].to_numpy(), df['y_frac'].to_numpy(), df['sigma_dh_m'].to_numpy(),
+                    load=load, sagnac=sagnac, out=out, precision=precision)
+
+    n = len(df)
+    # One block-wise copy: the result must not alias the caller's arrays
+    columns = dict(df.copy().items())
+    columns['Delta_h_corr'] = res['Delta_h_corr']
+    columns['X_GR'] = res['X_GR']
     # Delta_lnPhi is approx X_GR
-    df['Delta_lnPhi'] = df['X_GR']
-    
-    # Sagnac correction: usually subtracted from y_meas or added to predicted shift?
-    # y_meas_corrected = y_frac - sagnac_value
-    # Y_res = y_meas_corrected - X_GR
-    # Input schema has 'sagnac_value' and 'sagnac_applied'. 
-    # If applied=True, we assume y_frac is already corrected. If False, we apply it.
-    
-    y_meas = df['y_frac'].copy()
-    mask_not_applied = (df['sagnac_applied'] == 0) | (~df['sagnac_applied'])
-    # If sagnac_value is fraction dy/y, we subtract it from y_frac to get 'pure' GR signal?
-    # Or is it a shift that mimics GR?
-    # Standard: y_total = y_GR + y_Sagnac + ...
-    # So to isolate y_GR/residual, we do y_res = y_total - y_Sagnac - y_GR
-    # We subtract Sagnac if not already done.
-    if mask_not_applied.any():
-        y_meas.loc[mask_not_applied] -= df.loc[mask_not_applied, 'sagnac_value']
-    
-    df['Y_res'] = y_meas - df['X_GR']
-    
-    # Sigma propagation
-    # sigma_X = (g/c^2) * sigma_dh
-    df['sigma_X'] = (g / (C_LIGHT**2)) * df['sigma_dh_m']
-    
-    # sigma_Y involves sigma_y_frac and sigma_X
-    # y_frac uncertainty? 'allan_sy_per_h' might be it, or explicit sigma? 
-    # Spec input doesn't list 'sigma_y_frac' explicitly in primary csv?
-    # Ah, 'allan_sy_per_h'. We might need to derive sigma_y per window.
-    # Usually ADEV at tau=window.
-    # Let's assume sigma_y_window is ~ allan_sy_per_h if tau matches, or we use a fixed model.
-    # For now, placeholder:
-    df['sigma_Y'] = 1e-18 # Placeholder default if not calculated from Allan
-    
+    columns['Delta_lnPhi'] = res['X_GR'].copy()
+    columns['Y_res'] = res['Y_res']
+    columns['sigma_X'] = res['sigma_X']
+
+    # sigma_Y: placeholder until derived from the Allan deviation at the window tau
+    columns['sigma_Y'] = np.full(n, 1e-18)
+
     # Band ID and Swap Flag
-    df['band_id'] = 0 # Default
-    df['swap_flag'] = 0 # Default
-    
-    return df
+    columns['band_id'] = np.zeros(n, dtype=np.int8) # Default
+    columns['swap_flag'] = np.zeros(n, dtype=np.int8) # Default
+
+    return pd.DataFrame(columns, index=df.index, copy=False)
@@ -0,0 +1,129 @@
+import sys
+import json
+import time
+import pstats
+import cProfile
+import tracemalloc
+from io import StringIO
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """
+    Process high-water RSS in MiB, or None where the platform does not expose it.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+class StageTimer:
+    """
+    Records wall time, CPU time and peak RSS per pipeline stage.
+
+    Usage:
+        timer = StageTimer()
+        with timer.stage("load"):
+            ...
+        timer.to_dict()
+
+    Nested stages are recorded with dotted names ("fit.wls").
+    With profile=True, the whole run is captured by cProfile and each stage
+    also reports its tracemalloc peak.
+    """
+
+    def __init__(self, profile=False):
+        self.profile = profile
+        self.records = []
+        self._stack = []
+        self._profiler = None
+        self._t0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+
+    def start(self):
+        if self.profile:
+            tracemalloc.start()
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def stop(self):
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self.profile and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name):
+        parent = self._stack[-1] if self._stack else None
+        # Appended on entry so parents are listed before their nested stages
+        rec = {"name": f"{parent['name']}.{name}" if parent else name}
+        self._stack.append(rec)
+        self.records.append(rec)
+        if self.profile and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        wall0 = time.perf_counter()
+        cpu0 = time.process_time()
+        try:
+            yield
+        finally:
+            rec["wall_s"] = time.perf_counter() - wall0
+            rec["cpu_s"] = time.process_time() - cpu0
+            rec["peak_rss_mb"] = peak_rss_mb()
+            if self.profile and tracemalloc.is_tracing():
+                # A nested stage resets the tracemalloc peak, so fold its peak back in
+                peak = max(tracemalloc.get_traced_memory()[1] / (1024 * 1024), rec.pop("_child_peak", 0.0))
+                rec["tracemalloc_peak_mb"] = peak
+                if parent is not None:
+                    parent["_child_peak"] = max(parent.get("_child_peak", 0.0), peak)
+            self._stack.pop()
+
+    def to_dict(self):
+        return {
+            "total_wall_s": time.perf_counter() - self._t0,
+            "total_cpu_s": time.process_time() - self._cpu0,
+            "peak_rss_mb": peak_rss_mb(),
+            "profiled": self.profile,
+            "stages": list(self.records),
+        }
+
+    def write_json(self, path, extra=None):
+        data = self.to_dict()
+        if extra:
+            data.update(extra)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+    def write_profile(self, pstats_path, summary_path, top=30):
+        """
+        Dumps the cProfile capture (binary pstats + top-N cumulative summary).
+        """
+        if self._profiler is None:
+            return
+        self._profiler.dump_stats(pstats_path)
+        buf = StringIO()
+        pstats.Stats(self._profiler, stream=buf).sort_stats("cumulative").print_stats(top)
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(buf.getvalue())
+
+    def markdown_rows(self):
+        """
+        Rows of the RUN_REPORT.md Performance table.
+        """
+        lines = [
+            "| stage | wall (s) | cpu (s) | peak RSS (MiB) |",
+            "|---|---:|---:|---:|",
+        ]
+        for rec in self.records:
+            rss = "n/a" if rec["peak_rss_mb"] is None else f"{rec['peak_rss_mb']:.1f}"
+            lines.append(f"| {rec['name']} | {rec['wall_s']:.4f} | {rec['cpu_s']:.4f} | {rss} |")
+        return lines
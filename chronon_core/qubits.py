@@ -4,12 +4,198 @@
 # Dev     : Brécheteau.B
 # ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+import pandas as pd
 from scipy.optimize import curve_fit
 
+# Largest |beta * x| passed to exp() during the exponential fits
+_MAX_EXPONENT = 700.0
+
+# Coherence times of the raw schema, fitted by QubitAnalysis.analyze_groups
+COHERENCE_COLUMNS = ("T2_s", "T1_s", "Tphi_s")
+
+# Upper bound on groups x resamples x points held in memory per chunk
+_CHUNK_ELEMENTS = 2_000_000
+
+def _weighted_sums(x, y, w):
+    return ((w).sum(-1), (w * x).sum(-1), (w * y).sum(-1),
+            (w * x * x).sum(-1), (w * x * y).sum(-1))
+
+def fit_linear_batch(x, y, w):
+    """
+    Weighted least squares y = t0 + beta * x, in closed form, for every row
+    of (..., n) arrays at once. Points with w == 0 are ignored (padding).
+
+    Returns (t0, beta, cov, chi2): cov is the (..., 2, 2) covariance scaled
+    by chi2 / (n - 2), as curve_fit(sigma=...) reports it.
+    """
+    s, sx, sy, sxx, sxy = _weighted_sums(x, y, w)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        det = s * sxx - sx * sx
+        beta = (s * sxy - sx * sy) / det
+        t0 = (sy - beta * sx) / s
+        chi2 = (w * (y - t0[..., None] - beta[..., None] * x) ** 2).sum(-1)
+        dof = (w > 0).sum(-1) - 2
+        scale = chi2 / dof
+        cov = np.stack([np.stack([sxx, -sx], -1), np.stack([-sx, s], -1)], -2) / det[..., None, None]
+    return t0, beta, cov * scale[..., None, None], chi2
+
+def fit_exponential_batch(x, y, w, t0, beta, max_iter=100, tol=1e-10):
+    """
+    Weighted fit of y = t0 * exp(beta * x) for every row of (..., n) arrays:
+    Levenberg-Marquardt damped Gauss-Newton with the analytic Jacobian,
+    started from (t0, beta) (one value per row). Points with w == 0 are
+    ignored. Converged rows drop out of the iterations.
+
+    Returns (t0, beta, cov, chi2, converged).
+    """
+    shape = np.shape(t0)
+    n = np.shape(x)[-1]
+    x, y, w = (np.broadcast_to(a, shape + (n,)).reshape(-1, n) for a in (x, y, w))
+    t0 = np.array(t0, dtype=float).reshape(-1)
+    beta = np.array(beta, dtype=float).reshape(-1)
+    lam = np.full(t0.shape, 1e-3)
+    converged = np.zeros(t0.shape, dtype=bool)
+
+    def chi2_of(rows, t0, beta):
+        e = np.exp(np.clip(beta[:, None] * x[rows], -_MAX_EXPONENT, _MAX_EXPONENT))
+        r = y[rows] - t0[:, None] * e
+        return e, r, (w[rows] * r * r).sum(-1)
+
+    def normal_matrix(rows, t0, e):
+        # J = [exp(bx), t0 x exp(bx)]
+        wr, j0 = w[rows], e
+        j1 = t0[:, None] * x[rows] * e
+        return wr, j0, j1, (wr * j0 * j0).sum(-1), (wr * j0 * j1).sum(-1), (wr * j1 * j1).sum(-1)
+
+    _, _, chi2 = chi2_of(slice(None), t0, beta)
+    for _ in range(max_iter):
+        rows = np.flatnonzero(~converged)
+        if not len(rows):
+            break
+        ta, ba, la = t0[rows], beta[rows], lam[rows]
+        e, r, _ = chi2_of(rows, ta, ba)
+        wr, j0, j1, a00, a01, a11 = normal_matrix(rows, ta, e)
+        g0, g1 = (wr * j0 * r).sum(-1), (wr * j1 * r).sum(-1)
+        # Damped normal equations (A + lam diag(A)) d = g
+        d00, d11 = a00 * (1 + la), a11 * (1 + la)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            det = d00 * d11 - a01 * a01
+            step_t0 = (d11 * g0 - a01 * g1) / det
+            step_beta = (d00 * g1 - a01 * g0) / det
+        finite = np.isfinite(step_t0) & np.isfinite(step_beta)
+        step_t0, step_beta = np.where(finite, step_t0, 0.0), np.where(finite, step_beta, 0.0)
+
+        _, _, new_chi2 = chi2_of(rows, ta + step_t0, ba + step_beta)
+        old_chi2 = chi2[rows]
+        better = finite & (new_chi2 <= old_chi2)
+        small = (np.abs(step_t0) <= tol * (1 + np.abs(ta))) & (np.abs(step_beta) <= tol * (1 + np.abs(ba)))
+        done = better & (small | (old_chi2 - new_chi2 <= tol * old_chi2))
+
+        t0[rows] = np.where(better, ta + step_t0, ta)
+        beta[rows] = np.where(better, ba + step_beta, ba)
+        chi2[rows] = np.where(better, new_chi2, old_chi2)
+        lam[rows] = np.where(better, la / 10, la * 10)
+        converged[rows] = done | (lam[rows] > 1e12)
+
+    converged &= np.isfinite(t0) & np.isfinite(beta) & (lam <= 1e12)
+    e, _, _ = chi2_of(slice(None), t0, beta)
+    _, _, _, a00, a01, a11 = normal_matrix(slice(None), t0, e)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        det = a00 * a11 - a01 * a01
+        scale = chi2 / ((w > 0).sum(-1) - 2)
+        cov = np.stack([np.stack([a11, -a01], -1), np.stack([-a01, a00], -1)], -2) / det[:, None, None]
+    cov = cov * scale[:, None, None]
+    return (t0.reshape(shape), beta.reshape(shape), cov.reshape(shape + (2, 2)),
+            chi2.reshape(shape), converged.reshape(shape))
+
+def log_linear_start(x, y, w):
+    """
+    (t0, beta) from a weighted line through ln(y): the warm start of the
+    exponential fit. Rows with non-positive y fall back to (mean(y), 0).
+    """
+    positive = (y > 0) | (w == 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ly = np.log(np.where(y > 0, y, 1.0))
+        # d ln(y) = dy / y: weights y^2 / err^2
+        t0_log, beta, _, _ = fit_linear_batch(x, ly, w * np.where(y > 0, y, 0.0) ** 2)
+        mean_y = (w * y).sum(-1) / w.sum(-1)
+    ok = positive.all(-1) & np.isfinite(beta)
+    return np.where(ok, np.exp(t0_log), mean_y), np.where(ok, beta, 0.0)
+
+def pad_groups(codes, n_groups, x, y, w):
+    """
+    Long-format samples -> (n_groups, n_max) arrays, one row per group,
+    padded with w = 0. `codes` is the group index (0..n_groups-1) of each
+    sample. Returns (x, y, w, counts).
+    """
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    counts = np.bincount(codes, minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    pos = np.arange(len(codes)) - starts[codes]
+    n_max = max(int(counts.max()) if n_groups else 0, 1)
+    out = []
+    for values in (x, y, w):
+        arr = np.zeros((n_groups, n_max))
+        arr[codes, pos] = values[order]
+        out.append(arr)
+    return out[0], out[1], out[2], counts
+
+def fit_groups(model_type, x, y, w, counts, n_boot, seed):
+    """
+    Main fit and pairs bootstrap for each row of padded (G, n) arrays (see
+    pad_groups). Each resample draws counts[g] points from its own group.
+    Returns a dict of (G,) arrays.
+    """
+    G = len(counts)
+    if model_type == "exponential":
+        t0, beta, cov, _, ok = fit_exponential_batch(x, y, w, *log_linear_start(x, y, w))
+    else:
+        t0, beta, cov, _ = fit_linear_batch(x, y, w)
+        ok = np.ones(G, dtype=bool)
+    ok &= (counts >= 3) & np.isfinite(t0) & np.isfinite(beta)
+
+    rng = np.random.default_rng(seed)
+    n_max = x.shape[1]
+    idx = (rng.random((G, n_boot, n_max)) * counts[:, None, None]).astype(np.int64)
+    rows = np.arange(G)[:, None, None]
+    wb = w[rows, idx] * (np.arange(n_max) < counts[:, None, None])
+    xb, yb = x[rows, idx], y[rows, idx]
+    if model_type == "exponential":
+        start_t0 = np.broadcast_to(np.where(ok, t0, 1.0)[:, None], (G, n_boot))
+        start_beta = np.broadcast_to(np.where(ok, beta, 0.0)[:, None], (G, n_boot))
+        _, betas, _, _, boot_ok = fit_exponential_batch(xb, yb, wb, start_t0, start_beta)
+    else:
+        _, betas, _, _ = fit_linear_batch(xb, yb, wb)
+        boot_ok = np.ones(betas.shape, dtype=bool)
+    boot_ok &= np.isfinite(betas)
+
+    ci = np.full((G, 2), np.nan)
+    for g in np.flatnonzero(ok & boot_ok.any(axis=1)):
+        ci[g] = np.percentile(betas[g, boot_ok[g]], [2.5, 97.5])
+    nan = np.where(ok, 1.0, np.nan)
+    return {
+        "intercept": t0 * nan,
+        "beta": beta * nan,
+        "std_error": np.sqrt(cov[:, 1, 1]) * nan,
+        "ci_low": ci[:, 0],
+        "ci_high": ci[:, 1],
+        "n_boot_failed": n_boot - boot_ok.sum(axis=1),
+        "valid": ok,
+    }
+
 class QubitAnalysis:
     """
     Analyzes T2 coherence times vs Chronon Field fluctuations.
+
+    Fits are weighted by 1 / y_err^2, and so are the bootstrap refits: the
+    CI describes the same estimator as the point estimate. All resamples
+    are solved at once (closed form for the linear model, batched
+    Gauss-Newton for the exponential one).
     """
     
     def generate_mock_data(self, n=20):
@@ -22,17 +208,18 @@ class QubitAnalysis:
         y_err = np.random.uniform(1, 3, n)
         return x, y, y_err
         
-    def analyze_t2_vs_phi(self, x, y, y_err=None, model_type="linear"):
+    def analyze_t2_vs_phi(self, x, y, y_err=None, model_type="linear", n_boot=100, seed=None):
         """
         Analyzes relationship between delta_ln_phi (x) and T2 (y).
+        `n_boot` pairs-bootstrap resamples give the 95% CI of beta.
         """
         if len(x) < 3:
             return {'valid': False, 'msg': "Insufficient data (N<3)"}
             
-        x = np.array(x)
-        y = np.array(y)
-        if y_err is None:
-            y_err = np.ones_like(y)
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        y_err = np.ones_like(y) if y_err is None else np.asarray(y_err, dtype=float)
+        w = 1.0 / y_err**2
         
         results = {
             'valid': True,
@@ -40,61 +227,111 @@ class QubitAnalysis:
             'model': model_type
         }
         
-        def linear(x, t0, beta): return t0 + beta * x
-        def exponential(x, t0, beta): return t0 * np.exp(beta * x)
-        
-        try:
-            if model_type == "exponential":
-                p0 = [np.mean(y), 0.0]
-                try:
-                    popt, pcov = curve_fit(exponential, x, y, sigma=y_err, p0=p0, maxfev=2000)
-                except Exception:
-                     popt = [np.mean(y), 0.0]
-                     pcov = np.diag([np.inf, np.inf])
-
-                results.update({
-                    'beta': popt[1],
-                    'intercept': popt[0],
-                    'slope_beta': popt[1],
-                    'intercept_t2_0': popt[0],
-                    'equation': "T2 = T0 * exp(beta * x)"
-                })
-            else:
-                p0 = [np.mean(y), 0.0]
-                popt, pcov = curve_fit(linear, x, y, sigma=y_err, p0=p0)
-                results.update({
-                    'beta': popt[1],
-                    'intercept': popt[0],
-                    'slope_beta': popt[1],
-                    'intercept_t2_0': popt[0],
-                    'equation': "T2 = T0 + beta * x"
-                })
-                
-            results['std_error'] = np.sqrt(np.diag(pcov))[1]
-            
-            # Bootstrap CI for Beta
-            betas = []
-            for _ in range(100):
-                idxs = np.random.choice(len(x), len(x), replace=True)
+        if model_type == "exponential":
+            t0, beta, cov, _, ok = fit_exponential_batch(x, y, w, *log_linear_start(x, y, w))
+            if not ok:
+                # Same fallback as before the fast path
                 try:
-                    if model_type == "exponential":
-                         pb, _ = curve_fit(exponential, x[idxs], y[idxs], maxfev=1000)
-                    else:
-                         pb, _ = curve_fit(linear, x[idxs], y[idxs])
-                    betas.append(pb[1])
+                    popt, cov = curve_fit(lambda x, t0, b: t0 * np.exp(b * x), x, y, sigma=y_err,
+                                          p0=[np.mean(y), 0.0], maxfev=2000)
+                    t0, beta = popt
                 except Exception:
-                    pass
+                    t0, beta = np.mean(y), 0.0
+                    cov = np.diag([np.inf, np.inf])
+            equation = "T2 = T0 * exp(beta * x)"
+        else:
+            t0, beta, cov, _ = fit_linear_batch(x, y, w)
+            equation = "T2 = T0 + beta * x"
+        if not (np.isfinite(t0) and np.isfinite(beta)):
+            return {'valid': False, 'msg': "Fit failed: degenerate x or weights"}
+
+        results.update({
+            'beta': float(beta),
+            'intercept': float(t0),
+            'slope_beta': float(beta),
+            'intercept_t2_0': float(t0),
+            'equation': equation,
+            'std_error': float(np.sqrt(np.diag(cov))[1]),
+        })
             
-            if betas:
-                results['ci_beta_95'] = np.percentile(betas, [2.5, 97.5])
-            else:
-                results['ci_beta_95'] = [0, 0]
-                
-        except Exception as e:
-            return {'valid': False, 'msg': f"Fit failed: {e}"}
+        # Bootstrap CI for Beta: all resamples in one (n_boot, n) batch
+        rng = np.random.default_rng(seed)
+        idx = rng.integers(0, len(x), (n_boot, len(x)))
+        xb, yb, wb = x[idx], y[idx], w[idx]
+        if model_type == "exponential":
+            _, betas, _, _, ok = fit_exponential_batch(xb, yb, wb, np.full(n_boot, t0), np.full(n_boot, beta))
+        else:
+            _, betas, _, _ = fit_linear_batch(xb, yb, wb)
+            ok = np.ones(n_boot, dtype=bool)
+        ok &= np.isfinite(betas)
+        betas = betas[ok]
+
+        results['n_boot'] = n_boot
+        results['n_boot_failed'] = int(n_boot - ok.sum()) # degenerate resamples (e.g. a single x value)
+        if len(betas):
+            results['ci_beta_95'] = np.percentile(betas, [2.5, 97.5])
+        else:
+            results['ci_beta_95'] = [0, 0]
             
         return results
 
+    def analyze_groups(self, df, x_col="Delta_lnPhi", metrics=COHERENCE_COLUMNS,
+                       group_cols=("site_id", "qubit"), model_type="linear",
+                       n_boot=1000, seed=None, n_jobs=None):
+        """
+        Fits every coherence metric against `x_col` for every group of a
+        long-format frame (one row per sample, e.g. the raw schema with
+        T2_s / T1_s / Tphi_s per site). A '<metric>_err' column, when present,
+        weights the fits as y_err does in analyze_t2_vs_phi.
+
+        All groups are fitted together on padded arrays; exponential fits are
+        spread over a process pool by chunks of groups.
+        Returns a tidy DataFrame: one row per (group, metric).
+        """
+        group_cols = [c for c in group_cols if c in df.columns]
+        if group_cols:
+            codes, uniques = pd.MultiIndex.from_frame(df[group_cols]).factorize()
+            keys = pd.MultiIndex.from_tuples(list(uniques), names=group_cols) if len(group_cols) > 1 \
+                else pd.Index([u[0] for u in uniques], name=group_cols[0])
+        else:
+            codes, keys = np.zeros(len(df), dtype=np.int64), None
+        n_groups = len(keys) if keys is not None else 1
+        x_all = pd.to_numeric(df[x_col], errors="coerce").to_numpy(float)
+        seeds = iter(np.random.SeedSequence(seed).spawn(4 * len(metrics) * max(n_groups, 1)))
+
+        tables = []
+        for metric in metrics:
+            if metric not in df.columns:
+                continue
+            y_all = pd.to_numeric(df[metric], errors="coerce").to_numpy(float)
+            err_col = f"{metric}_err"
+            err = pd.to_numeric(df[err_col], errors="coerce").to_numpy(float) if err_col in df.columns \
+                else np.ones(len(df))
+            keep = np.isfinite(x_all) & np.isfinite(y_all) & np.isfinite(err) & (err > 0) & (codes >= 0)
+            x, y, w, counts = pad_groups(codes[keep], n_groups, x_all[keep], y_all[keep], 1.0 / err[keep]**2)
+
+            per_chunk = max(1, _CHUNK_ELEMENTS // max(1, n_boot * x.shape[1]))
+            chunks = [slice(i, i + per_chunk) for i in range(0, n_groups, per_chunk)]
+            jobs = [(model_type, x[c], y[c], w[c], counts[c], n_boot, next(seeds)) for c in chunks]
+            if model_type == "exponential" and len(jobs) > 1 and (n_jobs or os.cpu_count() or 1) > 1:
+                with ProcessPoolExecutor(max_workers=min(len(jobs), n_jobs or os.cpu_count())) as pool:
+                    parts = list(pool.map(fit_groups, *zip(*jobs)))
+            else:
+                parts = [fit_groups(*job) for job in jobs]
+
+            table = pd.DataFrame({k: np.concatenate([p[k] for p in parts]) for k in parts[0]})
+            if keys is not None:
+                table.index = keys
+            table.insert(0, "metric", metric)
+            table.insert(1, "model", model_type)
+            table.insert(2, "n", counts)
+            tables.append(table)
+
+        if not tables:
+            return pd.DataFrame()
+        out = pd.concat(tables)
+        return out.reset_index() if keys is not None else out.reset_index(drop=True)
+
 # (~ ~ ~ Φ(x) ~ ~ ~
 #  Benjamin Brécheteau | Chronon Field 2025
 #  ~ ~ ~ ~ ~)
@@ -4,10 +4,312 @@
 # Dev     : Brécheteau.B
 # ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
+import os
 import datetime
 import textwrap
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from matplotlib.backends.backend_pdf import PdfPages
+
+from chronon_core.messages import messages
+
+# Design Constants
+COLOR_PRIMARY = "#0B2240"
+COLOR_ACCENT = "#1F6AA5"
+COLOR_SUCCESS = "#10B981"
+COLOR_WARNING = "#F59E0B"
+
+A4 = (8.27, 11.69)
+
+# Reports rendered per worker task in batch mode
+BATCH_CHUNK = 8
+
+
+def report_strings(lang="fr"):
+    """Static texts of the report for one language."""
+    return messages(lang, "REPORT")
+
+
+def _status(stats_results):
+    # Determine Status
+    status_color = COLOR_SUCCESS
+    status_text = "VALID"
+    if stats_results.get('pval', 1.0) > 0.05:
+        status_color = COLOR_WARNING
+        status_text = "NON SIG"
+
+    # If fallback used
+    summary_model = stats_results.get('model_summary', '')
+    if "DEMING" in summary_model or "BOOTSTRAP" in summary_model:
+        status_text += " (FALLBACK)"
+        if status_color == COLOR_SUCCESS:
+            status_color = COLOR_WARNING
+    return status_text, status_color
+
+
+class ReportTemplate:
+    """
+    The pages of the PDF report with every static artist (header bands,
+    titles, table grids, histogram bars) built once. render() only updates
+    the text and data of the artists that change from one run to the next,
+    so one template serves a whole batch of reports.
+
+    Pages are plain Figure objects (no pyplot state): call close() when done.
+    """
+
+    HIST_BINS = 15
+
+    def __init__(self, t):
+        self.t = t
+        self._build_summary()
+        self._build_plot()
+        self._build_diagnostics()
+
+    # --- Page 1: executive summary ---
+
+    def _build_summary(self):
+        t = self.t
+        self.fig_sum = Figure(figsize=A4)
+        ax = self.fig_sum.add_axes([0, 0, 1, 1])
+        ax.axis('off')
+
+        # --- Header ---
+        ax.add_patch(Rectangle((0, 0.85), 1, 0.15, transform=ax.transAxes, color=COLOR_PRIMARY))
+        ax.text(0.05, 0.92, "CHRONON", color='white', fontsize=30, weight='bold', transform=ax.transAxes)
+        ax.text(0.05, 0.88, t["TITLE"], color='#9CA3AF', fontsize=14, transform=ax.transAxes)
+        self.txt_timestamp = ax.text(0.95, 0.92, "", color='white', fontsize=12, ha='right', transform=ax.transAxes)
+
+        # --- Status Badge ---
+        self.rect_status = Rectangle((0.6, 0.78), 0.35, 0.05, transform=ax.transAxes, color=COLOR_SUCCESS, alpha=0.9)
+        ax.add_patch(self.rect_status)
+        self.txt_status = ax.text(0.775, 0.805, "", color='white', fontsize=12, weight='bold', ha='center', va='center', transform=ax.transAxes)
+
+        # --- Global Metrics (Hero Section) ---
+        ax.text(0.05, 0.75, t["MAIN_RESULT"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax.transAxes)
+        ax.add_patch(Rectangle((0.05, 0.60), 0.9, 0.12, transform=ax.transAxes, facecolor='#F3F4F6', edgecolor='#E5E7EB'))
+        self.txt_epsilon = ax.text(0.5, 0.68, "", fontsize=36, weight='bold', ha='center', color=COLOR_PRIMARY, transform=ax.transAxes)
+        self.txt_stderr = ax.text(0.5, 0.62, "", fontsize=14, ha='center', color='gray', transform=ax.transAxes)
+
+        # --- Detailed Stats Table (values filled per run) ---
+        ax.text(0.05, 0.55, t["DETAILED_STATS"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax.transAxes)
+        cols = [t["TABLE_METRIC"], t["TABLE_VALUE"], t["TABLE_DESC"]]
+        rows_data = [
+            ["Model", "", "WLS/Deming"],
+            ["P-value", "", "Prob (Null Hyp)"],
+            ["CI 95%", "", "Confidence Interval"],
+            ["R² Fit", "", "Coeff. Determination"]
+        ]
+        self.stats_table = ax.table(cellText=rows_data, colLabels=cols, cellLoc='left', loc='center',
+                                    bbox=[0.05, 0.35, 0.9, 0.18], colColours=[COLOR_ACCENT]*3)
+        self._style_table(self.stats_table, edge='white')
+
+        # --- Metadata ---
+        ax.text(0.05, 0.30, t["METADATA"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax.transAxes)
+        self.txt_meta = ax.text(0.05, 0.28, "", fontsize=10, va='top', transform=ax.transAxes, family='monospace',
+                                bbox=dict(boxstyle="round,pad=0.5", facecolor="#F9FAFB", edgecolor="#E5E7EB"))
+
+        # --- User Description / Conclusion ---
+        self.txt_desc_title = ax.text(0.05, 0.18, t["AUTO_DESC_TITLE"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax.transAxes)
+        self.txt_desc = ax.text(0.05, 0.16, "", fontsize=11, style='italic', va='top', color='#374151', transform=ax.transAxes)
+
+        # Disclaimer Footer
+        ax.text(0.5, 0.02, t["DISCLAIMER"], ha='center', fontsize=8, color='gray', transform=ax.transAxes)
+
+    @staticmethod
+    def _style_table(table, edge=None):
+        table.auto_set_font_size(False)
+        table.set_fontsize(10)
+        table.scale(1, 1.5)
+        # Style header
+        for (row, col), cell in table.get_celld().items():
+            if row == 0:
+                cell.set_text_props(color='white', weight='bold')
+                if edge:
+                    cell.set_edgecolor(edge)
+
+    def _fill_summary(self, stats_results, metadata, description_text):
+        status_text, status_color = _status(stats_results)
+        self.txt_timestamp.set_text(datetime.datetime.now().strftime('%d/%m/%Y %H:%M'))
+        self.rect_status.set_color(status_color)
+        self.txt_status.set_text(status_text)
+
+        self.txt_epsilon.set_text(f"{stats_results.get('slope', 0.0):.4e}")
+        self.txt_stderr.set_text(f"± {stats_results.get('stderr', 0.0):.4e}")
+
+        values = [
+            stats_results.get('model_summary', ''),
+            f"{stats_results.get('pval', 1.0):.6f}",
+            f"[{stats_results.get('ci_low',0):.2e}, {stats_results.get('ci_high',0):.2e}]",
+            f"{stats_results.get('r_squared', 'N/A')}",
+        ]
+        for row, value in enumerate(values, start=1):
+            self.stats_table[row, 1].get_text().set_text(value)
+
+        self.txt_meta.set_text("\n".join([f"• {k}: {v}" for k,v in metadata.items()]))
+        self.txt_desc_title.set_visible(bool(description_text))
+        self.txt_desc.set_text("\n".join(textwrap.wrap(description_text, width=90)) if description_text else "")
+
+    # --- Page 2: visualization (batch mode, from data) ---
+
+    def _build_plot(self):
+        self.fig_plot = Figure(figsize=A4)
+        self.fig_plot.text(0.02, 0.98, self.t["Visualisation"], color='gray', fontsize=10, weight='bold')
+        # Fixed margins instead of a tight_layout per report
+        self.fig_plot.subplots_adjust(left=0.12, right=0.95, bottom=0.08, top=0.92)
+        self.ax_plot = self.fig_plot.add_subplot(111)
+        self.plot_points = self.ax_plot.scatter([], [], s=10, c=COLOR_ACCENT, alpha=0.5, label='Data')
+        self.plot_fit, = self.ax_plot.plot([], [], 'r-', linewidth=2)
+        self.ax_plot.set_xlabel("Delta h (m)")
+        self.ax_plot.set_ylabel("Phi")
+        self.ax_plot.grid(True, alpha=0.3)
+
+    def _fill_plot(self, plot, stats_results):
+        x = np.asarray(plot["x"], dtype=float)
+        y = np.asarray(plot["y"], dtype=float)
+        self.plot_points.set_offsets(np.column_stack([x, y]))
+        slope = stats_results.get('slope', 0.0)
+        if len(x):
+            line_x = np.array([x.min(), x.max()])
+            self.plot_fit.set_data(line_x, stats_results.get('intercept', 0.0) + slope * line_x)
+        else:
+            self.plot_fit.set_data([], [])
+        self.plot_fit.set_label(f'Fit (εΦ={slope:.2e})')
+        self.ax_plot.set_title(plot.get("title", ""))
+        self.ax_plot.legend(loc='best')
+        # Data limits of this run only (points and fit line)
+        self.ax_plot.ignore_existing_data_limits = True
+        self.ax_plot.update_datalim(np.column_stack([x, y]) if len(x) else np.zeros((1, 2)))
+        self.ax_plot.update_datalim(self.plot_fit.get_xydata())
+        self.ax_plot.autoscale_view()
+
+    # --- Page 3: diagnostics ---
+
+    def _build_diagnostics(self):
+        t = self.t
+        self.fig_diag = Figure(figsize=A4)
+        self.ax_diag = self.fig_diag.add_axes([0, 0, 1, 1])
+        ax2 = self.ax_diag
+        ax2.axis('off')
+
+        # Header
+        ax2.add_patch(Rectangle((0, 0.9), 1, 0.1, transform=ax2.transAxes, color=COLOR_ACCENT))
+        ax2.text(0.05, 0.94, t["DIAGNOSTICS"], color='white', fontsize=20, weight='bold', transform=ax2.transAxes)
+        self.txt_tests = ax2.text(0.05, 0.85, t["RESIDUALS_TESTS"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax2.transAxes)
+        self.diag_tables = {} # number of tests -> table (built on first use)
+
+        # Residuals Histogram: fixed set of bars, heights set per run
+        self.ax_hist = self.fig_diag.add_axes([0.15, 0.25, 0.7, 0.3])
+        self.hist_bars = self.ax_hist.bar(np.zeros(self.HIST_BINS), np.zeros(self.HIST_BINS), width=1.0, align='edge',
+                                          color=COLOR_ACCENT, alpha=0.7, edgecolor='black')
+        self.ax_hist.set_title(t["HIST_TITLE"])
+        self.ax_hist.set_xlabel("Residual")
+        self.ax_hist.grid(True, alpha=0.3)
+        self.txt_qq = ax2.text(0.5, 0.20, t["QQ_HINT"], ha='center', fontsize=10, style='italic', transform=ax2.transAxes)
+
+    def _diag_table(self, n_rows):
+        table = self.diag_tables.get(n_rows)
+        if table is None:
+            t = self.t
+            table = self.ax_diag.table(cellText=[[""] * 4] * n_rows,
+                                       colLabels=[t["TABLE_TEST"], t["TABLE_STAT"], "P-Value", t["TABLE_RESULT"]],
+                                       loc='center', bbox=[0.05, 0.65, 0.9, 0.15], colColours=[COLOR_PRIMARY]*4)
+            self._style_table(table)
+            self.diag_tables[n_rows] = table
+        return table
+
+    def _fill_diagnostics(self, stats_results):
+        # Diagnostics Table
+        diag_data = stats_results.get('diagnostics', {})
+        for table in self.diag_tables.values():
+            table.set_visible(False)
+        self.txt_tests.set_visible(bool(diag_data))
+        if diag_data:
+            table = self._diag_table(len(diag_data))
+            for row, (k, v) in enumerate(diag_data.items(), start=1):
+                values = [k, f"{v.get('stat',0):.4f}", f"{v.get('pval',1):.4f}", v.get('verdict', 'Unknown')]
+                for col, value in enumerate(values):
+                    table[row, col].get_text().set_text(value)
+            table.set_visible(True)
+
+        # Residuals Histogram
+        residuals = stats_results.get('residuals')
+        has_hist = residuals is not None
+        self.ax_hist.set_visible(has_hist)
+        self.txt_qq.set_visible(has_hist)
+        if has_hist:
+            counts, edges = np.histogram(np.asarray(residuals, dtype=float), bins=self.HIST_BINS)
+            for bar, count, left, right in zip(self.hist_bars, counts, edges[:-1], edges[1:]):
+                bar.set_x(left)
+                bar.set_width(right - left)
+                bar.set_height(count)
+            self.ax_hist.relim()
+            self.ax_hist.autoscale_view()
+
+    # --- Output ---
+
+    def render(self, filename, stats_results, metadata=None, description_text="", fig_plot=None, plot=None):
+        """
+        Writes one report. Page 2 is fig_plot when given (caller's figure),
+        else a scatter + fit of plot = {"x", "y"[, "title"]}, else omitted.
+        """
+        metadata = metadata or {}
+        self._fill_summary(stats_results, metadata, description_text)
+        self._fill_diagnostics(stats_results)
+
+        with PdfPages(filename) as pdf:
+            pdf.savefig(self.fig_sum)
+            if fig_plot is not None:
+                fig_plot.text(0.02, 0.98, self.t["Visualisation"], color='gray', fontsize=10, weight='bold')
+                fig_plot.tight_layout(rect=[0, 0, 1, 0.95])
+                pdf.savefig(fig_plot)
+            elif plot is not None:
+                self._fill_plot(plot, stats_results)
+                pdf.savefig(self.fig_plot)
+            pdf.savefig(self.fig_diag)
+        return True
+
+    def close(self):
+        """Releases every artist of the template pages."""
+        for fig in (self.fig_sum, self.fig_plot, self.fig_diag):
+            fig.clear()
+        self.diag_tables = {}
+
+
+# Per-process template for batch workers: (lang, ReportTemplate)
+_WORKER_TEMPLATE = [None, None]
+
+def _init_worker():
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+
+def _release_worker_template():
+    if _WORKER_TEMPLATE[1] is not None:
+        _WORKER_TEMPLATE[1].close()
+    _WORKER_TEMPLATE[:] = [None, None]
+
+def _render_batch(lang, jobs):
+    """
+    Worker side of ReportGenerator.generate_batch: renders jobs with the
+    process template. Returns [(filename, error or None)].
+    """
+    if _WORKER_TEMPLATE[0] != lang:
+        _release_worker_template()
+        _WORKER_TEMPLATE[:] = [lang, ReportTemplate(report_strings(lang))]
+    template = _WORKER_TEMPLATE[1]
+
+    done = []
+    for job in jobs:
+        try:
+            template.render(job["filename"], job["stats_results"], metadata=job.get("metadata"),
+                            description_text=job.get("description_text", ""), plot=job.get("plot"))
+            done.append((job["filename"], None))
+        except Exception as e:
+            done.append((job["filename"], f"{type(e).__name__}: {e}"))
+    return done
+
 
 class ReportGenerator:
     """
@@ -18,154 +320,55 @@ class ReportGenerator:
     def generate_pdf_report(filename, fig_plot, stats_results, metadata=None, description_text="", lang="fr"):
         """
         Creates a premium multi-page PDF report.
+        Pages are plain Figure objects (no pyplot state), so this can run off the GUI thread.
         """
-        from app.gui.translations import TRANSLATIONS
-        t = TRANSLATIONS[lang]["REPORT"]
-        
-        if metadata is None:
-            metadata = {}
-            
-        # Design Constants
-        COLOR_PRIMARY = "#0B2240"
-        COLOR_ACCENT = "#1F6AA5"
-        COLOR_SUCCESS = "#10B981"
-        COLOR_WARNING = "#F59E0B"
-        
-        epsilon = stats_results.get('slope', 0.0)
-        stderr = stats_results.get('stderr', 0.0)
-        pval = stats_results.get('pval', 1.0)
-        
-        # Determine Status
-        status_color = COLOR_SUCCESS
-        status_text = "VALID"
-        if pval > 0.05:
-            status_color = COLOR_WARNING
-            status_text = "NON SIG"
-        
-        # If fallback used
-        summary_model = stats_results.get('model_summary', '')
-        if "DEMING" in summary_model or "BOOTSTRAP" in summary_model:
-             status_text += " (FALLBACK)"
-             if status_color == COLOR_SUCCESS: 
-                 status_color = COLOR_WARNING
+        template = ReportTemplate(report_strings(lang))
+        try:
+            return template.render(filename, stats_results, metadata=metadata,
+                                   description_text=description_text, fig_plot=fig_plot)
+        finally:
+            template.close()
 
-        timestamp_str = datetime.datetime.now().strftime('%d/%m/%Y %H:%M')
+    @staticmethod
+    def generate_batch(jobs, lang="fr", n_jobs=None, progress=None):
+        """
+        Reports for a whole campaign. Each job is a dict with filename,
+        stats_results and optionally metadata, description_text and
+        plot = {"x", "y"[, "title"]} (data, not a Figure, so it can be sent
+        to a worker process).
 
-        with PdfPages(filename) as pdf:
-            # ================= PAGE 1: EXECUTIVE SUMMARY =================
-            fig_sum = plt.figure(figsize=(8.27, 11.69)) # A4
-            ax = fig_sum.add_axes([0, 0, 1, 1])
-            ax.axis('off')
-            
-            # --- Header ---
-            rect_header = plt.Rectangle((0, 0.85), 1, 0.15, transform=ax.transAxes, color=COLOR_PRIMARY)
-            ax.add_patch(rect_header)
-            
-            ax.text(0.05, 0.92, "CHRONON", color='white', fontsize=30, weight='bold', transform=ax.transAxes)
-            ax.text(0.05, 0.88, t["TITLE"], color='#9CA3AF', fontsize=14, transform=ax.transAxes)
-            ax.text(0.95, 0.92, f"{timestamp_str}", color='white', fontsize=12, ha='right', transform=ax.transAxes)
-            
-            # --- Status Badge ---
-            rect_status = plt.Rectangle((0.6, 0.78), 0.35, 0.05, transform=ax.transAxes, color=status_color, alpha=0.9)
-            ax.add_patch(rect_status)
-            ax.text(0.775, 0.805, status_text, color='white', fontsize=12, weight='bold', ha='center', va='center', transform=ax.transAxes)
-            
-            # --- Global Metrics (Hero Section) ---
-            ax.text(0.05, 0.75, t["MAIN_RESULT"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax.transAxes)
-            
-            # Box for Value
-            rect_hero = plt.Rectangle((0.05, 0.60), 0.9, 0.12, transform=ax.transAxes, facecolor='#F3F4F6', edgecolor='#E5E7EB')
-            ax.add_patch(rect_hero)
-            
-            ax.text(0.5, 0.68, f"{epsilon:.4e}", fontsize=36, weight='bold', ha='center', color=COLOR_PRIMARY, transform=ax.transAxes)
-            ax.text(0.5, 0.62, f"± {stderr:.4e}", fontsize=14, ha='center', color='gray', transform=ax.transAxes)
-            
-            # --- Detailed Stats Table ---
-            ax.text(0.05, 0.55, t["DETAILED_STATS"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax.transAxes)
-            
-            cols = [t["TABLE_METRIC"], t["TABLE_VALUE"], t["TABLE_DESC"]]
-            rows_data = [
-                ["Model", summary_model, "WLS/Deming"],
-                ["P-value", f"{pval:.6f}", "Prob (Null Hyp)"],
-                ["CI 95%", f"[{stats_results.get('ci_low',0):.2e}, {stats_results.get('ci_high',0):.2e}]", "Confidence Interval"],
-                ["R² Fit", f"{stats_results.get('r_squared', 'N/A')}", "Coeff. Determination"]
-            ]
-            
-            table = plt.table(cellText=rows_data, colLabels=cols, cellLoc='left', loc='center', 
-                              bbox=[0.05, 0.35, 0.9, 0.18], colColours=[COLOR_ACCENT]*3)
-            table.auto_set_font_size(False)
-            table.set_fontsize(10)
-            table.scale(1, 1.5)
-            # Style header
-            for (row, col), cell in table.get_celld().items():
-                if row == 0:
-                    cell.set_text_props(color='white', weight='bold')
-                    cell.set_edgecolor('white')
-            
-            # --- Metadata ---
-            ax.text(0.05, 0.30, t["METADATA"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax.transAxes)
-            meta_str = "\n".join([f"• {k}: {v}" for k,v in metadata.items()])
-            ax.text(0.05, 0.28, meta_str, fontsize=10, va='top', transform=ax.transAxes, family='monospace', bbox=dict(boxstyle="round,pad=0.5", facecolor="#F9FAFB", edgecolor="#E5E7EB"))
-
-            # --- User Description / Conclusion ---
-            if description_text:
-                ax.text(0.05, 0.18, t["AUTO_DESC_TITLE"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax.transAxes)
-                wrapped_desc = "\n".join(textwrap.wrap(description_text, width=90))
-                ax.text(0.05, 0.16, wrapped_desc, fontsize=11, style='italic', va='top', color='#374151', transform=ax.transAxes)
-
-            # Disclaimer Footer
-            ax.text(0.5, 0.02, t["DISCLAIMER"], 
-                    ha='center', fontsize=8, color='gray', transform=ax.transAxes)
-            
-            pdf.savefig(fig_sum)
-            
-            # ================= PAGE 2: VISUALIZATION =================
-            fig_plot.text(0.02, 0.98, t["Visualisation"], color='gray', fontsize=10, weight='bold')
-            fig_plot.tight_layout(rect=[0, 0, 1, 0.95])
-            pdf.savefig(fig_plot)
-            
-            # ================= PAGE 3: DIAGNOSTICS =================
-            fig_diag = plt.figure(figsize=(8.27, 11.69))
-            ax2 = fig_diag.add_axes([0, 0, 1, 1])
-            ax2.axis('off')
-            
-            # Header
-            rect_header2 = plt.Rectangle((0, 0.9), 1, 0.1, transform=ax2.transAxes, color=COLOR_ACCENT)
-            ax2.add_patch(rect_header2)
-            ax2.text(0.05, 0.94, t["DIAGNOSTICS"], color='white', fontsize=20, weight='bold', transform=ax2.transAxes)
-            
-            # Diagnostics Table
-            diag_data = stats_results.get('diagnostics', {})
-            if diag_data:
-                d_rows = []
-                for k, v in diag_data.items():
-                    verdict = v.get('verdict', 'Unknown')
-                    d_rows.append([k, f"{v.get('stat',0):.4f}", f"{v.get('pval',1):.4f}", verdict])
-                
-                ax2.text(0.05, 0.85, t["RESIDUALS_TESTS"], fontsize=14, weight='bold', color=COLOR_PRIMARY, transform=ax2.transAxes)
-                d_table = plt.table(cellText=d_rows, colLabels=[t["TABLE_TEST"], t["TABLE_STAT"], "P-Value", t["TABLE_RESULT"]], 
-                                    loc='center', bbox=[0.05, 0.65, 0.9, 0.15], colColours=[COLOR_PRIMARY]*4)
-                d_table.auto_set_font_size(False)
-                d_table.set_fontsize(10)
-                d_table.scale(1, 1.5)
-                for (row, col), cell in d_table.get_celld().items():
-                    if row == 0:
-                        cell.set_text_props(color='white', weight='bold')
-            
-            # Residuals Histogram
-            residuals = stats_results.get('residuals')
-            if residuals is not None:
-                ax_hist = fig_diag.add_axes([0.15, 0.25, 0.7, 0.3])
-                ax_hist.hist(residuals, bins=15, color=COLOR_ACCENT, alpha=0.7, edgecolor='black')
-                ax_hist.set_title(t["HIST_TITLE"])
-                ax_hist.set_xlabel("Residual")
-                ax_hist.grid(True, alpha=0.3)
-                
-                ax2.text(0.5, 0.20, t["QQ_HINT"], ha='center', fontsize=10, style='italic', transform=ax2.transAxes)
-
-            pdf.savefig(fig_diag)
-            
-        return True
+        Jobs are spread over a process pool in chunks of BATCH_CHUNK; each
+        worker builds the page templates once. A failing report does not
+        stop the others.
+        Returns {filename: None, or the error message}.
+        """
+        jobs = list(jobs)
+        chunks = [jobs[i:i + BATCH_CHUNK] for i in range(0, len(jobs), BATCH_CHUNK)]
+        n_jobs = min(n_jobs or os.cpu_count() or 1, len(chunks))
+        results = {}
+
+        def collect(done):
+            results.update(done)
+            if progress is not None:
+                progress(len(results) / len(jobs), "Rapports PDF")
+
+        if n_jobs <= 1:
+            # In this process the template must not outlive the batch
+            try:
+                for chunk in chunks:
+                    collect(_render_batch(lang, chunk))
+            finally:
+                _release_worker_template()
+            return results
+
+        pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker)
+        try:
+            futures = [pool.submit(_render_batch, lang, chunk) for chunk in chunks]
+            for fut in as_completed(futures):
+                collect(fut.result())
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        return results
 
 # (~ ~ ~ Φ(x) ~ ~ ~
 #  Benjamin Brécheteau | Chronon Field 2025
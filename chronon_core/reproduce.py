@@ -1,5 +1,4 @@
 import os
-import sys
 import json
 import platform
 import hashlib
@@ -17,7 +16,8 @@ except ImportError:
     STATSMODELS_VERSION = "not_installed"
 
 # Internal modules
-from chronon_core import preprocess, windowing, stats, io
+from chronon_core import preprocess, windowing, stats, io, diagnostics, cache, toy
+from chronon_core.profiling import StageTimer
 
 def sha256_file(path: str) -> str:
     h = hashlib.sha256()
@@ -29,6 +29,12 @@ def sha256_file(path: str) -> str:
 def sha256_string(s: str) -> str:
     return hashlib.sha256(s.encode('utf-8')).hexdigest()
 
+def sha256_frame(df: pd.DataFrame) -> str:
+    # Content hash of an in-memory frame (values and index, column order included)
+    h = hashlib.sha256(",".join(map(str, df.columns)).encode('utf-8'))
+    h.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return h.hexdigest()
+
 def git_rev() -> str:
     try:
         return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
@@ -45,100 +51,183 @@ class NumpyEncoder(json.JSONEncoder):
             return obj.tolist()
         return super().default(obj)
 
-def run_reproduce(config_path: str):
-    print(f"Loading config from {config_path}")
-    with open(config_path, "r", encoding="utf-8") as f:
-        config_content = f.read()
-    
-    config_hash = sha256_string(config_content)
-    cfg = yaml.safe_load(config_content)
+def _run_stage(stage_cache, stage, key, compute, force, hits):
+    """
+    Returns the cached output of `stage` for `key`, or computes and stores it.
+    """
+    if not force:
+        hit, value = stage_cache.load(stage, key)
+        if hit:
+            print(f"[cache] {stage}: hit ({key[:12]})")
+            hits[stage] = "hit"
+            return value
+    value = compute()
+    stage_cache.store(stage, key, value)
+    if not stage_cache.enabled:
+        hits[stage] = "off"
+    else:
+        hits[stage] = "forced" if force else "miss"
+    return value
+
+def forced_stages(force: bool = False, from_stage: str = None):
+    """
+    Returns a predicate telling whether a stage must bypass the cache.
+    """
+    if from_stage is not None and from_stage not in cache.STAGES:
+        raise ValueError(f"Unknown stage: {from_stage}. Expected one of {cache.STAGES}")
+    first_forced = 0 if force else (cache.STAGES.index(from_stage) if from_stage else len(cache.STAGES))
+    return lambda stage: cache.STAGES.index(stage) >= first_forced
+
+def stage_cache_for(cfg) -> cache.StageCache:
+    return cache.StageCache(
+        cfg.get("cache_dir", cache.DEFAULT_CACHE_DIR),
+        enabled=bool(cfg.get("cache", True)),
+    )
+
+def upstream_config(cfg) -> dict:
+    """
+    The part of a config that the load and preprocess stages depend on.
+    Configs with equal upstream sub-trees share the same preprocessed frame.
+    """
+    # Where (and whether) the audit CSV is written does not change the data
+    dataset_cfg = {k: v for k, v in cfg.get("dataset", {}).items() if k not in ("output", "persist_csv")}
+    if dataset_cfg.get("kind", "toy") == "toy":
+        # The generator is deterministic in (dataset config, seed)
+        return {"dataset": dataset_cfg, "seed": int(cfg.get("seed", 0))}
+    return {"dataset": dataset_cfg}
 
-    # 1. Setup Environment
+def prepare_data(cfg, stage_cache, forced, hits, timer=None):
+    """
+    Runs the load and preprocess stages.
+    Returns (df, pre_key, dataset_info); dataset_info["sha256"] may be a
+    Future while the toy CSV is still being written (see resolve_hash).
+    """
+    timer = timer or StageTimer()
     seed = int(cfg.get("seed", 0))
-    # Enforce global seeding for deterministic behavior in analysis steps
-    np.random.seed(seed)
-    
-    out_dir = cfg.get("out_dir", "reports")
-    os.makedirs(out_dir, exist_ok=True)
-    
-    # 2. Data Acquisition
     dataset_cfg = cfg.get("dataset", {})
     kind = dataset_cfg.get("kind", "toy")
-    
-    df = None
-    dataset_source_hash = "unknown"
-    dataset_actual_path = "unknown"
-    
+
     if kind == "toy":
-        # Run external script to generate data
-        print("Generating toy dataset using scripts/generate_toy.py...")
-        script_path = os.path.join("scripts", "generate_toy.py")
-        if not os.path.exists(script_path):
-             raise FileNotFoundError(f"Generation script not found at {script_path}. Please run from project root.")
-        
-        toy_output = os.path.join("data", "raw", "toy_run_auto.csv")
-        dataset_actual_path = toy_output
-        
-        # Call subprocess
-        cmd = [sys.executable, script_path, "--config", config_path, "--output", toy_output]
-        subprocess.check_call(cmd)
-        
-        print(f"Loading generated dataset from {toy_output}...")
-        df = io.load_raw_csv(toy_output)
-        dataset_source_hash = sha256_file(toy_output)
+        toy_output = dataset_cfg.get("output", os.path.join("data", "raw", "toy_run_auto.csv"))
+        persist_csv = bool(dataset_cfg.get("persist_csv", True))
+
+        def load_toy():
+            print("Generating toy dataset in-process...")
+            return {"df": toy.generate_toy_frame(
+                n_samples=dataset_cfg.get("n", 500),
+                eps_phi=dataset_cfg.get("eps", 0.0),
+                seed=seed,
+            )}
+
+        load_key = stage_cache.make_key(
+            "load", "toy", upstream_config(cfg), cache.hash_code(toy, io),
+        )
+        with timer.stage("load"):
+            loaded = _run_stage(stage_cache, "load", load_key, load_toy, forced("load"), hits)
+
+        # Audit trail: the CSV is written in the background while the analysis runs
+        if persist_csv:
+            dataset_info = {"path": toy_output, "sha256": toy.write_toy_csv_async(loaded["df"], toy_output)}
+        else:
+            dataset_info = {"path": "in-memory", "sha256": sha256_frame(loaded["df"])}
         
     elif kind == "external":
         path = dataset_cfg.get("path")
-        dataset_actual_path = path
-        print(f"Loading external dataset from {path}...")
-        df = io.load_raw_csv(path)
-        if os.path.exists(path):
-            dataset_source_hash = sha256_file(path)
+        if not path or not os.path.exists(path):
+            raise FileNotFoundError(f"External dataset not found: {path}")
+        file_hash = sha256_file(path)
+
+        def load_external():
+            print(f"Loading external dataset from {path}...")
+            return {"df": io.load_raw_csv(path)}
+
+        load_key = stage_cache.make_key("load", file_hash, upstream_config(cfg), cache.hash_code(io))
+        with timer.stage("load"):
+            loaded = _run_stage(stage_cache, "load", load_key, load_external, forced("load"), hits)
+        dataset_info = {"path": path, "sha256": file_hash}
     else:
         raise ValueError(f"Unknown dataset kind: {kind}")
 
-    # 3. Preprocessing
-    print("Preprocessing...")
-    
-    try:
-        preprocess.check_discipline(df)
-    except Exception as e:
-        print(f"Warning: Discipline check failed: {e}")
+    df = loaded["df"]
+
+    # Preprocessing
+    def run_preprocess():
+        print("Preprocessing...")
+        try:
+            preprocess.check_discipline(df)
+        except Exception as e:
+            print(f"Warning: Discipline check failed: {e}")
+        return preprocess.compute_variables(df)
+
+    pre_key = stage_cache.make_key("preprocess", load_key, {}, cache.hash_code(preprocess))
+    with timer.stage("preprocess"):
+        df = _run_stage(stage_cache, "preprocess", pre_key, run_preprocess, forced("preprocess"), hits)
+    return df, pre_key, dataset_info
+
+def resolve_hash(dataset_info) -> str:
+    sha = dataset_info["sha256"]
+    return sha.result() if hasattr(sha, "result") else sha
+
+def analyze(df, cfg, stage_cache, pre_key, forced, hits, timer=None):
+    """
+    Runs the windowing and fit stages on a preprocessed frame.
+    Returns the metrics dict stored under results["metrics"].
+    """
+    timer = timer or StageTimer()
+    seed = int(cfg.get("seed", 0))
 
-    df = preprocess.compute_variables(df)
-    
     # Windowing
     w_sec = cfg.get("window_seconds", 120)
-    df_windowed = windowing.compute_windows(df, window_sec=w_sec)
+    win_key = stage_cache.make_key(
+        "windowing", pre_key, {"window_seconds": w_sec}, cache.hash_code(windowing)
+    )
+    with timer.stage("windowing"):
+        df_windowed = _run_stage(
+            stage_cache, "windowing", win_key,
+            lambda: windowing.compute_windows(df, window_sec=w_sec),
+            forced("windowing"), hits,
+        )
     
-    # 4. Analysis
-    print("Analyzing...")
+    # Analysis
     analysis_cfg = cfg.get("analysis", {})
     
     X = df_windowed['X_GR'].values
     Y = df_windowed['Y_res'].values
     sigma_Y = df_windowed['sigma_Y'].values
-    
-    results = {
-        "status": "ok", 
-        "seed": seed,
-        "config": cfg,
-        "metrics": {}
-    }
-
-    # Primary WLS
-    res_wls = stats.fit_free_intercept_wls(X, Y, sigma_Y)
-    results["metrics"]["wls"] = res_wls
-    
-    print("WLS Results:", res_wls)
 
-    # Bootstrap
-    if analysis_cfg.get("bootstrap", False):
-        print("Running bootstrap...")
-        bs_res = stats.wild_bootstrap(X, Y, sigma_Y, n_boot=analysis_cfg.get("n_boot", 2000))
-        results["metrics"]["bootstrap"] = bs_res
+    def run_fit():
+        print("Analyzing...")
+        # The bootstrap draws from the global RNG
+        np.random.seed(seed)
+        metrics = {}
 
-    # 5. Output Generation
+        # Primary WLS
+        with timer.stage("wls"):
+            res_wls = stats.fit_free_intercept_wls(X, Y, sigma_Y)
+        metrics["wls"] = res_wls
+
+        print("WLS Results:", res_wls)
+
+        # Bootstrap
+        if analysis_cfg.get("bootstrap", False):
+            print("Running bootstrap...")
+            with timer.stage("bootstrap"):
+                bs_res = stats.wild_bootstrap(X, Y, sigma_Y, n_boot=analysis_cfg.get("n_boot", 2000))
+            metrics["bootstrap"] = bs_res
+        return metrics
+
+    fit_key = stage_cache.make_key(
+        "fit", win_key, {"analysis": analysis_cfg, "seed": seed},
+        cache.hash_code(stats, diagnostics),
+    )
+    with timer.stage("fit"):
+        return _run_stage(stage_cache, "fit", fit_key, run_fit, forced("fit"), hits)
+
+def write_results(out_dir, results) -> str:
+    """
+    Writes results.json and its checksum file. Returns the results path.
+    """
+    os.makedirs(out_dir, exist_ok=True)
     results_path = os.path.join(out_dir, "results.json")
     with open(results_path, "w", encoding="utf-8") as f:
         # Use Custom Encoder and sort_keys for strict reproducibility
@@ -148,6 +237,58 @@ def run_reproduce(config_path: str):
     checksum_path = os.path.join(out_dir, "checksums.sha256")
     with open(checksum_path, "w", encoding="utf-8") as f:
         f.write(f"{sha256_file(results_path)}  results.json\n")
+    return results_path
+
+def run_reproduce(config_path: str, force: bool = False, from_stage: str = None, profile: bool = False):
+    """
+    Runs the pipeline load -> preprocess -> windowing -> fit.
+
+    Stage outputs are cached under a key of (input hash, config sub-tree hash,
+    code hash). `force` recomputes every stage; `from_stage` recomputes that
+    stage and all the ones after it. Per-stage timings go to timings.json;
+    `profile` adds a cProfile capture and tracemalloc peaks.
+    """
+    forced = forced_stages(force, from_stage)
+    timer = StageTimer(profile=profile).start()
+
+    try:
+        print(f"Loading config from {config_path}")
+        with open(config_path, "r", encoding="utf-8") as f:
+            config_content = f.read()
+        
+        config_hash = sha256_string(config_content)
+        cfg = yaml.safe_load(config_content)
+
+        # 1. Setup Environment
+        seed = int(cfg.get("seed", 0))
+        # Enforce global seeding for deterministic behavior in analysis steps
+        np.random.seed(seed)
+        
+        out_dir = cfg.get("out_dir", "reports")
+        os.makedirs(out_dir, exist_ok=True)
+
+        stage_cache = stage_cache_for(cfg)
+        cache_hits = {}
+        
+        # 2. Data Acquisition + 3. Preprocessing
+        df, pre_key, dataset_info = prepare_data(cfg, stage_cache, forced, cache_hits, timer)
+        dataset_actual_path = dataset_info["path"]
+        
+        # 4. Windowing + Analysis
+        results = {
+            "status": "ok", 
+            "seed": seed,
+            "config": cfg,
+            "metrics": analyze(df, cfg, stage_cache, pre_key, forced, cache_hits, timer),
+        }
+
+        # 5. Output Generation
+        with timer.stage("output"):
+            dataset_source_hash = resolve_hash(dataset_info)
+            write_results(out_dir, results)
+    finally:
+        # Also on failure, so a profiled run never leaves cProfile / tracemalloc on
+        timer.stop()
 
     # run report
     report_path = os.path.join(out_dir, "RUN_REPORT.md")
@@ -169,11 +310,30 @@ def run_reproduce(config_path: str):
         f.write(f"- dataset_path: {dataset_actual_path}\n")
         f.write(f"- dataset_sha256: {dataset_source_hash}\n")
         f.write(f"- output_dir: {out_dir}\n")
+        stage_status = ", ".join(f"{st}={cache_hits.get(st, 'off')}" for st in cache.STAGES)
+        f.write(f"- stage_cache: {stage_status}\n")
         f.write("\n## Key Results\n")
         f.write("### WLS Fit\n")
         
         wls_dict = results["metrics"]["wls"]
         for k in sorted(wls_dict.keys()): 
             f.write(f"- **{k}**: {wls_dict[k]}\n")
+
+        # Timings are informational and deliberately kept out of results.json
+        perf = timer.to_dict()
+        f.write("\n## Performance\n")
+        f.write(f"- total_wall_s: {perf['total_wall_s']:.4f}\n")
+        f.write(f"- total_cpu_s: {perf['total_cpu_s']:.4f}\n")
+        if perf["peak_rss_mb"] is not None:
+            f.write(f"- peak_rss_mb: {perf['peak_rss_mb']:.1f}\n")
+        f.write("\n")
+        for line in timer.markdown_rows():
+            f.write(f"{line}\n")
+        if profile:
+            f.write("\nProfile: `profile.pstats` (cProfile), `profile_top.txt` (top 30 by cumulative time)\n")
+
+    timer.write_json(os.path.join(out_dir, "timings.json"), extra={"stage_cache": cache_hits})
+    if profile:
+        timer.write_profile(os.path.join(out_dir, "profile.pstats"), os.path.join(out_dir, "profile_top.txt"))
             
     print(f"Reproduction complete. Results in {out_dir}")
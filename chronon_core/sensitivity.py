@@ -1,12 +1,34 @@
+from functools import lru_cache
+
 import numpy as np
 from scipy import stats
 
+@lru_cache(maxsize=4096)
+def _t_ppf(q, df):
+    return float(stats.t.ppf(q, df))
+
+def t_quantiles(q, df):
+    """
+    stats.t.ppf(q, df) for a scalar q and an array of degrees of freedom,
+    each distinct (q, df) pair evaluated once per process.
+    """
+    df = np.asarray(df, dtype=float)
+    uniq, inverse = np.unique(df, return_inverse=True)
+    values = np.array([_t_ppf(float(q), float(d)) if d > 0 else np.nan for d in uniq])
+    return values[inverse].reshape(df.shape)
+
 class SensitivityAnalyzer:
     """
     Analyzes the sensitivity and detection limits of the experimental setup.
     Focuses on Simple Linear Regression power analysis.
+
+    The *_grid methods broadcast their arguments (slope, n, sigma_y,
+    x_spread) like NumPy ufuncs; the scalar methods are thin wrappers.
     """
-    
+
+    # Beyond this many standard errors the non-central t tails are 0 / 1
+    TAIL_CUTOFF = 40.0
+
     def calculate_mdp(self, sigma_y, n, x_spread, alpha=0.05, power=0.8):
         """
         Calculates Minimum Detectable Slope (MDP).
@@ -16,59 +38,101 @@ class SensitivityAnalyzer:
         """
         if n <= 2:
             return float('inf')
-        
+        return float(self.mdp_grid(sigma_y, n, x_spread, alpha, power))
+
+    def mdp_grid(self, sigma_y, n, x_spread, alpha=0.05, power=0.8):
+        """
+        calculate_mdp over broadcast arrays (inf where n <= 2).
+        """
+        sigma_y, n, x_spread = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (sigma_y, n, x_spread)))
         # Degrees of freedom
         df = n - 2
-        
-        # t-statistics
-        # Two-sided alpha
-        t_alpha = stats.t.ppf(1 - alpha/2, df)
-        # One-sided beta (Power = 1 - beta)
-        t_beta = stats.t.ppf(power, df)
-        
-        # Standard Error of Slope
-        # SE_beta = sigma_y / sqrt(Sxx)
-        # Sxx = (n-1) * var(x) if x_spread is std deviation
-        # Let's assume x_spread is the standard deviation of x
-        sxx = (n - 1) * (x_spread ** 2)
-        se_slope = sigma_y / np.sqrt(sxx)
-        
-        mdp = se_slope * (t_alpha + t_beta)
-        return mdp
+        # Two-sided alpha, one-sided beta (Power = 1 - beta)
+        t_alpha = t_quantiles(1 - alpha/2, df)
+        t_beta = t_quantiles(power, df)
+
+        # SE_beta = sigma_y / sqrt(Sxx), Sxx = (n-1) * var(x) with x_spread the std of x
+        with np.errstate(divide='ignore', invalid='ignore'):
+            se_slope = sigma_y / np.sqrt((n - 1) * x_spread ** 2)
+            mdp = se_slope * (t_alpha + t_beta)
+        return np.where(n > 2, mdp, np.inf)
+
+    def power_grid(self, slope, sigma_y, n, x_spread, alpha=0.05):
+        """
+        Statistical power over broadcast arrays of true slope, noise, sample
+        size and x spread, in one call (0 where n <= 2).
+        """
+        slope, sigma_y, n, x_spread = np.broadcast_arrays(
+            *(np.asarray(a, dtype=float) for a in (slope, sigma_y, n, x_spread)))
+        power = np.zeros(slope.shape)
+        ok = n > 2
+        if not ok.any():
+            return power
+
+        df = n[ok] - 2
+        se_slope = sigma_y[ok] / np.sqrt((n[ok] - 1) * x_spread[ok] ** 2)
+        # Non-centrality parameter: t_stat = slope / se_slope
+        delta = np.abs(slope[ok]) / se_slope
+        t_crit = t_quantiles(1 - alpha/2, df)
+
+        # Power = P(t > t_crit | delta) + P(t < -t_crit | delta), non-central t.
+        # Cells far in the tails are set directly instead of evaluating nct.
+        upper = np.ones(df.shape)
+        lower = np.zeros(df.shape)
+        mid = delta - t_crit < self.TAIL_CUTOFF
+        upper[mid] = stats.nct.sf(t_crit[mid], df[mid], delta[mid])
+        near = delta + t_crit < self.TAIL_CUTOFF
+        lower[near] = stats.nct.cdf(-t_crit[near], df[near], delta[near])
+        p = upper + lower
+
+        # Fallback to the normal approximation where nct did not converge
+        bad = ~np.isfinite(p)
+        if bad.any():
+            p[bad] = stats.norm.sf(t_crit[bad] - delta[bad]) + stats.norm.cdf(-t_crit[bad] - delta[bad])
+        power[ok] = p
+        return power
 
     def get_power_for_slope(self, slope, sigma_y, n, x_spread, alpha=0.05):
         """
         Calculates statistical power for a specific true slope.
         """
-        if n <= 2:
-            return 0.0
-        
-        df = n - 2
-        sxx = (n - 1) * (x_spread ** 2)
-        se_slope = sigma_y / np.sqrt(sxx)
-        
-        # Non-centrality parameter approximation
-        # t_stat = slope / se_slope
-        delta = abs(slope) / se_slope
-        
-        # Critical t
-        t_crit = stats.t.ppf(1 - alpha/2, df)
-        
-        # Power = P(t > t_crit | delta) + P(t < -t_crit | delta)
-        # Approx using normal if N large, or non-central t
-        # Using non-central t distribution 'nct'
-        try:
-            power = 1 - stats.nct.cdf(t_crit, df, nc=delta) + stats.nct.cdf(-t_crit, df, nc=delta)
-        except Exception:
-            # Fallback to normal approx
-            power = 1 - stats.norm.cdf(t_crit - delta) + stats.norm.cdf(-t_crit - delta)
-            
-        return power
+        return float(self.power_grid(slope, sigma_y, n, x_spread, alpha))
 
     def get_power_curve(self, sigma_y, n, x_spread, slope_max):
         """
         Generates X, Y arrays for a power curve plot (Power vs True Slope).
         """
         slopes = np.linspace(0, slope_max, 50)
-        powers = [self.get_power_for_slope(s, sigma_y, n, x_spread) for s in slopes]
-        return slopes, powers
+        return slopes, self.power_grid(slopes, sigma_y, n, x_spread)
+
+    def power_surface(self, slopes, ns, sigma_y, x_spread, alpha=0.05):
+        """
+        Power on the (n, slope) plane: array of shape (len(ns), len(slopes)).
+        """
+        slopes = np.asarray(slopes, dtype=float)
+        ns = np.asarray(ns, dtype=float)
+        return self.power_grid(slopes[None, :], sigma_y, ns[:, None], x_spread, alpha)
+
+    @staticmethod
+    def iso_power(slopes, surface, levels=(0.5, 0.8, 0.95)):
+        """
+        Iso-power contours of a power_surface: for each level, the smallest
+        |slope| reaching it on every row (n), linearly interpolated along the
+        slope axis. NaN where the level is not reached on the grid.
+        Power must increase with slope along each row (slopes >= 0, sorted).
+        """
+        slopes = np.asarray(slopes, dtype=float)
+        surface = np.maximum.accumulate(np.asarray(surface, dtype=float), axis=1)
+        rows = np.arange(surface.shape[0])
+        contours = {}
+        for level in levels:
+            reached = surface >= level
+            j = np.argmax(reached, axis=1)
+            found = reached[rows, j]
+            j0 = np.maximum(j - 1, 0)
+            p0, p1 = surface[rows, j0], surface[rows, j]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                w = np.where(p1 > p0, (level - p0) / (p1 - p0), 0.0)
+            s = slopes[j0] + w * (slopes[j] - slopes[j0])
+            contours[level] = np.where(found, s, np.nan)
+        return contours
@@ -0,0 +1,268 @@
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+# Project : CHRONON
+# Version : 1.0
+# Dev     : Brécheteau.B
+# ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from scipy import stats
+from scipy.signal import lfilter
+
+from chronon_core import cache
+from chronon_core.stats import compute_andrews_bandwidth
+from chronon_core.sensitivity import SensitivityAnalyzer
+
+# Replicates per work unit. Chunk i always uses seed spawn i, so results do
+# not depend on the number of worker processes.
+CHUNK_SIZE = 500
+
+# Scenarios of the acquisition simulator (see app.experiment.batch_sim)
+SCENARIOS = {
+    "S1 (Bruit faible)": {"sigma_y": 0.2},
+    "S2 (Décalage)": {"shift": 2.0},
+    "S3 (Anomalies)": {"anomaly_p": 0.2, "anomaly_mean": 5.0},
+}
+
+DEFAULT_SCENARIO = {
+    "n_points": 100,
+    "delta_h": 50.0,
+    "true_slope": 0.01,
+    "sigma_y": 1.0,
+    "shift": 0.0,
+    "anomaly_p": 0.0,
+    "anomaly_mean": 5.0,
+    "gamma": 0.0,       # AR(1) noise, as the manager's recursion
+    "alpha": 0.05,      # detection threshold on the p-value
+    "n_boot": 1000,     # wild bootstrap draws on fallback (as analyze_with_fallback)
+}
+
+
+def simulate_data(scenario, n_reps, rng):
+    """
+    X sweep (n_points,) and Y (n_reps, n_points) for one scenario.
+    """
+    n = scenario["n_points"]
+    dh = scenario["delta_h"]
+    X = np.linspace(-dh, dh, n)
+
+    noise = rng.normal(0.0, scenario["sigma_y"], (n_reps, n))
+    gamma = scenario["gamma"]
+    if gamma > 0:
+        # e_t = (1-g) * u_t + g * e_{t-1}, rescaled to keep sigma_y
+        noise = lfilter([1 - gamma], [1, -gamma], noise, axis=1) * np.sqrt((1 + gamma) / (1 - gamma))
+    Y = scenario["shift"] + scenario["true_slope"] * X + noise
+    if scenario["anomaly_p"] > 0:
+        Y = Y + np.where(rng.random((n_reps, n)) < scenario["anomaly_p"], scenario["anomaly_mean"], 0.0)
+    return X, Y
+
+
+def fit_batch(X, Y, sigma_Y, rng, n_boot=1000):
+    """
+    analyze_with_fallback (WLS + HAC, Ljung-Box / Breusch-Pagan checks,
+    wild bootstrap fallback) for many Y series sharing the same X and
+    sigma_Y, vectorized over the series. No sigma_X: the Deming branch is
+    not simulated.
+
+    Returns a dict of (n_reps,) arrays: slope, stderr, pval, ci_low,
+    ci_high, fallback.
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    sig = np.broadcast_to(np.asarray(sigma_Y, dtype=float), X.shape)
+    n_reps, n = Y.shape
+
+    # --- WLS (fit_free_intercept_wls): one projection shared by every series ---
+    sqrt_w = np.sqrt(1.0 / (sig**2 + 1e-12))
+    X_star = np.column_stack([np.ones(n), X]) * sqrt_w[:, None]
+    XTX_inv = np.linalg.inv(X_star.T @ X_star)
+    proj = XTX_inv @ X_star.T                      # (2, n)
+    Y_star = Y * sqrt_w
+    beta = Y_star @ proj.T                         # (n_reps, 2)
+    res_star = Y_star - beta @ X_star.T
+
+    # --- Newey-West HAC (newey_west_se), batched ---
+    L = compute_andrews_bandwidth(res_star[0])
+    U = res_star[:, :, None] * X_star[None, :, :]  # (n_reps, n, 2)
+    S = np.einsum('rti,rtj->rij', U, U)
+    for lag in range(1, L + 1):
+        G = np.einsum('rti,rtj->rij', U[:, lag:], U[:, :-lag])
+        S += (1.0 - lag / (L + 1.0)) * (G + G.transpose(0, 2, 1))
+    V = XTX_inv @ S @ XTX_inv
+    stderr = np.sqrt(np.maximum(0, V[:, 1, 1]))
+
+    slope = beta[:, 1]
+    dof = n - 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = np.where(stderr > 0, slope / stderr, np.inf)
+    pval = 2 * (1 - stats.t.cdf(np.abs(t_stat), dof))
+    t_crit = stats.t.ppf(0.975, dof)
+    ci_low, ci_high = slope - t_crit * stderr, slope + t_crit * stderr
+
+    # --- Diagnostics deciding the fallback (ResidualDiagnostics) ---
+    residuals = Y - (beta[:, :1] + slope[:, None] * X)
+    fallback = np.zeros(n_reps, dtype=bool)
+    if n > 5:
+        lags_h = min(10, n // 5)
+        centered = residuals - residuals.mean(axis=1, keepdims=True)
+        var = residuals.var(axis=1)
+        q = np.zeros(n_reps)
+        for k in range(1, lags_h + 1):
+            rho = np.mean(centered[:, :-k] * centered[:, k:], axis=1) / var
+            q += rho**2 / (n - k)
+        q *= n * (n + 2)
+        fallback |= (1 - stats.chi2.cdf(q, lags_h)) < 0.01
+    if n > 2:
+        e2 = residuals**2
+        X_const = np.column_stack([np.ones(n), X])
+        e2_hat = e2 @ np.linalg.pinv(X_const).T @ X_const.T
+        ssr = np.sum((e2_hat - e2.mean(axis=1, keepdims=True))**2, axis=1)
+        sse = np.sum((e2 - e2_hat)**2, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lm = n * ssr / (ssr + sse)
+        fallback |= (ssr + sse > 0) & ((1 - stats.chi2.cdf(lm, 1)) < 0.01)
+
+    # --- Wild bootstrap (wild_bootstrap) on the flagged series only ---
+    sqrt5 = np.sqrt(5)
+    v1, v2 = -(sqrt5 - 1) / 2, (sqrt5 + 1) / 2
+    p = (sqrt5 + 1) / (2 * sqrt5)
+    for r in np.flatnonzero(fallback):
+        y_hat = beta[r, 0] + slope[r] * X
+        v = np.where(rng.random((n_boot, n)) < p, v1, v2)
+        boot = ((y_hat + residuals[r] * v) * sqrt_w) @ proj[1]
+        b_std = np.std(boot)
+        slope[r] = np.mean(boot)
+        stderr[r] = b_std
+        ci_low[r], ci_high[r] = np.percentile(boot, [2.5, 97.5])
+        if b_std > 0:
+            pval[r] = 2 * (1 - stats.norm.cdf(abs(slope[r] / b_std)))
+
+    return {
+        "slope": slope,
+        "stderr": stderr,
+        "pval": pval,
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+        "fallback": fallback,
+    }
+
+
+def _simulate_chunk(scenario, n_reps, seed):
+    rng = np.random.default_rng(seed)
+    X, Y = simulate_data(scenario, n_reps, rng)
+    return fit_batch(X, Y, scenario["sigma_y"], rng, n_boot=scenario["n_boot"])
+
+
+class PowerSimulator:
+    """
+    Monte Carlo power of the production estimator (analyze_with_fallback:
+    WLS + HAC, wild bootstrap fallback), as opposed to the analytic OLS
+    formulas of SensitivityAnalyzer.
+
+    Replicates are fitted in vectorized chunks, spread over processes above
+    `parallel_threshold` replicates. Results are cached by scenario hash
+    (in memory, and on disk when `cache_dir` is given).
+    """
+
+    def __init__(self, n_jobs=None, cache_dir=None, parallel_threshold=4 * CHUNK_SIZE):
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self._memo = {}
+        self._disk = cache.StageCache(cache_dir) if cache_dir else None
+        self._code_hash = cache.hash_code(sys.modules[__name__], sys.modules["chronon_core.stats"])
+
+    def scenario(self, **overrides):
+        unknown = set(overrides) - set(DEFAULT_SCENARIO)
+        if unknown:
+            raise ValueError(f"Unknown scenario parameters: {sorted(unknown)}")
+        return dict(DEFAULT_SCENARIO, **overrides)
+
+    def run_simulation(self, n_sims=1000, seed=12345, progress=None, **scenario):
+        """
+        Power, bias and coverage of the estimator for one scenario
+        (keyword arguments override DEFAULT_SCENARIO).
+
+        progress(fraction, message), if given, is called as chunks complete;
+        an exception raised from it cancels the remaining chunks.
+        """
+        sc = self.scenario(**scenario)
+        key = cache.hash_config({"scenario": sc, "n_sims": n_sims, "seed": seed})
+        if key in self._memo:
+            return self._memo[key]
+        disk_key = cache.StageCache.make_key("power", key, {}, self._code_hash)
+        if self._disk is not None:
+            hit, value = self._disk.load("power", disk_key)
+            if hit:
+                self._memo[key] = value
+                return value
+
+        fits = self._run_chunks(sc, n_sims, seed, progress)
+        result = self._summarize(sc, n_sims, fits)
+        self._memo[key] = result
+        if self._disk is not None:
+            self._disk.store("power", disk_key, result)
+        return result
+
+    def scan_scenarios(self, n_sims=1000, seed=12345, progress=None, **common):
+        """
+        run_simulation over SCENARIOS. Returns {name: result}.
+        """
+        report = {}
+        names = list(SCENARIOS)
+        for i, name in enumerate(names):
+            def sub_progress(fraction, message=None, i=i, name=name):
+                if progress is not None:
+                    progress((i + fraction) / len(names), name)
+            report[name] = self.run_simulation(n_sims=n_sims, seed=seed, progress=sub_progress,
+                                               **dict(common, **SCENARIOS[name]))
+        return report
+
+    def _run_chunks(self, sc, n_sims, seed, progress):
+        sizes = [min(CHUNK_SIZE, n_sims - start) for start in range(0, n_sims, CHUNK_SIZE)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        parts = [None] * len(sizes)
+
+        if n_sims < self.parallel_threshold or self.n_jobs == 1:
+            for i, (size, s) in enumerate(zip(sizes, seeds)):
+                parts[i] = _simulate_chunk(sc, size, s)
+                if progress is not None:
+                    progress((i + 1) / len(sizes), "Simulation")
+        else:
+            pool = ProcessPoolExecutor(max_workers=min(self.n_jobs, len(sizes)))
+            try:
+                futures = {pool.submit(_simulate_chunk, sc, size, s): i
+                           for i, (size, s) in enumerate(zip(sizes, seeds))}
+                for done, fut in enumerate(as_completed(futures), 1):
+                    parts[futures[fut]] = fut.result()
+                    if progress is not None:
+                        progress(done / len(sizes), "Simulation")
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+    @staticmethod
+    def _summarize(sc, n_sims, fits):
+        true_slope = sc["true_slope"]
+        slopes = fits["slope"]
+        detected = fits["pval"] < sc["alpha"]
+        power = float(np.mean(detected))
+        X = np.linspace(-sc["delta_h"], sc["delta_h"], sc["n_points"])
+        analytic = SensitivityAnalyzer().get_power_for_slope(
+            true_slope, sc["sigma_y"], sc["n_points"], X.std(ddof=1), alpha=sc["alpha"])
+        return {
+            "power": power,
+            "power_mc_error": float(np.sqrt(power * (1 - power) / n_sims)),
+            "analytic_power": analytic,
+            "mean_slope": float(np.mean(slopes)),
+            "bias": float(np.mean(slopes) - true_slope),
+            "rmse": float(np.sqrt(np.mean((slopes - true_slope)**2))),
+            "mean_stderr": float(np.mean(fits["stderr"])),
+            "coverage": float(np.mean((fits["ci_low"] <= true_slope) & (true_slope <= fits["ci_high"]))),
+            "fallback_rate": float(np.mean(fits["fallback"])),
+            "n_sims": n_sims,
+            "scenario": sc,
+        }
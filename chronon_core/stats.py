@@ -290,6 +290,77 @@ def wild_bootstrap(X, Y, sigma_Y, n_boot=2000):
         'ci_95': np.percentile(boot_betas, [2.5, 97.5])
     }
 
+class WLSAccumulator:
+    """
+    Streaming free-intercept WLS (weights 1/sigma_Y^2, as fit_free_intercept_wls).
+
+    Keeps weighted means and co-moments, merged batch by batch (Chan et al.),
+    so each update costs O(batch) and the fit is O(1). The standard error is
+    the classical scaled WLS one, not HAC: it is meant for live previews, the
+    final analysis goes through calculate_slope_epsilon_phi.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.w_sum = 0.0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.c_xx = 0.0
+        self.c_xy = 0.0
+        self.c_yy = 0.0
+
+    def add(self, X, Y, sigma_Y):
+        X = np.atleast_1d(np.asarray(X, dtype=float))
+        Y = np.atleast_1d(np.asarray(Y, dtype=float))
+        w = 1.0 / (np.broadcast_to(np.asarray(sigma_Y, dtype=float), X.shape)**2 + 1e-12)
+        if X.size == 0:
+            return self
+
+        wb = w.sum()
+        mxb = np.dot(w, X) / wb
+        myb = np.dot(w, Y) / wb
+        dx = X - mxb
+        dy = Y - myb
+
+        w_tot = self.w_sum + wb
+        delta_x = mxb - self.mean_x
+        delta_y = myb - self.mean_y
+        f = self.w_sum * wb / w_tot
+        self.c_xx += np.dot(w, dx * dx) + delta_x * delta_x * f
+        self.c_xy += np.dot(w, dx * dy) + delta_x * delta_y * f
+        self.c_yy += np.dot(w, dy * dy) + delta_y * delta_y * f
+        self.mean_x += delta_x * wb / w_tot
+        self.mean_y += delta_y * wb / w_tot
+        self.w_sum = w_tot
+        self.n += X.size
+        return self
+
+    def result(self):
+        """
+        Same keys as calculate_slope_epsilon_phi (minus residuals).
+        """
+        if self.n < 3 or self.c_xx <= 0:
+            return None
+        slope = self.c_xy / self.c_xx
+        alpha = self.mean_y - slope * self.mean_x
+        dof = self.n - 2
+        chi2 = max(self.c_yy - slope * self.c_xy, 0.0)
+        stderr = np.sqrt(chi2 / dof / self.c_xx)
+
+        t_stat = slope / stderr if stderr > 0 else np.inf
+        pval = 2 * (1 - stats.t.cdf(abs(t_stat), dof))
+        t_crit = stats.t.ppf(0.975, dof)
+        return {
+            'slope': slope,
+            'stderr': stderr,
+            'pval': pval,
+            'ci_low': slope - t_crit * stderr,
+            'ci_high': slope + t_crit * stderr,
+            'model_summary': 'WLS_STREAMING',
+            'switch_reason': None,
+            'alpha': alpha,
+        }
+
 # (~ ~ ~ Φ(x) ~ ~ ~
 #  Benjamin Brécheteau | Chronon Field 2025
 #  ~ ~ ~ ~ ~)
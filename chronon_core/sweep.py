@@ -0,0 +1,183 @@
+import os
+import copy
+import json
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import yaml
+
+from chronon_core import cache
+from chronon_core.reproduce import (
+    sha256_file, sha256_string, forced_stages, stage_cache_for, upstream_config,
+    prepare_data, resolve_hash, analyze, write_results,
+)
+
+# Preprocessed frames shared with the worker processes, keyed by group.
+# Filled by the pool initializer: inherited copy-on-write under fork,
+# pickled once per worker under spawn.
+_FRAMES = {}
+
+
+def _parse_value(text):
+    text = text.strip()
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return yaml.safe_load(text)
+
+
+def parse_axis(spec):
+    """
+    Parses 'dotted.key=v1,v2,...' into (key, [values]).
+    """
+    if "=" not in spec:
+        raise ValueError(f"Invalid axis '{spec}'. Expected KEY=V1,V2,...")
+    key, values = spec.split("=", 1)
+    key = key.strip()
+    parsed = [_parse_value(v) for v in values.split(",") if v.strip()]
+    if not key or not parsed:
+        raise ValueError(f"Invalid axis '{spec}'. Expected KEY=V1,V2,...")
+    return key, parsed
+
+
+def set_path(cfg, dotted_key, value):
+    node = cfg
+    parts = dotted_key.split(".")
+    for part in parts[:-1]:
+        if not isinstance(node.get(part), dict):
+            node[part] = {}
+        node = node[part]
+    node[parts[-1]] = value
+
+
+def expand_grid(base_cfg, axes):
+    """
+    Cartesian product of the axes applied over the base config.
+    Returns a list of (overrides, cell_cfg).
+    """
+    keys = [k for k, _ in axes]
+    cells = []
+    for combo in itertools.product(*(vals for _, vals in axes)):
+        cell_cfg = copy.deepcopy(base_cfg)
+        overrides = dict(zip(keys, combo))
+        for k, v in overrides.items():
+            set_path(cell_cfg, k, v)
+        cells.append((overrides, cell_cfg))
+    return cells
+
+
+def _init_worker(frames):
+    _FRAMES.update(frames)
+
+
+def _flatten_metrics(metrics):
+    row = {}
+    for k, v in metrics.get("wls", {}).items():
+        row[f"wls_{k}"] = v.item() if hasattr(v, "item") else v
+    bs = metrics.get("bootstrap")
+    if bs:
+        row["boot_mean"] = float(bs["boot_mean"])
+        row["boot_std"] = float(bs["boot_std"])
+        row["boot_ci_low"] = float(bs["ci_95"][0])
+        row["boot_ci_high"] = float(bs["ci_95"][1])
+    return row
+
+
+def _run_cell(index, overrides, cell_cfg, group_key, pre_key, cell_dir, force):
+    df = _FRAMES[group_key]
+    hits = {}
+    metrics = analyze(df, cell_cfg, stage_cache_for(cell_cfg), pre_key, forced_stages(force), hits)
+    results = {
+        "status": "ok",
+        "seed": int(cell_cfg.get("seed", 0)),
+        "config": cell_cfg,
+        "metrics": metrics,
+    }
+    results_path = write_results(cell_dir, results)
+
+    row = {"cell": index}
+    row.update(overrides)
+    row.update(_flatten_metrics(metrics))
+    row["results_sha256"] = sha256_file(results_path)
+    row["cell_dir"] = os.path.basename(cell_dir)
+    return row
+
+
+def run_sweep(config_path, axes, out_dir=None, workers=None, force=False):
+    """
+    Runs the reproduce pipeline over the grid spanned by `axes`.
+
+    Cells that only differ in downstream parameters (window_seconds,
+    analysis.*) share one load + preprocess pass; windowing and fit run per
+    cell in a process pool. Writes per-cell results.json/checksums.sha256,
+    plus a consolidated sweep_results.csv.
+    """
+    print(f"Loading base config from {config_path}")
+    with open(config_path, "r", encoding="utf-8") as f:
+        config_content = f.read()
+    base_cfg = yaml.safe_load(config_content)
+
+    axes = [parse_axis(a) if isinstance(a, str) else a for a in axes]
+    cells = expand_grid(base_cfg, axes)
+
+    if out_dir is None:
+        out_dir = os.path.join(base_cfg.get("out_dir", "reports"), "sweep")
+    os.makedirs(out_dir, exist_ok=True)
+    print(f"Sweep: {len(cells)} cells over {[k for k, _ in axes]}")
+
+    # 1. Shared upstream stages, once per distinct (dataset, seed) group
+    frames, pre_keys, datasets = {}, {}, {}
+    cell_groups = []
+    for _, cell_cfg in cells:
+        group_key = cache.hash_config(upstream_config(cell_cfg))
+        cell_groups.append(group_key)
+        if group_key in frames:
+            continue
+        prep_cfg = copy.deepcopy(cell_cfg)
+        if prep_cfg.get("dataset", {}).get("kind", "toy") == "toy":
+            # One audit CSV per group instead of every cell racing on the same file
+            prep_cfg["dataset"]["output"] = os.path.join(out_dir, "datasets", f"toy_{group_key[:12]}.csv")
+        df, pre_key, dataset_info = prepare_data(prep_cfg, stage_cache_for(prep_cfg), forced_stages(force), {})
+        frames[group_key] = df
+        pre_keys[group_key] = pre_key
+        datasets[group_key] = dataset_info
+
+    # 2. Downstream stages, one task per cell
+    tasks = [
+        (i, overrides, cell_cfg, group_key, pre_keys[group_key], os.path.join(out_dir, f"cell_{i:04d}"), force)
+        for i, ((overrides, cell_cfg), group_key) in enumerate(zip(cells, cell_groups))
+    ]
+    if workers == 1 or len(tasks) == 1:
+        _init_worker(frames)
+        rows = [_run_cell(*t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(frames,)) as pool:
+            futures = [pool.submit(_run_cell, *t) for t in tasks]
+            rows = [fut.result() for fut in futures]
+
+    for row, group_key in zip(rows, cell_groups):
+        row["dataset_sha256"] = resolve_hash(datasets[group_key])
+
+    # 3. Consolidated outputs
+    table = pd.DataFrame(rows).sort_values("cell")
+    table_path = os.path.join(out_dir, "sweep_results.csv")
+    table.to_csv(table_path, index=False)
+
+    manifest = {
+        "base_config": config_path,
+        "base_config_sha256": sha256_string(config_content),
+        "axes": {k: v for k, v in axes},
+        "n_cells": len(cells),
+        "n_preprocessed_groups": len(frames),
+    }
+    with open(os.path.join(out_dir, "sweep_manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    with open(os.path.join(out_dir, "checksums.sha256"), "w", encoding="utf-8") as f:
+        f.write(f"{sha256_file(table_path)}  sweep_results.csv\n")
+
+    print(f"Sweep complete. {len(cells)} cells, {len(frames)} preprocessing passes. Results in {out_dir}")
+    return table
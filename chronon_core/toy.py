@@ -0,0 +1,103 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from chronon_core.io import REQUIRED_HEADERS, write_csv_hashed
+
+C_LIGHT = 299792458.0
+
+# Constant metadata columns that satisfy the raw schema
+_TOY_METADATA = {
+    'sagnac_value': 0.0,
+    'sagnac_applied': 1,
+    'pressure_load_corr': 0.0,
+    'sigma_dh_m': 0.01,
+    'allan_sy_per_h': 1e-16,
+    'site_id': "TOY_SITE",
+    'site_pair': "TOY_A-TOY_B",
+    'site_pair_label': "Laboratory Test",
+    'pair_orientation': "V",
+    'operator_id': "AUTO_BOT",
+    'run_id': "TOY_001",
+    'height_m': 500.0,
+    'allan_tau_s': 1.0,
+    'T2_s': 60.0,
+    'T1_s': 60.0,
+    'Tphi_s': 60.0,
+    'temp_C': 20.0,
+    'pressure_hPa': 1013.0,
+    'humidity_pct': 50.0,
+    'a_rms_ms2': 0.0,
+    'rf_intrusion_flag': 0,
+    'link_type': "FIBER",
+    'link_SNR_dB': 100.0,
+    'firmware_tag': "v1.0",
+    'geoid_model': "EGM2008",
+    'geoid_version': "1.0",
+    'tide_model': "NONE",
+    'duty_cycle': 1.0,
+    'software_env': "Python 3.11",
+}
+
+
+def generate_toy_frame(n_samples=500, eps_phi=0.0, seed=0):
+    """
+    Simulates a raw toy dataset (tidal height modulation + white frequency noise).
+    Returns a DataFrame with the raw schema of chronon_core.io, with the
+    timestamp and physics columns typed as io.load_raw_csv returns them.
+    """
+    rng = np.random.default_rng(seed)
+    n_samples = int(n_samples)
+
+    # 1. Physics Generation
+    t_s = np.arange(n_samples, dtype=float)
+    timestamps = pd.Timestamp("2024-01-01 12:00:00") + pd.to_timedelta(t_s, unit='s')
+
+    tidal_freq = 2 * np.pi / 43200.0
+    avg_h = 500.0
+    delta_h = avg_h + 0.5 * np.sin(tidal_freq * t_s)
+    g = 9.81
+    X_GR = g * delta_h / (C_LIGHT**2)
+
+    sigma_y = 1e-15
+    noise = rng.normal(0, sigma_y, n_samples)
+    y_meas = X_GR * (1.0 + eps_phi) + noise
+
+    # 2. DataFrame Construction (one allocation per column, in schema order)
+    columns = dict(_TOY_METADATA)
+    columns.update({
+        'timestamp_UTC': timestamps,
+        'Delta_h_m': delta_h,
+        'g_local_mps2': g,
+        'y_frac': y_meas,
+        'random_seed': seed,
+    })
+    df = pd.DataFrame({col: columns.get(col, 0) for col in REQUIRED_HEADERS}, index=pd.RangeIndex(n_samples))
+    return df
+
+
+def write_toy_csv(df, output):
+    """
+    Writes the raw columns of `df` to CSV and returns the SHA-256 of the file.
+    The bytes are hashed as they are written, so the file is never read back.
+    """
+    out_dir = os.path.dirname(output)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    with open(output, "wb") as f:
+        return write_csv_hashed(df[REQUIRED_HEADERS], f)
+
+
+def write_toy_csv_async(df, output):
+    """
+    Persists the toy dataset in a background thread.
+    Returns a Future resolving to the file SHA-256. The raw columns are
+    snapshotted before returning, so the caller may mutate `df` freely.
+    """
+    snapshot = df[REQUIRED_HEADERS].copy()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="toy-csv")
+    future = executor.submit(write_toy_csv, snapshot, output)
+    executor.shutdown(wait=False)
+    return future
@@ -0,0 +1,41 @@
+import numpy as np
+
+from app.experiment.analysis_cache import AnalysisCache
+from app.experiment.manager import ExperimentManager
+from app.gui.shared_analysis import results_frame, regression
+
+def _records(n):
+    rng = np.random.default_rng(0)
+    return [{"id": i + 1, "Delta_h_m": float(h), "phi": float(0.01 * h + rng.normal()), "sigma_Y": 1.0}
+            for i, h in enumerate(np.linspace(-50, 50, n))]
+
+def test_lru_eviction_and_hits():
+    cache = AnalysisCache(max_entries=2)
+    calls = []
+    compute = lambda k: (lambda: calls.append(k) or k)
+    cache.get_or_compute("a", compute("a"))
+    cache.get_or_compute("b", compute("b"))
+    cache.get_or_compute("a", compute("a"))
+    cache.get_or_compute("c", compute("c"))  # evicts b
+    cache.get_or_compute("b", compute("b"))
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.hits == 1 and len(cache) == 2
+
+def test_fit_shared_until_data_changes(tmp_path):
+    manager = ExperimentManager(history_dir=str(tmp_path / "hist"))
+    manager.data_log = _records(50)
+    data, fp = manager.snapshot()
+
+    fit = regression(manager, results_frame(manager, data, fp), fp)
+    again = regression(manager, results_frame(manager, *manager.snapshot()), manager.data_fingerprint())
+    assert again is fit
+
+    manager._append_record({"id": 51, "Delta_h_m": 50.0, "phi": 3.0, "sigma_Y": 1.0})
+    data, fp2 = manager.snapshot()
+    assert fp2 != fp and fp2[0] == 51
+    refit = regression(manager, results_frame(manager, data, fp2), fp2)
+    assert refit is not fit
+
+    # Replacing the log with the same records restores the same fingerprint
+    manager.data_log = _records(50)
+    assert manager.data_fingerprint() == fp
@@ -0,0 +1,52 @@
+import threading
+import numpy as np
+
+from app.experiment import batch_sim
+from app.experiment.manager import ExperimentManager
+
+def _settings(**params):
+    base = {"n_runs": 1000, "delta_h": 50.0, "scenario": "Standard", "alpha": 0.01, "beta": 0.5}
+    base.update(params)
+    return batch_sim.scenario_settings(base)
+
+def test_gamma_recursion_matches_loop_across_blocks():
+    settings = _settings(gamma=0.7)
+    settings["std"] = 0.0 # deterministic innovations: h * alpha + beta
+    rng = np.random.default_rng(1)
+    last = 0.3
+    parts = []
+    for start in range(0, 1000, 300):
+        cols, last = batch_sim.simulate_block(settings, start, min(300, 1000 - start), last, rng)
+        parts.append(cols)
+    phi = np.concatenate([c["phi"] for c in parts])
+    h = np.concatenate([c["Delta_h_m"] for c in parts])
+
+    # Per-point recursion of _calculate_physics_step
+    expected, prev = [], 0.3
+    for hi in h:
+        prev = 0.3 * (hi * 0.01 + 0.5) + 0.7 * prev
+        expected.append(prev)
+    np.testing.assert_allclose(phi, expected)
+    assert np.isclose(last, phi[-1])
+
+def test_sweep_and_scenarios():
+    cols, _ = batch_sim.simulate_block(_settings(scenario="S1"), 0, 1000, 0.0, np.random.default_rng(2))
+    assert cols["Delta_h_m"][0] == -50.0 and cols["Delta_h_m"][-1] == 50.0
+    assert np.all(cols["sigma_Y"] == 0.01)
+    assert cols["id"][0] == 1 and cols["id"][-1] == 1000
+
+    s3 = _settings(scenario="S3", alpha=0.0, beta=0.0)
+    cols, _ = batch_sim.simulate_block(s3, 0, 1000, 0.0, np.random.default_rng(3))
+    # 20% anomalies at mean 5
+    assert 0.8 < cols["phi"].mean() < 1.2
+
+def test_manager_batch_mode(tmp_path):
+    manager = ExperimentManager(history_dir=str(tmp_path / "hist"))
+    done = threading.Event()
+    manager.add_listener(lambda event, data: event == "complete" and done.set())
+    manager.start_experiment(200000, 50.0, 1.0, "fiber", batch_mode=True)
+    assert done.wait(30)
+    assert len(manager.get_results()) == 200000
+    data, fp = manager.snapshot()
+    assert fp[0] == len(data) == 200000
+    assert manager.history_store.list_runs()[-1]["n_points"] == 200000
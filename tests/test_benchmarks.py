@@ -0,0 +1,27 @@
+import tempfile
+
+from benchmarks.harness import compare, select_entries, time_benchmark
+from benchmarks.suite import BENCHMARKS
+
+def _entry(commit, results, machine="m1"):
+    return {"git_commit": commit, "label": None, "timestamp": commit,
+            "fingerprint": {"machine": machine},
+            "results": {k: {"min_s": v} for k, v in results.items()}}
+
+def test_compare_flags_regressions():
+    base = _entry("aaa", {"wls[100]": 1.0, "nw[100]": 1.0, "allan[100]": 1.0})
+    cur = _entry("bbb", {"wls[100]": 1.5, "nw[100]": 1.1, "allan[100]": 0.5})
+    status = {row[0]: row[4] for row in compare(base, cur, threshold=0.2)}
+    assert status == {"wls[100]": "REGRESSION", "nw[100]": "ok", "allan[100]": "IMPROVED"}
+
+def test_select_entries_same_machine():
+    history = [_entry("aaa", {}), _entry("bbb", {}, machine="m2"), _entry("ccc", {})]
+    baseline, current = select_entries(history)
+    assert (baseline["git_commit"], current["git_commit"]) == ("aaa", "ccc")
+
+def test_suite_smoke(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    for name, spec in BENCHMARKS.items():
+        assert time_benchmark(spec, 100, min_time=0.0, repeat=1)["min_s"] >= 0, name
+    # Scratch directories of file benchmarks are removed after timing
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,77 @@
+import os
+import json
+import stat
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chronon_core.blinding import BlindingManager
+
+def _frame(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "site_pair_label": pd.Categorical.from_codes(rng.integers(0, 5, n), [f"P{i}" for i in range(5)]),
+        "link_type": rng.choice(["fiber", "gps"], n), # object column
+        "phi": rng.normal(size=n),
+    })
+
+def test_blind_roundtrip_across_sessions(tmp_path):
+    df = _frame()
+    blinder = BlindingManager("salt", store_dir=str(tmp_path))
+    blinded, mapping_id = blinder.blind_labels(df)
+
+    assert np.shares_memory(blinded["phi"].values, df["phi"].values)
+    assert not set(blinded["site_pair_label"].cat.categories) & set(df["site_pair_label"].cat.categories)
+    assert blinded["link_type"].nunique() == 2
+    # Same salt, same label: the legacy short hash
+    assert blinded["link_type"].iloc[0] == blinder._hash_val(df["link_type"].iloc[0])[:8]
+
+    # New session: the mapping comes back from the store
+    restored = BlindingManager("salt", store_dir=str(tmp_path)).unblind_labels(blinded, mapping_id)
+    assert (restored["site_pair_label"] == df["site_pair_label"]).all()
+    assert (restored["link_type"].astype(str) == df["link_type"]).all()
+
+    with pytest.raises(ValueError):
+        BlindingManager("other", store_dir=str(tmp_path)).unblind_labels(blinded, mapping_id)
+    with pytest.raises(ValueError):
+        blinder.unblind_labels(blinded, "unknown")
+
+def test_reuse_mapping_extends_it(tmp_path):
+    blinder = BlindingManager("salt", store_dir=str(tmp_path))
+    first, mapping_id = blinder.blind_labels(_frame())
+
+    later = pd.DataFrame({"site_pair_label": ["P1", "P9", None], "link_type": ["gps", "gps", "radio"]})
+    blinded, same_id = BlindingManager("salt", store_dir=str(tmp_path)).blind_labels(later, mapping_id)
+    assert same_id == mapping_id
+    p1 = first["site_pair_label"][_frame()["site_pair_label"] == "P1"].iloc[0]
+    assert blinded["site_pair_label"].iloc[0] == p1
+    assert pd.isna(blinded["site_pair_label"].iloc[2])
+
+    restored = BlindingManager("salt", store_dir=str(tmp_path)).unblind_labels(blinded, mapping_id)
+    assert restored["site_pair_label"].tolist()[:2] == ["P1", "P9"]
+    assert restored["link_type"].tolist() == ["gps", "gps", "radio"]
+
+def test_unknown_blind_labels_become_missing():
+    blinder = BlindingManager("salt", store_dir=None)
+    blinded, mapping_id = blinder.blind_labels(pd.DataFrame({"link_type": ["a", "b"]}))
+    tampered = pd.DataFrame({"link_type": [blinded["link_type"].iloc[1], "zzzz", blinded["link_type"].iloc[0]]})
+    restored = blinder.unblind_labels(tampered, mapping_id)
+    assert restored["link_type"].tolist()[0] == "b"
+    assert pd.isna(restored["link_type"].iloc[1]) and restored["link_type"].iloc[2] == "a"
+
+def test_stored_mappings_are_private_and_signed(tmp_path):
+    store = tmp_path / "maps"
+    _, mapping_id = BlindingManager("salt").blind_labels(_frame(10))
+    assert not os.path.exists(".chronon_blinding")
+
+    blinded, mapping_id = BlindingManager("salt", store_dir=str(store)).blind_labels(_frame(10))
+    path = store / f"{mapping_id}.json"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(store).st_mode) == 0o700
+
+    record = json.loads(path.read_text())
+    record["columns"]["link_type"]["original"][0] = "forged"
+    path.write_text(json.dumps(record))
+    with pytest.raises(ValueError, match="integrity"):
+        BlindingManager("salt", store_dir=str(store)).unblind_labels(blinded, mapping_id)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from app.experiment import batch_sim
+from app.experiment.column_log import ColumnLog
+from app.experiment.history_store import HistoryStore, records_to_columns
+from app.experiment.manager import ExperimentManager
+
+def _block(start, count):
+    settings = batch_sim.scenario_settings({"n_runs": 10, "delta_h": 50.0})
+    cols, _ = batch_sim.simulate_block(settings, start, count, 0.0, np.random.default_rng(start))
+    return cols
+
+def test_blocks_grow_and_round_trip():
+    log = ColumnLog(capacity=4)
+    log.append_block(_block(0, 5))
+    log.append_block(_block(5, 5))
+    assert len(log) == 10
+    records = log.to_records(8)
+    assert [r["id"] for r in records] == [9, 10]
+    assert records[0]["status"] in ("valid", "invalid")
+    hist = log.history_columns()
+    assert hist["timestamp"][8] == records[0]["timestamp"]
+    assert list(hist["status"][8:]) == [r["status"] for r in records]
+
+def test_frame_is_a_view_and_survives_appends():
+    log = ColumnLog(capacity=4)
+    log.append_block(_block(0, 4))
+    df = log.frame()
+    assert np.shares_memory(df["phi"].to_numpy(), log.column("phi"))
+    assert isinstance(df["status"].dtype, pd.CategoricalDtype)
+    before = df["phi"].to_numpy().copy()
+    log.append_block(_block(4, 6)) # forces a reallocation
+    assert len(df) == 4 and np.array_equal(df["phi"].to_numpy(), before)
+    assert len(log.frame()) == 10
+
+def test_rows_with_mixed_fields():
+    log = ColumnLog()
+    log.append_row({"id": 1, "phi": 1.5, "status": "PASS", "note": "a"})
+    log.append_row({"id": 2, "phi": 2, "extra": 3.0})
+    log.append_row({"id": 3.5, "phi": None, "status": "FAIL"})
+    assert log.column("id").dtype == np.float64 # widened from int
+    assert np.isnan(log.column("phi")[2]) and np.isnan(log.column("extra")[0])
+    records = log.to_records()
+    assert [r["status"] for r in records] == ["PASS", None, "FAIL"]
+    assert records[0]["note"] == "a" and records[1]["note"] is None
+
+def test_history_store_round_trip(tmp_path):
+    store = HistoryStore(str(tmp_path / "hist"))
+    records = [{"id": i, "timestamp": "2026-01-01T00:00:0%d.250000" % i, "phi": i * 0.5, "status": "valid"}
+               for i in range(5)]
+    log = ColumnLog.from_columns(records_to_columns(records))
+    store.append_run("R1", "2026-01-01", {}, log.history_columns())
+    assert store.load_records("R1") == records
+
+def test_manager_snapshot_and_restore(tmp_path):
+    manager = ExperimentManager(history_dir=str(tmp_path / "hist"))
+    manager._append_record({"id": 1, "Delta_h_m": -1.0, "phi": 0.1, "status": "valid"})
+    manager._append_block(_block(1, 9))
+    df, fp = manager.snapshot()
+    assert fp[0] == len(df) == 10
+    assert list(df["id"]) == list(range(1, 11))
+
+    manager.history_store.append_run("R1", "2026-01-01", {}, manager.column_log.history_columns())
+    manager.data_log = []
+    assert manager.restore_history_run("R1") == 10
+    assert manager.get_results()["phi"].tolist() == df["phi"].tolist()
@@ -0,0 +1,44 @@
+from app.experiment.event_bus import EventBus
+
+class FakeTk:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, fn):
+        self.scheduled.append((ms, fn))
+
+def test_synchronous_until_attached():
+    bus = EventBus()
+    seen = []
+    bus.subscribe(lambda e, d: seen.append((e, d)))
+    bus.publish("progress", 1)
+    assert seen == [("progress", 1)]
+
+def test_progress_coalesced_and_order_kept():
+    tk = FakeTk()
+    bus = EventBus()
+    seen = []
+    bus.subscribe(lambda e, d: seen.append((e, d)))
+    bus.attach(tk, max_hz=30)
+    assert tk.scheduled[0][0] == 33
+
+    bus.publish("start", "p")
+    for i in range(1000):
+        bus.publish("progress", i)
+    bus.publish("complete", "done")
+    assert seen == []
+
+    tk.scheduled.pop(0)[1]()  # one Tk tick
+    assert seen == [("start", "p"), ("progress", 999), ("complete", "done")]
+    assert len(tk.scheduled) == 1  # pump re-armed
+
+def test_log_backlog_is_bounded():
+    bus = EventBus()
+    bus.attach(FakeTk())
+    seen = []
+    bus.subscribe(lambda e, d: seen.append(d))
+    for i in range(EventBus.LOG_BACKLOG + 50):
+        bus.publish("log", i)
+    bus.flush()
+    assert len(seen) == EventBus.LOG_BACKLOG + 1
+    assert "50" in seen[0] and seen[-1] == EventBus.LOG_BACKLOG + 49
@@ -0,0 +1,63 @@
+import time
+import threading
+
+from app.gui.executor import ComputeExecutor
+
+class FakeTk:
+    """Stands in for a Tk widget: after() callbacks run when pump() is called."""
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, fn):
+        self.pending.append(fn)
+
+    def pump(self, timeout=5.0):
+        deadline = time.time() + timeout
+        while self.pending and time.time() < deadline:
+            fn = self.pending.pop(0)
+            fn()
+            time.sleep(0.005)
+
+def test_results_progress_and_dedup_on_tk_thread():
+    tk = FakeTk()
+    ex = ComputeExecutor(tk)
+    gate = threading.Event()
+    calls, results, progress = [], [], []
+
+    def work(task, x):
+        calls.append(x)
+        task.report(0.5, "half")
+        gate.wait(2)
+        return x * 2
+
+    ex.submit("k", work, 21, on_done=results.append, on_progress=lambda f, m: progress.append((f, m)))
+    ex.submit("k", work, 21, on_done=results.append)
+    time.sleep(0.05)
+    gate.set()
+    tk.pump()
+
+    assert calls == [21]
+    assert results == [42, 42]
+    assert (0.5, "half") in progress
+    assert not ex.busy()
+    ex.shutdown()
+
+def test_cancel_and_errors():
+    tk = FakeTk()
+    ex = ComputeExecutor(tk)
+    results, errors = [], []
+
+    def slow(task):
+        for _ in range(200):
+            task.check_cancelled()
+            time.sleep(0.005)
+        return "finished"
+
+    task = ex.submit("slow", slow, on_done=results.append)
+    ex.submit("boom", lambda task: 1 / 0, on_error=errors.append)
+    task.cancel()
+    tk.pump()
+
+    assert results == []
+    assert len(errors) == 1 and isinstance(errors[0], ZeroDivisionError)
+    ex.shutdown()
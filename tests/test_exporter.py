@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import zipfile
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from app.backend import exporter
+from app.backend.exporter import ReproducibleExporter
+
+def _frame(n=5000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"Delta_h_m": rng.normal(size=n), "phi": rng.normal(size=n), "status": "valid"})
+
+def _ledger(tmp_path):
+    path = tmp_path / "ledger.csv"
+    path.write_text("timestamp,run_id\n2025-01-01,R1\n")
+    return str(path)
+
+def _no_pip(monkeypatch):
+    calls = []
+    class Done:
+        stdout = "numpy==1.0\n"
+    def fake_run(*args, **kwargs):
+        calls.append(args)
+        return Done()
+    monkeypatch.setattr(exporter.subprocess, "run", fake_run)
+    monkeypatch.setattr(exporter, "_ENV_SNAPSHOTS", {})
+    return calls
+
+def test_export_run_hashes_while_writing(tmp_path, monkeypatch):
+    calls = _no_pip(monkeypatch)
+    exp = ReproducibleExporter(str(tmp_path / "exports"))
+    ledger = _ledger(tmp_path)
+    meta = {"run_id": "R1", "regression": {"slope": 2e-5, "stderr": 1e-6, "pval": 1e-4}}
+    out = exp.export_run(_frame(), meta, ledger)
+
+    with open(os.path.join(out, "data_processed.csv"), "rb") as f:
+        assert meta["export_data_hash"] == hashlib.sha256(f.read()).hexdigest()
+    assert not os.path.exists(os.path.join(out, "ledger_snapshot.csv"))
+    assert meta["ledger_snapshot"]["mode"] == "reference"
+    assert meta["ledger_snapshot"]["size"] == os.path.getsize(ledger)
+    assert os.path.exists(os.path.join(out, "result_snippet.tex"))
+    assert open(os.path.join(out, "requirements.txt")).read() == "numpy==1.0\n"
+
+    # Second export (and a new exporter on the same folder) reuse the snapshot
+    exp.export_run(_frame(10), {"run_id": "R2"}, ledger)
+    monkeypatch.setattr(exporter, "_ENV_SNAPSHOTS", {})
+    ReproducibleExporter(str(tmp_path / "exports")).environment_snapshot()
+    assert len(calls) == 1
+
+def test_export_archive_streams_into_zip(tmp_path, monkeypatch):
+    _no_pip(monkeypatch)
+    exp = ReproducibleExporter(str(tmp_path / "exports"))
+    ledger = _ledger(tmp_path)
+    fig = Figure()
+    fig.add_subplot(111).plot([0, 1], [1, 0])
+    df = _frame()
+
+    path = exp.export_archive(df, {"run_id": "R1"}, ledger, figures=[fig])
+    with zipfile.ZipFile(path) as zf:
+        names = set(zf.namelist())
+        data = zf.read("data_processed.csv")
+        meta = json.loads(zf.read("metadata.json"))
+    assert names == {"data_processed.csv", "requirements.txt", "metadata.json", "figures/figure_0.png"}
+    assert data == df.to_csv(index=False).encode("utf-8")
+    assert meta["export_data_hash"] == hashlib.sha256(data).hexdigest()
+    assert meta["ledger_snapshot"]["mode"] == "reference"
+    assert meta["ledger_snapshot"]["sha256"] == hashlib.sha256(open(ledger, "rb").read()).hexdigest()
+
+    embedded = exp.export_archive(df.head(3), {"run_id": "R2"}, ledger, embed_ledger=True, parallel=False)
+    with zipfile.ZipFile(embedded) as zf:
+        assert zf.read("ledger_snapshot.csv") == open(ledger, "rb").read()
+
+def test_embedded_ledger_is_a_copy_of_the_hashed_bytes(tmp_path, monkeypatch):
+    _no_pip(monkeypatch)
+    exp = ReproducibleExporter(str(tmp_path / "exports"))
+    ledger = _ledger(tmp_path)
+    before = open(ledger, "rb").read()
+    meta = {"run_id": "R1"}
+    out = exp.export_run(_frame(), meta, ledger, embed_ledger=True)
+
+    snapshot = os.path.join(out, "ledger_snapshot.csv")
+    assert not os.path.samefile(snapshot, ledger)
+    with open(ledger, "a") as f:
+        f.write("later,row\n")
+    assert open(snapshot, "rb").read() == before
+    assert meta["ledger_snapshot"]["mode"] == "embedded"
+    assert meta["ledger_snapshot"]["size"] == len(before)
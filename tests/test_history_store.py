@@ -0,0 +1,102 @@
+import os
+import json
+import threading
+import pytest
+import numpy as np
+from app.experiment import history_store
+from app.experiment.history_store import HistoryStore, RunCatalog, records_to_columns
+
+def _records(n):
+    return [{"id": i + 1, "phi": 0.5 * i, "status": "valid" if i % 2 else "invalid"} for i in range(n)]
+
+def test_append_and_lazy_load(tmp_path):
+    store = HistoryStore(str(tmp_path / "hist"))
+    store.append_run("RUN-1", "2025-01-01T00:00:00", {"delta_h": 50.0}, records_to_columns(_records(10)))
+
+    reopened = HistoryStore(str(tmp_path / "hist"))
+    entry = reopened.list_runs()[0]
+    assert entry["n_points"] == 10
+    assert "data" not in entry
+    assert reopened.load_records("RUN-1") == _records(10)
+    assert reopened.load_columns("RUN-1")["phi"].dtype == np.float64
+
+def test_delete_tombstones_and_compaction(tmp_path):
+    store = HistoryStore(str(tmp_path / "hist"))
+    for i in range(3):
+        store.append_run(f"RUN-{i}", "", {}, records_to_columns(_records(3)))
+
+    run_file = tmp_path / "hist" / "runs" / store.get_entry("RUN-0")["file"]
+    assert store.delete_runs(["RUN-0", "RUN-missing"]) == 1
+    assert [e["id"] for e in HistoryStore(str(tmp_path / "hist")).list_runs()] == ["RUN-1", "RUN-2"]
+    assert run_file.exists()
+
+    store.compact()
+    assert not run_file.exists()
+    with open(store.index_path) as f:
+        assert len(f.readlines()) == 2
+    assert store.load_records("RUN-2") == _records(3)
+
+def test_run_catalog_sort_filter_and_pages(tmp_path):
+    store = HistoryStore(str(tmp_path / "hist"))
+    for i, (dh, scen) in enumerate([(50.0, "A"), (10.0, "B"), (30.0, "A")]):
+        store.append_run(f"RUN-{i}", f"2025-01-0{i + 1}T00:00:00", {"delta_h": dh, "scenario": scen},
+                         records_to_columns(_records(i + 1)))
+    catalog = RunCatalog(store)
+
+    assert catalog.query() == ["RUN-2", "RUN-1", "RUN-0"]
+    assert catalog.query("delta_h", descending=False) == ["RUN-1", "RUN-2", "RUN-0"]
+    assert catalog.query("n_points", text="a") == ["RUN-2", "RUN-0"]
+    assert catalog.get("RUN-1")["n_points"] == 2
+
+    store.delete_runs(["RUN-1"])
+    assert catalog.rows(["RUN-0", "RUN-1"]) == [("2025-01-01 00:00:00", "RUN-0", 50.0, 1, "A")]
+
+def test_run_ids_never_overwrite(tmp_path):
+    store = HistoryStore(str(tmp_path / "hist"))
+    ids = {store.new_run_id() for _ in range(100)}
+    assert len(ids) == 100
+
+    store.append_run("RUN-1", "", {}, records_to_columns(_records(3)))
+    with pytest.raises(ValueError):
+        store.append_run("RUN-1", "", {}, records_to_columns(_records(5)))
+    assert store.get_entry("RUN-1")["n_points"] == 3
+    assert len(store.load_records("RUN-1")) == 3
+
+def test_legacy_import_keeps_duplicate_ids(tmp_path):
+    legacy = tmp_path / "history.json"
+    legacy.write_text(json.dumps([{"id": "RUN-7", "data": _records(2)}, {"id": "RUN-7", "data": _records(4)}]))
+    store = HistoryStore(str(tmp_path / "hist"))
+    assert store.import_legacy_json(str(legacy)) == 2
+    assert store.get_entry("RUN-7")["n_points"] == 2
+    assert store.get_entry("RUN-7-2")["n_points"] == 4
+
+def test_sanitized_ids_keep_distinct_files(tmp_path):
+    legacy = tmp_path / "history.json"
+    legacy.write_text(json.dumps([{"id": "a/b", "data": _records(2)}, {"id": "a_b", "data": _records(4)}]))
+    store = HistoryStore(str(tmp_path / "hist"))
+    assert store.import_legacy_json(str(legacy)) == 2
+    assert store.get_entry("a/b")["file"] != store.get_entry("a_b")["file"]
+    assert len(store.load_records("a/b")) == 2
+    assert len(store.load_records("a_b")) == 4
+
+def test_compaction_keeps_a_run_readded_meanwhile(tmp_path, monkeypatch):
+    store = HistoryStore(str(tmp_path / "hist"))
+    store.append_run("RUN-1", "", {}, records_to_columns(_records(3)))
+    store.delete_runs(["RUN-1"])
+
+    # Another thread re-adds RUN-1 while compaction deletes the old file
+    real_remove = os.remove
+    def remove_racing(path):
+        t = threading.Thread(target=store.append_run, args=("RUN-1", "", {}, records_to_columns(_records(5))))
+        t.start()
+        t.join(0.2) # blocks on the store lock unless removal runs outside it
+        real_remove(path)
+        removers.append(t)
+    removers = []
+    monkeypatch.setattr(history_store.os, "remove", remove_racing)
+    store.compact()
+    monkeypatch.undo()
+    for t in removers:
+        t.join()
+
+    assert len(store.load_records("RUN-1")) == 5
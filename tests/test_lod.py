@@ -0,0 +1,43 @@
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from app.gui.lod import m4_indices, lttb_indices, pixel_grid_indices, LODController
+
+def _walk(n):
+    rng = np.random.default_rng(0)
+    return np.arange(n, dtype=float), np.cumsum(rng.normal(size=n))
+
+def test_m4_keeps_extremes_per_column():
+    x, y = _walk(100_000)
+    idx = m4_indices(x, y, 0, len(x), 500)
+    assert len(idx) <= 4 * 500 + 2
+    assert np.all(np.diff(idx) > 0)
+    assert y[idx].min() == y.min() and y[idx].max() == y.max()
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+
+def test_lttb_and_pixel_grid_sizes():
+    x, y = _walk(10_000)
+    idx = lttb_indices(x, y, 300)
+    assert len(idx) == 300 and idx[0] == 0 and idx[-1] == len(x) - 1
+
+    rng = np.random.default_rng(1)
+    px, py = rng.normal(size=200_000), rng.normal(size=200_000)
+    grid = pixel_grid_indices(px, py, (-1, 1), (-1, 1), 50, 40)
+    assert len(grid) <= 50 * 40
+    assert np.all(np.abs(px[grid]) <= 1) and np.all(np.abs(py[grid]) <= 1)
+
+def test_controller_recomputes_on_zoom():
+    x, y = _walk(50_000)
+    fig, ax = plt.subplots()
+    line, = ax.plot([], [])
+    lod = LODController(ax, line, x, y)
+    full = len(lod.visible)
+    assert full < len(x)
+    assert ax.get_xlim()[0] <= 0 and ax.get_xlim()[1] >= len(x) - 1
+
+    ax.set_xlim(1000, 1100)
+    assert np.array_equal(line.get_xdata(), x[999:1102])
+    lod.disconnect()
+    plt.close(fig)
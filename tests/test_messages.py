@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+import pytest
+
+from chronon_core.messages import catalog, messages
+
+def test_core_does_not_import_gui():
+    code = ("import sys\n"
+            "from chronon_core.interpretation import ScientificInterpreter\n"
+            "from chronon_core.reporting import ReportGenerator\n"
+            "ScientificInterpreter().interpret({'slope': 1.0, 'pval': 0.5}, 'PASS', lang='en')\n"
+            "assert not [m for m in sys.modules if m.startswith('app')]\n"
+            "assert 'chronon_core.messages.fr' not in sys.modules\n")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+def test_gui_translations_use_the_catalog():
+    from app.gui.translations import TRANSLATIONS
+    for lang in ("fr", "en"):
+        assert TRANSLATIONS[lang]["REPORT"] is messages(lang, "REPORT")
+        assert set(catalog(lang)["INTERPRETATION"]) == set(catalog("fr")["INTERPRETATION"])
+    with pytest.raises(KeyError):
+        catalog("de")
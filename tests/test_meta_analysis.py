@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from chronon_core.comparison import RunComparator
+from chronon_core.ledger import Ledger
+from chronon_core.meta_analysis import MetaAnalyzer, load_ledger_runs
+
+def _runs(k=12, seed=0):
+    rng = np.random.default_rng(seed)
+    se = rng.uniform(0.5, 2.0, k)
+    slopes = 1.0 + rng.normal(0, 1.0, k) + rng.normal(0, se)
+    return slopes, se
+
+def _dl(b, se):
+    # Reference: textbook DerSimonian-Laird, one loop
+    w = [1 / s ** 2 for s in se]
+    fe = sum(wi * bi for wi, bi in zip(w, b)) / sum(w)
+    q = sum(wi * (bi - fe) ** 2 for wi, bi in zip(w, b))
+    c = sum(w) - sum(wi ** 2 for wi in w) / sum(w)
+    tau2 = max(0.0, (q - (len(b) - 1)) / c)
+    w_re = [1 / (s ** 2 + tau2) for s in se]
+    return fe, q, tau2, sum(wi * bi for wi, bi in zip(w_re, b)) / sum(w_re)
+
+def test_pool_and_leave_one_out_match_reference():
+    b, se = _runs()
+    meta = MetaAnalyzer()
+    res = meta.pool(np.append(b, np.nan), np.append(se, 1.0))
+    fe, q, tau2, re = _dl(b, se)
+    assert res["k"] == 12 and res["n_excluded"] == 1
+    assert res["fixed"]["estimate"] == pytest.approx(fe)
+    assert res["Q"] == pytest.approx(q)
+    assert res["tau2"] == pytest.approx(tau2) and tau2 > 0
+    assert res["random"]["estimate"] == pytest.approx(re)
+    assert res["I2"] == pytest.approx((q - 11) / q)
+
+    loo = meta.leave_one_out(b, se)
+    for i in (0, 5, 11):
+        fe_i, _, tau2_i, re_i = _dl(np.delete(b, i), np.delete(se, i))
+        assert loo["fixed"][i] == pytest.approx(fe_i)
+        assert loo["tau2"][i] == pytest.approx(tau2_i)
+        assert loo["random"][i] == pytest.approx(re_i)
+
+def test_pairwise_matches_compare_runs():
+    b, se = _runs(6)
+    lo, hi = b - 2 * se, b + 2 * se
+    pairs = MetaAnalyzer().pairwise(b, se, lo, hi)
+    comparator = RunComparator()
+    for i, j in [(0, 1), (3, 2), (5, 0)]:
+        ref = comparator.compare_runs({"slope": b[i], "stderr": se[i], "ci_low": lo[i], "ci_high": hi[i]},
+                                      {"slope": b[j], "stderr": se[j], "ci_low": lo[j], "ci_high": hi[j]})
+        for key, value in ref.items():
+            assert pairs[key][i, j] == pytest.approx(value)
+
+def test_load_ledger_runs(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.csv"))
+    ledger.append_run("R1", "DETECTED", "c", "k", {"regression": {"slope": 1.5, "stderr": 0.5}})
+    ledger.append_run("R2", "NULL", "c", "k", {"slope": 0.2, "stderr": 0.4, "ci_low": -0.6, "ci_high": 1.0})
+    ledger.append_run("R3", "NULL", "c", "k", {"flags": []})
+
+    runs = load_ledger_runs(ledger.path)
+    assert runs["run_id"].tolist() == ["R1", "R2", "R3"]
+    np.testing.assert_allclose(runs["slope"][:2], [1.5, 0.2])
+    assert np.isnan(runs["stderr"][2]) and runs["ci_high"][0] == np.inf
+
+    res = MetaAnalyzer().analyze(runs)
+    assert res["k"] == 2 and res["pairwise"]["delta_slope"].shape == (3, 3)
+    assert load_ledger_runs(ledger.path, verdicts={"NULL"})["run_id"].tolist() == ["R2", "R3"]
@@ -0,0 +1,71 @@
+from fractions import Fraction
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from chronon_core import preprocess
+from chronon_core.preprocess import C_LIGHT, compute_variables, gr_kernel
+
+def _raw(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    g = 9.80665 + rng.normal(0, 1e-3, n)
+    dh = rng.uniform(-500, 500, n)
+    load = rng.normal(0, 1e-3, n)
+    x = g * (dh + load) / C_LIGHT**2
+    return pd.DataFrame({
+        "Delta_h_m": dh, "pressure_load_corr": load, "g_local_mps2": g,
+        # y and X_GR agree to ~1e-16 relative: Y_res is a near-total cancellation
+        "y_frac": x * (1 + rng.normal(0, 1e-16, n)) + rng.normal(0, 1e-19, n),
+        "sigma_dh_m": 0.01, "sagnac_value": rng.normal(0, 1e-19, n),
+        "sagnac_applied": (np.arange(n) % 3 != 0).astype(int),
+    })
+
+def test_compute_variables_matches_columnwise_formula(monkeypatch):
+    monkeypatch.setattr(preprocess, "KERNEL_BLOCK", 256) # several blocks
+    df = _raw()
+    before = df.copy()
+    out = compute_variables(df)
+
+    pd.testing.assert_frame_equal(df, before) # caller's frame untouched
+    assert not np.shares_memory(out["y_frac"].to_numpy(), df["y_frac"].to_numpy())
+
+    h = df["Delta_h_m"] + df["pressure_load_corr"]
+    x = (df["g_local_mps2"] * h) / (C_LIGHT**2)
+    y = df["y_frac"].where(df["sagnac_applied"] == 1, df["y_frac"] - df["sagnac_value"])
+    np.testing.assert_array_equal(out["X_GR"], x)
+    np.testing.assert_array_equal(out["Delta_lnPhi"], x)
+    np.testing.assert_array_equal(out["Y_res"], y - x)
+    np.testing.assert_array_equal(out["sigma_X"], (df["g_local_mps2"] / C_LIGHT**2) * 0.01)
+    assert (out["sigma_Y"] == 1e-18).all() and (out["band_id"] == 0).all()
+
+def test_editing_result_leaves_input_alone():
+    df = _raw(10)
+    before = df.copy()
+    out = compute_variables(df)
+    out.loc[0, "y_frac"] = 9.0
+    out["Delta_h_m"] *= 2
+    out.loc[0, "X_GR"] = 5.0
+
+    pd.testing.assert_frame_equal(df, before)
+    assert out.loc[0, "Delta_lnPhi"] != 5.0
+
+def test_compensated_y_res_is_correctly_rounded():
+    df = _raw(300, seed=1)
+    c2 = Fraction(int(C_LIGHT)) ** 2
+    exact = np.array([
+        float(Fraction(r.y_frac) - (Fraction(r.sagnac_value) if not r.sagnac_applied else 0)
+              - Fraction(r.g_local_mps2) * (Fraction(r.Delta_h_m) + Fraction(r.pressure_load_corr)) / c2)
+        for r in df.itertuples()])
+
+    out = {"Y_res": np.empty(len(df))}
+    res = compute_variables(df, precision="compensated", out=out)
+    assert np.shares_memory(res["Y_res"].to_numpy(), out["Y_res"])
+    np.testing.assert_array_equal(res["Y_res"], exact)
+
+    plain = compute_variables(df)["Y_res"].to_numpy()
+    assert np.max(np.abs(plain - exact) / np.abs(exact)) > 1e-8
+
+def test_kernel_rejects_unknown_precision():
+    with pytest.raises(ValueError):
+        gr_kernel(np.zeros(3), np.zeros(3), np.zeros(3), np.zeros(3), precision="quad")
@@ -0,0 +1,42 @@
+import json
+import os
+from chronon_core.profiling import StageTimer
+from chronon_core.reproduce import run_reproduce
+
+def test_stage_timer_nesting():
+    timer = StageTimer()
+    with timer.stage("fit"):
+        with timer.stage("wls"):
+            sum(range(1000))
+    names = [r["name"] for r in timer.records]
+    assert names == ["fit", "fit.wls"]
+    assert all(r["wall_s"] >= 0 and r["cpu_s"] >= 0 for r in timer.records)
+    assert timer.records[0]["wall_s"] >= timer.records[1]["wall_s"]
+
+def test_reproduce_writes_timings(tmp_path):
+    cfg_path = tmp_path / "cfg.yml"
+    out_dir = tmp_path / "reports"
+    with open(cfg_path, "w") as f:
+        f.write(f"""
+seed: 1
+out_dir: {str(out_dir).replace(os.sep, '/')}
+cache: false
+dataset:
+  kind: toy
+  n: 300
+  persist_csv: false
+analysis:
+  bootstrap: true
+  n_boot: 10
+        """)
+
+    run_reproduce(str(cfg_path), profile=True)
+
+    timings = json.loads((out_dir / "timings.json").read_text())
+    names = [s["name"] for s in timings["stages"]]
+    for stage in ["load", "preprocess", "windowing", "fit", "fit.wls", "fit.bootstrap", "output"]:
+        assert stage in names
+    assert timings["profiled"] is True
+    assert "tracemalloc_peak_mb" in timings["stages"][0]
+    assert "## Performance" in (out_dir / "RUN_REPORT.md").read_text()
+    assert (out_dir / "profile.pstats").exists()
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from scipy.optimize import curve_fit
+
+from chronon_core import qubits
+from chronon_core.qubits import QubitAnalysis, fit_linear_batch, fit_exponential_batch
+
+def _data(seed=0, n=40):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-5, 5, n)
+    err = rng.uniform(1, 3, n)
+    y = 100 * np.exp(-0.05 * x) + rng.normal(0, err)
+    return x, y, err
+
+def test_fits_match_curve_fit():
+    x, y, err = _data()
+    qa = QubitAnalysis()
+    models = {"linear": lambda x, a, b: a + b * x, "exponential": lambda x, a, b: a * np.exp(b * x)}
+    for name, f in models.items():
+        res = qa.analyze_t2_vs_phi(x, y, err, model_type=name, n_boot=200, seed=1)
+        popt, pcov = curve_fit(f, x, y, sigma=err, p0=[100.0, 0.0])
+        assert np.isclose(res['beta'], popt[1], rtol=1e-7)
+        assert np.isclose(res['intercept'], popt[0], rtol=1e-7)
+        assert np.isclose(res['std_error'], np.sqrt(pcov[1, 1]), rtol=1e-6)
+        low, high = res['ci_beta_95']
+        assert low < res['beta'] < high
+
+def test_batched_resamples_are_weighted_fits():
+    x, y, err = _data(1)
+    w = 1 / err**2
+    idx = np.random.default_rng(2).integers(0, len(x), (5, len(x)))
+    _, lin, _, _ = fit_linear_batch(x[idx], y[idx], w[idx])
+    t0, exp_b, _, _, ok = fit_exponential_batch(x[idx], y[idx], w[idx], np.full(5, 100.0), np.zeros(5))
+    assert ok.all()
+    for k in range(5):
+        i = idx[k]
+        p_lin, _ = curve_fit(lambda x, a, b: a + b * x, x[i], y[i], sigma=err[i])
+        p_exp, _ = curve_fit(lambda x, a, b: a * np.exp(b * x), x[i], y[i], sigma=err[i], p0=[100.0, 0.0])
+        assert np.isclose(lin[k], p_lin[1], rtol=1e-7)
+        assert np.isclose(exp_b[k], p_exp[1], rtol=1e-6)
+
+def test_degenerate_resamples_are_counted():
+    x = np.array([0.0, 0.0, 0.0, 1.0])
+    res = QubitAnalysis().analyze_t2_vs_phi(x, [1.0, 1.1, 0.9, 2.0], n_boot=500, seed=3)
+    assert res['valid'] and res['n_boot'] == 500
+    # Resamples drawing only x == 0 cannot fit a slope
+    assert 0 < res['n_boot_failed'] < 500
+    assert not QubitAnalysis().analyze_t2_vs_phi([1, 2], [1, 2])['valid']
+
+def _campaign(seed=0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for site in ("A", "B"):
+        for qubit in range(3):
+            n = 30
+            x = rng.uniform(-5, 5, n)
+            frames.append(pd.DataFrame({
+                "site_id": site, "qubit": qubit, "Delta_lnPhi": x,
+                "T2_s": 100 * np.exp(-0.05 * x) + rng.normal(0, 2, n),
+                "T2_s_err": np.full(n, 2.0),
+                "T1_s": 200 - 3 * x + rng.normal(0, 5, n),
+            }))
+    # A group too small to fit
+    frames.append(pd.DataFrame({"site_id": "C", "qubit": 0, "Delta_lnPhi": [0.0, 1.0],
+                                "T2_s": [1.0, 2.0], "T2_s_err": 1.0, "T1_s": [1.0, 2.0]}))
+    return pd.concat(frames, ignore_index=True)
+
+def test_analyze_groups_matches_single_series(monkeypatch):
+    df = _campaign()
+    qa = QubitAnalysis()
+    table = qa.analyze_groups(df, model_type="exponential", n_boot=300, seed=4, n_jobs=1)
+    assert list(table.columns[:5]) == ["site_id", "qubit", "metric", "model", "n"]
+    assert len(table) == 2 * 7 # T2_s, T1_s (no Tphi_s column) x 7 groups
+
+    row = table[(table.site_id == "B") & (table.qubit == 1) & (table.metric == "T2_s")].iloc[0]
+    g = df[(df.site_id == "B") & (df.qubit == 1)]
+    single = qa.analyze_t2_vs_phi(g.Delta_lnPhi, g.T2_s, g.T2_s_err, model_type="exponential")
+    assert np.isclose(row.beta, single['beta'], rtol=1e-7)
+    assert np.isclose(row.std_error, single['std_error'], rtol=1e-6)
+    assert row.ci_low < row.beta < row.ci_high and row.n == 30
+
+    small = table[table.site_id == "C"]
+    assert not small.valid.any() and small.beta.isna().all()
+
+    # Several chunks through the process pool: same numbers as one chunk per metric
+    monkeypatch.setattr(qubits, "_CHUNK_ELEMENTS", 300 * 30 * 2)
+    pooled = qa.analyze_groups(df, model_type="exponential", n_boot=300, seed=4, n_jobs=2)
+    np.testing.assert_allclose(pooled.beta, table.beta, rtol=1e-9)
+    assert pooled.valid.equals(table.valid)
@@ -0,0 +1,45 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from chronon_core import reporting
+from chronon_core.reporting import ReportGenerator, ReportTemplate, report_strings
+
+def _stats(i, rng):
+    return {"slope": 1e-3 * i, "stderr": 1e-4, "pval": 0.2 * i, "intercept": 0.0, "model_summary": "WLS",
+            "residuals": rng.normal(size=50),
+            "diagnostics": {"LB": {"stat": 1.0, "pval": 0.5, "verdict": "OK"}} if i % 2 else {}}
+
+def test_template_refills_per_run(tmp_path):
+    rng = np.random.default_rng(0)
+    template = ReportTemplate(report_strings("en"))
+    try:
+        template.render(str(tmp_path / "a.pdf"), _stats(1, rng), description_text="first")
+        template.render(str(tmp_path / "b.pdf"), _stats(2, rng), plot={"x": np.arange(5), "y": np.arange(5)})
+        assert template.txt_epsilon.get_text() == f"{2e-3:.4e}"
+        assert template.txt_status.get_text() == "NON SIG"
+        assert not template.txt_desc_title.get_visible()
+        assert not any(t.get_visible() for t in template.diag_tables.values())
+    finally:
+        template.close()
+    assert (tmp_path / "b.pdf").stat().st_size > 0
+
+def test_generate_batch_and_single(tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "BATCH_CHUNK", 2) # 3 chunks: the process pool path
+    rng = np.random.default_rng(1)
+    jobs = [{"filename": str(tmp_path / f"run_{i}.pdf"), "stats_results": _stats(i, rng),
+             "metadata": {"run": i}, "plot": {"x": rng.normal(size=30), "y": rng.normal(size=30)}}
+            for i in range(5)]
+    jobs.append({"filename": str(tmp_path / "missing_dir" / "bad.pdf"), "stats_results": _stats(0, rng)})
+
+    results = ReportGenerator.generate_batch(jobs, lang="en", n_jobs=2)
+    assert [results[j["filename"]] is None for j in jobs] == [True] * 5 + [False]
+    assert all((tmp_path / f"run_{i}.pdf").exists() for i in range(5))
+
+    # In-process batch: the page templates are closed once it is done
+    results = ReportGenerator.generate_batch(jobs[:2], lang="en", n_jobs=1)
+    assert list(results.values()) == [None, None]
+    assert reporting._WORKER_TEMPLATE == [None, None]
+
+    fig = Figure()
+    fig.add_subplot(111).plot([0, 1], [0, 1])
+    assert ReportGenerator.generate_pdf_report(str(tmp_path / "single.pdf"), fig, _stats(1, rng), lang="en")
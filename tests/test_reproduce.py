@@ -1,5 +1,8 @@
 import os
-from chronon_core.reproduce import run_reproduce
+import tracemalloc
+
+import pytest
+from chronon_core.reproduce import run_reproduce, sha256_file
 
 def test_reproduce_creates_reports(tmp_path):
     # Create a dummy config in tmp_path
@@ -25,3 +28,51 @@ analysis:
     assert (out_dir / "results.json").exists()
     assert (out_dir / "checksums.sha256").exists()
     assert (out_dir / "RUN_REPORT.md").exists()
+
+def test_reproduce_stage_cache(tmp_path):
+    cfg_path = tmp_path / "test_config.yml"
+    out_dir = tmp_path / "reports"
+    cache_dir = tmp_path / "cache"
+
+    with open(cfg_path, "w") as f:
+        f.write(f"""
+seed: 7
+out_dir: {str(out_dir).replace(os.sep, '/')}
+cache_dir: {str(cache_dir).replace(os.sep, '/')}
+dataset:
+  kind: toy
+  n: 50
+  eps: 0.0
+        """)
+
+    run_reproduce(str(cfg_path))
+    first = (out_dir / "results.json").read_text()
+    assert "stage_cache: load=miss" in (out_dir / "RUN_REPORT.md").read_text()
+
+    run_reproduce(str(cfg_path))
+    assert (out_dir / "results.json").read_text() == first
+    assert "fit=hit" in (out_dir / "RUN_REPORT.md").read_text()
+
+    run_reproduce(str(cfg_path), from_stage="windowing")
+    report = (out_dir / "RUN_REPORT.md").read_text()
+    assert "preprocess=hit, windowing=forced, fit=forced" in report
+    assert (out_dir / "results.json").read_text() == first
+
+def test_toy_frame_matches_persisted_csv(tmp_path):
+    from chronon_core import io, toy
+
+    df = toy.generate_toy_frame(n_samples=100, eps_phi=0.01, seed=5)
+    assert list(df.columns) == io.REQUIRED_HEADERS
+    assert toy.generate_toy_frame(n_samples=100, eps_phi=0.01, seed=5).equals(df)
+
+    out = tmp_path / "toy.csv"
+    digest = toy.write_toy_csv_async(df, str(out)).result()
+    reloaded = io.load_raw_csv(str(out))
+    assert digest == sha256_file(str(out))
+    assert (reloaded['timestamp_UTC'] == df['timestamp_UTC']).all()
+    assert abs(reloaded['y_frac'] - df['y_frac']).max() < 1e-25
+
+def test_profiled_run_stops_profiling_on_failure(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        run_reproduce(str(tmp_path / "missing.yaml"), profile=True)
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from app.gui.selection import PointIndex
+
+def test_rectangle_query_matches_brute_force():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=20_000), rng.normal(size=20_000)
+    x[5] = np.nan
+    index = PointIndex(x, y)
+
+    hits = index.query(-0.5, 0.2, 0.1, 1.5)
+    expected = np.flatnonzero((x >= -0.5) & (x <= 0.2) & (y >= 0.1) & (y <= 1.5))
+    assert np.array_equal(hits, expected)
+    assert len(index) == 19_999
+    assert len(index.query(10, 11, 0, 1)) == 0
+
+def test_indices_slice_the_frame_positionally():
+    df = pd.DataFrame({"x": [3.0, 1.0, 2.0], "y": [0.0, 0.0, 5.0]}, index=[10, 20, 30])
+    hits = PointIndex(df["x"].values, df["y"].values).query(0, 3, -1, 1)
+    assert df.take(hits).index.tolist() == [10, 20]
@@ -0,0 +1,44 @@
+import numpy as np
+from scipy import stats
+
+from chronon_core.sensitivity import SensitivityAnalyzer
+
+def _scalar_power(slope, sigma_y, n, x_spread, alpha=0.05):
+    # Reference: the original per-slope formula
+    df = n - 2
+    delta = abs(slope) / (sigma_y / np.sqrt((n - 1) * x_spread ** 2))
+    t_crit = stats.t.ppf(1 - alpha/2, df)
+    return 1 - stats.nct.cdf(t_crit, df, nc=delta) + stats.nct.cdf(-t_crit, df, nc=delta)
+
+def test_power_grid_matches_scalar_formula():
+    sa = SensitivityAnalyzer()
+    slopes = np.array([0.0, 1e-4, 3e-4, -2e-4])
+    ns = np.array([3, 20, 150, 1000])
+    grid = sa.power_grid(slopes[None, :], 0.1, ns[:, None], 100.0)
+    expected = [[_scalar_power(s, 0.1, n, 100.0) for s in slopes] for n in ns]
+    expected = np.array(expected)
+    finite = np.isfinite(expected) # the scalar formula loses precision near power 1
+    np.testing.assert_allclose(grid[finite], expected[finite], rtol=1e-9, atol=1e-12)
+    assert np.all(np.isfinite(grid)) and np.allclose(grid[~finite], 1.0)
+    assert np.isclose(grid[0, 0], 0.05)
+    assert sa.power_grid(1e-4, 0.1, 2, 100.0) == 0.0
+    assert sa.get_power_for_slope(1e-4, 0.1, 150, 100.0) == grid[2, 1]
+
+def test_mdp_grid_and_iso_power():
+    sa = SensitivityAnalyzer()
+    ns = np.linspace(10, 1000, 200)
+    slopes = np.linspace(0, 5e-4, 200)
+    surface = sa.power_surface(slopes, ns, 0.1, 100.0)
+    assert surface.shape == (200, 200)
+
+    contour = sa.iso_power(slopes, surface, levels=(0.8,))[0.8]
+    mdp = sa.mdp_grid(0.1, ns, 100.0)
+    assert np.isclose(sa.calculate_mdp(0.1, ns[50], 100.0), mdp[50])
+    reached = ~np.isnan(contour)
+    assert reached.sum() > 100
+    # Power at the interpolated contour is the requested level
+    p = sa.power_grid(contour[reached], 0.1, ns[reached], 100.0)
+    np.testing.assert_allclose(p, 0.8, atol=0.01)
+    # The analytic MDP approximates the same contour
+    np.testing.assert_allclose(contour[reached], mdp[reached], rtol=0.05)
+    assert np.isinf(sa.calculate_mdp(0.1, 2, 100.0))
@@ -0,0 +1,49 @@
+import numpy as np
+
+from chronon_core.simulator import PowerSimulator, fit_batch, simulate_data, DEFAULT_SCENARIO
+from chronon_core.stats import analyze_with_fallback
+
+def test_fit_batch_matches_production_estimator():
+    rng = np.random.default_rng(0)
+    sc = dict(DEFAULT_SCENARIO, n_points=80, gamma=0.6)
+    X, Y = simulate_data(sc, 40, rng)
+    batch = fit_batch(X, Y, sc["sigma_y"], rng, n_boot=200)
+    sigma = np.full(len(X), sc["sigma_y"])
+    compared = 0
+    for r in range(len(Y)):
+        ref = analyze_with_fallback(X, Y[r], sigma)
+        assert batch["fallback"][r] == ref["fallback_triggered"]
+        if not ref["fallback_triggered"]:
+            for key in ("slope", "stderr", "pval", "ci_low", "ci_high"):
+                assert np.isclose(batch[key][r], ref[key], rtol=1e-8, atol=1e-12), key
+            compared += 1
+    # AR(1) noise: both paths are exercised
+    assert 0 < compared < len(Y)
+
+def test_power_size_and_detection():
+    sim = PowerSimulator(n_jobs=1)
+    null = sim.run_simulation(n_sims=2000, true_slope=0.0, sigma_y=1.0)
+    assert null["power"] < 0.1 and abs(null["bias"]) < 1e-3
+    strong = sim.run_simulation(n_sims=500, true_slope=0.01, sigma_y=0.2)
+    assert strong["power"] > 0.99
+    assert 0.9 < strong["coverage"] <= 1.0
+    assert abs(strong["power"] - strong["analytic_power"]) < 0.05
+
+def test_cache_progress_and_parallel_determinism(tmp_path):
+    calls = []
+    serial = PowerSimulator(n_jobs=1, cache_dir=str(tmp_path))
+    res = serial.run_simulation(n_sims=1200, true_slope=0.005, progress=lambda f, m=None: calls.append(f))
+    assert calls[-1] == 1.0 and len(calls) == 3
+    assert serial.run_simulation(n_sims=1200, true_slope=0.005) is res
+
+    # Fresh instance: served from the disk cache
+    again = PowerSimulator(n_jobs=1, cache_dir=str(tmp_path)).run_simulation(n_sims=1200, true_slope=0.005)
+    assert again["power"] == res["power"]
+
+    parallel = PowerSimulator(n_jobs=2, parallel_threshold=0).run_simulation(n_sims=1200, true_slope=0.005)
+    assert parallel["power"] == res["power"] and parallel["mean_slope"] == res["mean_slope"]
+
+def test_scan_scenarios():
+    report = PowerSimulator(n_jobs=1).scan_scenarios(n_sims=200)
+    assert set(report) == {"S1 (Bruit faible)", "S2 (Décalage)", "S3 (Anomalies)"}
+    assert all({"power", "bias"} <= set(r) for r in report.values())
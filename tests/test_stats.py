@@ -1,7 +1,7 @@
 
 import unittest
 import numpy as np
-from chronon_core.stats import calculate_slope_epsilon_phi
+from chronon_core.stats import calculate_slope_epsilon_phi, fit_free_intercept_wls, WLSAccumulator
 
 class TestStats(unittest.TestCase):
     def setUp(self):
@@ -43,5 +43,23 @@ class TestStats(unittest.TestCase):
         # Let's just ensure it doesn't crash and returns valid dict structure
         self.assertIn('slope', res)
 
+    def test_wls_accumulator_matches_batch_fit(self):
+        """Streaming accumulator fed in chunks gives the batch WLS estimate."""
+        X = np.linspace(-50, 50, 500)
+        sigma_Y = np.random.uniform(0.5, 2.0, 500)
+        Y = 0.03 * X + 1.0 + np.random.normal(0, 1.0, 500)
+
+        acc = WLSAccumulator()
+        for start in range(0, 500, 37):
+            acc.add(X[start:start + 37], Y[start:start + 37], sigma_Y[start:start + 37])
+        res = acc.result()
+        ref = fit_free_intercept_wls(X, Y, sigma_Y)
+
+        self.assertEqual(acc.n, 500)
+        self.assertAlmostEqual(res['slope'], ref['eps_phi'], places=10)
+        self.assertAlmostEqual(res['alpha'], ref['alpha'], places=10)
+        self.assertTrue(res['ci_low'] < res['slope'] < res['ci_high'])
+        self.assertIsNone(WLSAccumulator().add([1.0], [1.0], 1.0).result())
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,56 @@
+import json
+import os
+
+import pandas as pd
+
+from chronon_core.sweep import parse_axis, run_sweep
+
+def test_parse_axis():
+    assert parse_axis("analysis.n_boot=500,1000") == ("analysis.n_boot", [500, 1000])
+    assert parse_axis("dataset.eps=0,1e-3") == ("dataset.eps", [0, 0.001])
+
+def _base_config(tmp_path):
+    cfg_path = tmp_path / "base.yml"
+    with open(cfg_path, "w") as f:
+        f.write(f"""
+seed: 3
+cache_dir: {str(tmp_path / 'cache').replace(os.sep, '/')}
+dataset:
+  kind: toy
+  n: 300
+analysis:
+  bootstrap: true
+  n_boot: 20
+        """)
+    return cfg_path
+
+def test_sweep_shares_preprocessing(tmp_path):
+    cfg_path = _base_config(tmp_path)
+    out_dir = tmp_path / "sweep"
+    table = run_sweep(str(cfg_path), ["seed=3,4", "window_seconds=30,60", "analysis.n_boot=10,20"],
+                      out_dir=str(out_dir), workers=1)
+
+    assert len(table) == 8
+    assert list(table["cell"]) == list(range(8))
+    assert table["wls_eps_phi"].notna().all()
+    assert (out_dir / "sweep_results.csv").exists()
+    assert (out_dir / "cell_0007" / "results.json").exists()
+    assert (out_dir / "cell_0007" / "checksums.sha256").exists()
+
+    manifest = json.loads((out_dir / "sweep_manifest.json").read_text())
+    assert manifest["n_cells"] == 8
+    # Only the seed changes the toy data
+    assert manifest["n_preprocessed_groups"] == 2
+    # Cells in the same group with the same window share the WLS fit
+    assert table.loc[0, "wls_eps_phi"] == table.loc[1, "wls_eps_phi"]
+
+def test_sweep_process_pool_matches_serial(tmp_path):
+    cfg_path = _base_config(tmp_path)
+    axes = ["seed=3,4", "window_seconds=30,60"]
+    serial = run_sweep(str(cfg_path), axes, out_dir=str(tmp_path / "serial"), workers=1)
+    # force: the workers recompute from the frames shared by the initializer
+    pooled = run_sweep(str(cfg_path), axes, out_dir=str(tmp_path / "pooled"), workers=2, force=True)
+
+    assert list(pooled["cell"]) == list(serial["cell"])
+    metrics = [c for c in serial.columns if c.startswith(("wls_", "boot_"))] + ["results_sha256"]
+    pd.testing.assert_frame_equal(pooled[metrics], serial[metrics])